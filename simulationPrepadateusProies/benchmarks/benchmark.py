@@ -0,0 +1,180 @@
+"""
+Benchmarks du moteur de simulation (sans interface graphique).
+
+Micro-benchmarks : Coordonnee.case_voisine, Population.selectId / addAnimal, GameRules.bouge
+pour chaque espèce, Grille.case_Vide et GameRules.checkInvariant.
+Macro-benchmarks : GameRules.generation() pour plusieurs tailles de grille et densités de population.
+
+Utilisation, depuis la racine du projet :
+
+    python3 benchmarks/benchmark.py --sortie benchmarks/resultats.json
+    python3 benchmarks/benchmark.py --tailles 50 100 200 500 1000 2000 --densites 0.05 0.2
+    python3 benchmarks/benchmark.py --reference benchmarks/reference.json --tolerance 0.2
+
+Avec --reference, chaque débit est comparé à celui du fichier de référence ; le script
+se termine avec le code 1 si l'un d'eux a baissé de plus de la tolérance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from source.animal import Animal
+from source.coordonnee import Coordonnee
+from source.gameRules import GameRules
+from source.population import Population
+from source.simulationBatch import PARAMETRES_ANIMAUX_DEFAUT
+
+GRAINE = 12345
+
+
+def chronometrer(fonction, repetitions=3):
+    """Retourne la meilleure durée (en secondes) de [repetitions] appels à [fonction]."""
+    meilleure = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        meilleure = min(meilleure, time.perf_counter() - debut)
+    return meilleure
+
+
+def creerJeu(taille, densite, graine=GRAINE):
+    """Crée un GameRules de côté [taille] dont une fraction [densite] des cases est occupée
+    (un quart de renards, trois quarts de lapins) et 10 % des cases portent de l'herbe."""
+    nbAnimaux = int(densite * taille * taille)
+    GameRules.PARAMETERS = {"Renards": nbAnimaux // 4, "Lapins": nbAnimaux - nbAnimaux // 4,
+                            "Ours": max(1, nbAnimaux // 100), "Taille": taille, "Apparition herbe (%)": 10}
+    Animal.PARAMETERS = dict(PARAMETRES_ANIMAUX_DEFAUT)
+    return GameRules(graine)
+
+
+def micro(taille=100, densite=0.2):
+    """Retourne {nom: {"secondes", "operations", "operations/s"}} pour chaque micro-benchmark."""
+    resultats = {}
+
+    def noter(nom, secondes, operations):
+        resultats[nom] = {"secondes": secondes, "operations": operations,
+                          "operations/s": operations / secondes if secondes > 0 else float("inf")}
+
+    # Coordonnee.case_voisine
+    coordonnees = [Coordonnee(x, y) for x in range(taille) for y in range(taille)]
+    noter("Coordonnee.case_voisine",
+          chronometrer(lambda: [c.case_voisine(taille) for c in coordonnees]), len(coordonnees))
+
+    # Population.selectId et Population.addAnimal
+    noter("Population.selectId",
+          chronometrer(lambda: [p.selectId() for p in [Population(taille)] for _ in range(taille * taille)]),
+          taille * taille)
+    noter("Population.addAnimal",
+          chronometrer(lambda: [p.addAnimal(i % 2, c) for p in [Population(taille)] for i, c in enumerate(coordonnees)]),
+          taille * taille)
+
+    # GameRules.bouge : un passage sur tous les animaux d'une espèce (sans vieillissement groupé)
+    for nom, listeIds in (("renards", "renard_ids"), ("lapins", "lapin_ids"), ("ours", "ours_ids")):
+        secondes, operations = float("inf"), 0
+        for _ in range(3):
+            jeu = creerJeu(taille, densite)
+            jeu.addOursAleatoire()
+            ids = getattr(jeu.get_population(), listeIds)()
+            debut = time.perf_counter()
+            for iden in ids:
+                jeu.bouge(iden)
+            secondes = min(secondes, time.perf_counter() - debut)
+            operations = len(ids)
+        noter(f"GameRules.bouge ({nom})", secondes, operations)
+
+    # Grille.case_Vide et GameRules.checkInvariant
+    jeu = creerJeu(taille, densite)
+    noter("Grille.case_Vide", chronometrer(jeu.get_grille().case_Vide), taille * taille)
+    noter("GameRules.checkInvariant", chronometrer(jeu.checkInvariant, repetitions=1), taille * taille)
+    return resultats
+
+
+def macro(tailles, densites, nbGenerations):
+    """Retourne une liste de mesures de GameRules.generation() par (taille, densité)."""
+    resultats = []
+    for taille in tailles:
+        for densite in densites:
+            jeu = creerJeu(taille, densite)
+            animauxGenerations = 0
+            generations = 0
+            debut = time.perf_counter()
+            for _ in range(nbGenerations):
+                if jeu.estFiniJeu():
+                    break
+                animauxGenerations += jeu.get_population().nbAnimaux()
+                jeu.generation()
+                generations += 1
+            secondes = time.perf_counter() - debut
+            resultats.append({
+                "taille": taille, "densite": densite, "generations": generations, "secondes": secondes,
+                "generations/s": generations / secondes if secondes > 0 else float("inf"),
+                "animaux.generations/s": animauxGenerations / secondes if secondes > 0 else float("inf"),
+            })
+            print(f"taille {taille:5d}  densité {densite:.2f} : {resultats[-1]['generations/s']:8.2f} générations/s, "
+                  f"{resultats[-1]['animaux.generations/s']:12.0f} animaux.générations/s")
+    return resultats
+
+
+def comparer(resultats, reference, tolerance):
+    """Retourne la liste des régressions (textes) de [resultats] par rapport à [reference]."""
+    regressions = []
+    for nom, mesure in resultats["micro"].items():
+        if nom in reference.get("micro", {}):
+            avant = reference["micro"][nom]["operations/s"]
+            if mesure["operations/s"] < avant * (1 - tolerance):
+                regressions.append(f"{nom} : {mesure['operations/s']:.0f} op/s (référence {avant:.0f})")
+    mesuresReference = {(m["taille"], m["densite"]): m for m in reference.get("macro", [])}
+    for mesure in resultats["macro"]:
+        avant = mesuresReference.get((mesure["taille"], mesure["densite"]))
+        if avant is not None and mesure["generations/s"] < avant["generations/s"] * (1 - tolerance):
+            regressions.append(f"generation() taille {mesure['taille']} densité {mesure['densite']} : "
+                               f"{mesure['generations/s']:.2f} générations/s (référence {avant['generations/s']:.2f})")
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks du moteur de simulation.")
+    parser.add_argument("--tailles", type=int, nargs="+", default=[50, 100, 200, 500])
+    parser.add_argument("--densites", type=float, nargs="+", default=[0.05, 0.2])
+    parser.add_argument("--generations", type=int, default=10,
+                        help="nombre de générations par mesure macro")
+    parser.add_argument("--sans-micro", action="store_true", help="ne lancer que les macro-benchmarks")
+    parser.add_argument("--sortie", default=None, help="fichier JSON des résultats")
+    parser.add_argument("--reference", default=None, help="fichier JSON de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="baisse de débit tolérée par rapport à la référence (0.2 = 20 %%)")
+    args = parser.parse_args(arguments)
+
+    resultats = {
+        "meta": {"date": time.strftime("%Y-%m-%d %H:%M:%S"), "python": platform.python_version(),
+                 "numpy": np.__version__, "machine": platform.machine(), "generations": args.generations},
+        "micro": {} if args.sans_micro else micro(),
+    }
+    for nom, mesure in resultats["micro"].items():
+        print(f"{nom:35s} {mesure['operations/s']:14.0f} op/s")
+    resultats["macro"] = macro(args.tailles, args.densites, args.generations)
+
+    if args.sortie:
+        with open(args.sortie, "w") as fichier:
+            json.dump(resultats, fichier, indent=2)
+
+    if args.reference:
+        with open(args.reference) as fichier:
+            regressions = comparer(resultats, json.load(fichier), args.tolerance)
+        for regression in regressions:
+            print("RÉGRESSION", regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
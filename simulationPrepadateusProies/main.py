@@ -1,8 +1,15 @@
 from source.interfaceGraphique import *
+import sys
 
 def __main__():
-    IG = InterfaceGraphique(1200,800)
+    # python3 main.py [sauvegarde.npz] : reprend la simulation sauvegardée
+    # python3 main.py [trajectoire.traj] : rejoue la trajectoire enregistrée
+    fichier = sys.argv[1] if len(sys.argv) > 1 else None
+    if fichier is not None and fichier.endswith(".traj"):
+        IG = InterfaceGraphique(1200,800, trajectoire=fichier)
+    else:
+        IG = InterfaceGraphique(1200,800, reprise=fichier)
     IG.run()
 
 if __name__ == "__main__":
-    __main__()
\ No newline at end of file
+    __main__()
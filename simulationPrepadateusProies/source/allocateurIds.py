@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class AllocateurIds():
+
+    """
+    Classe AllocateurIds
+
+    Distribue les identifiants d'animaux compris entre 0 et `capacite - 1`.
+    L'allocation, la libération et le test d'appartenance se font en O(1).
+
+    Politique de recyclage (déterministe) :
+        - un identifiant libéré est réutilisé en priorité, le dernier libéré en premier (pile) ;
+        - un identifiant jamais utilisé n'est distribué que lorsque la pile est vide, dans l'ordre croissant.
+    Les identifiants en service restent ainsi regroupés dans l'intervalle [0, `get_prochainId()`[,
+    ce qui garde les colonnes de `Population` denses.
+
+    Le masque des identifiants libres peut ne couvrir que les premiers identifiants ([capaciteInitiale]) : il
+    est agrandi (doublé) quand un identifiant neuf le dépasse, sans jamais dépasser [capacite]. Les identifiants
+    au-delà du masque sont libres.
+
+    Attributs :
+        - __capacite (int) : Nombre total d'identifiants.
+        - __prochainId (int) : Plus petit identifiant jamais distribué.
+        - __recycles (list) : Pile des identifiants libérés.
+        - __libre (np.ndarray bool) : Indique pour chaque identifiant couvert par le masque s'il est disponible.
+
+    Méthodes :
+        - allouer() -> int : Retourne un identifiant libre. Lève une ValueError s'il n'y en a plus.
+        - liberer(id_) : Rend un identifiant. Lève une ValueError s'il était déjà libre.
+        - estLibre(id_) -> bool : Indique si un identifiant est disponible.
+        - nbLibres() -> int : Nombre d'identifiants disponibles.
+        - idsLibres() -> list : Liste des identifiants disponibles, dans l'ordre où ils seront distribués.
+        - masqueLibres() -> np.ndarray : Masque booléen (en lecture seule) des identifiants disponibles, de
+          longueur `get_capaciteAllouee()`.
+        - agrandir(taille) : Étend le masque à au moins [taille] identifiants (au plus la capacité).
+        - exporterEtat() -> dict : Copie de l'état (pile des identifiants libérés, prochain identifiant).
+        - restaurerEtat(etat) : Reprend un état produit par `exporterEtat`.
+    """
+
+    def __init__(self, capacite, capaciteInitiale=None):
+        self.__capacite = capacite
+        self.__prochainId = 0
+        self.__recycles = []
+        self.__libre = np.ones(capacite if capaciteInitiale is None else min(capaciteInitiale, capacite), dtype=bool)
+
+    # Getters
+
+    def get_capacite(self):
+        return self.__capacite
+
+    def get_prochainId(self):
+        return self.__prochainId
+
+    def get_capaciteAllouee(self):
+        return len(self.__libre)
+
+    # Méthodes de classe
+
+    def allouer(self):
+        if self.__recycles:
+            id_ = self.__recycles.pop()
+        elif self.__prochainId < self.__capacite:
+            id_ = self.__prochainId
+            self.__prochainId += 1
+            if id_ >= len(self.__libre):
+                self.agrandir(max(2 * len(self.__libre), id_ + 1))
+        else:
+            raise ValueError("Plus de place")
+        self.__libre[id_] = False
+        return id_
+
+    def liberer(self, id_):
+        if self.__libre[id_]:
+            raise ValueError("Identifiant déjà libre")
+        self.__libre[id_] = True
+        self.__recycles.append(id_)
+
+    def estLibre(self, id_):
+        return id_ >= len(self.__libre) or bool(self.__libre[id_])
+
+    def agrandir(self, taille):
+        taille = min(taille, self.__capacite)
+        if taille > len(self.__libre):
+            self.__libre = np.concatenate((self.__libre, np.ones(taille - len(self.__libre), dtype=bool)))
+
+    def nbLibres(self):
+        return len(self.__recycles) + self.__capacite - self.__prochainId
+
+    def idsLibres(self):
+        return self.__recycles[::-1] + list(range(self.__prochainId, self.__capacite))
+
+    def masqueLibres(self):
+        masque = self.__libre.view()
+        masque.flags.writeable = False
+        return masque
+
+    def exporterEtat(self):
+        return {"recycles": np.array(self.__recycles, dtype=np.int64), "prochainId": self.__prochainId}
+
+    def restaurerEtat(self, etat):
+        recycles = [int(id_) for id_ in etat["recycles"]]
+        prochainId = int(etat["prochainId"])
+        if not 0 <= prochainId <= self.__capacite or any(not 0 <= id_ < prochainId for id_ in recycles):
+            raise ValueError("État incompatible avec la capacité de l'allocateur")
+        self.__recycles = recycles
+        self.__prochainId = prochainId
+        self.agrandir(prochainId)
+        self.__libre[:] = True
+        self.__libre[:prochainId] = False
+        self.__libre[recycles] = True
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 import numpy as np
-from random import randint
 from source.genes import *
 
 
@@ -25,6 +24,8 @@ class Animal(ABC):
     1. **Animal (classe abstraite)** :
     - Constructeur :
         - Initialise les coordonnées, l'identifiant, l'âge, le sexe, et les gènes (aléatoires ou fournis).
+        - Tous les tirages de l'animal passent par le générateur `_rng` (`numpy.random.Generator`) donné
+          à la construction, celui de la simulation ; à défaut, `genes.GENERATEUR_DEFAUT`.
     - Méthodes abstraites : 
         - `vaMourir` : Détermine si l'animal doit mourir.
         - `reduireVie` : Réduit les ressources nécessaires pour la survie.
@@ -91,15 +92,16 @@ class Animal(ABC):
         'CoeffGeneM' :5
     }
 
-    def __init__(self, Coord, id, genes=None):
+    def __init__(self, Coord, id, genes=None, rng=None):
+        self._rng = generateur(rng)
         if (genes is None):
-            self._genes = create_random()
+            self._genes = create_random(self._rng)
         else:
             self._genes = genes
         self.__coord = Coord
         self.__id = id
         self.__age = 0
-        self.__sexe = randint(0, 1)
+        self.__sexe = int(self._rng.integers(0, 2))
 
     def set_coord(self, coord):
         self.__coord = coord
@@ -148,8 +150,8 @@ class Animal(ABC):
 
 class Renard(Animal):
 
-    def __init__(self, Coord, id, genes=None):
-        super().__init__(Coord, id, genes)
+    def __init__(self, Coord, id, genes=None, rng=None):
+        super().__init__(Coord, id, genes, rng)
         self.__food = self.PARAMETERS["foodInitRenard"]
 
     def get_food(self):
@@ -164,7 +166,7 @@ class Renard(Animal):
             self.__food+self.PARAMETERS["foodLapin"]+ajoute, self.PARAMETERS["maxFoodRenard"]+2 * ajoute)
 
     def peutSeReproduire(self):
-        return self.__food >= self.PARAMETERS["foodReprodRenard"] and np.random.binomial(1, self.PARAMETERS['ProbaBirthR'])
+        return self.__food >= self.PARAMETERS["foodReprodRenard"] and self._rng.binomial(1, self.PARAMETERS['ProbaBirthR'])
 
     def vaMourir(self):
         
@@ -179,8 +181,8 @@ class Renard(Animal):
 
 class Lapin(Animal):
 
-    def __init__(self, Coord, id, genes=None):
-        super().__init__(Coord, id, genes)
+    def __init__(self, Coord, id, genes=None, rng=None):
+        super().__init__(Coord, id, genes, rng)
         self.__food = self.PARAMETERS["foodInitLapin"]
 
     def get_food(self):
@@ -209,8 +211,8 @@ class Lapin(Animal):
 
 class Ours(Animal):
 
-    def __init__(self, Coord, id):
-        super().__init__(Coord, id)
+    def __init__(self, Coord, id, rng=None):
+        super().__init__(Coord, id, rng=rng)
         self.__food = self.PARAMETERS["foodInitOurs"]
 
     def get_food(self):
@@ -234,7 +236,7 @@ class Ours(Animal):
 
     def peutSeReproduire(self):
         """L'ours peut se reproduire s'il a suffisamment de nourriture et selon une probabilité."""
-        return self.__food >= self.PARAMETERS["foodReprodOurs"] and np.random.binomial(1, self.PARAMETERS["ProbaBirthOurs"])
+        return self.__food >= self.PARAMETERS["foodReprodOurs"] and self._rng.binomial(1, self.PARAMETERS["ProbaBirthOurs"])
 
     def vaMourir(self):
         """Un ours meurt soit par vieillesse, soit par famine."""
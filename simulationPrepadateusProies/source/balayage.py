@@ -0,0 +1,177 @@
+"""
+Balayage de paramètres : simulation de nombreuses combinaisons de valeurs de `GameRules.PARAMETERS` et
+`Animal.PARAMETERS`, en parallèle, avec un tableau de résultats (une ligne par simulation).
+
+Deux façons de décrire les valeurs à essayer :
+    - en grille : {cle: [valeur, ...]}, toutes les combinaisons sont simulées ;
+    - au hasard : {cle: (minimum, maximum)}, [nbPoints] tirages uniformes (entiers si les deux bornes le sont).
+
+Utilisation en Python :
+
+    points = pointsGrille({"ProbaBirthR": [0.1, 0.2, 0.3], "foodReprodLapin": [2, 4]})
+    points = pointsAleatoires({"CoeffGeneE": (1, 10), "ProbaBirthOurs": (0.1, 0.5)}, nbPoints=50, graine=1)
+    lignes = balayer(points, parametresFixes={"Taille": 60}, nbGenerations=300, graine=1)
+    ecrireTableau(lignes, "balayage.csv")
+
+En ligne de commande, depuis la racine du projet :
+
+    python3 -m source.balayage --grille ProbaBirthR=0.1,0.2,0.3 --grille foodReprodLapin=2,4 --sortie balayage.csv
+    python3 -m source.balayage --aleatoire CoeffGeneE=1:10 --points 50 --param Taille=60 --sortie balayage.csv
+
+Mesures de chaque simulation :
+    - duree_coexistence : nombre de générations pendant lesquelles renards et lapins coexistent ;
+    - moyenne_<espece> : effectif moyen de l'espèce sur la simulation ;
+    - amplitude_<espece> : demi-écart entre les quantiles 5 % et 95 % de l'effectif, après la première
+      moitié de la simulation (amplitude des oscillations, une fois le régime transitoire passé).
+"""
+
+import argparse
+import csv
+import itertools
+import numpy as np
+from source.simulationBatch import simuler, separerParametres, lireNombre, lireParametres
+from source.ensemble import ESPECES, executer, grainesRepliques
+
+
+def pointsGrille(valeurs):
+    """Retourne la liste des combinaisons {cle: valeur} du produit cartésien de [valeurs] ({cle: [valeur, ...]})."""
+    cles = list(valeurs)
+    return [dict(zip(cles, combinaison)) for combinaison in itertools.product(*(valeurs[cle] for cle in cles))]
+
+
+def pointsAleatoires(intervalles, nbPoints, graine=None):
+    """Retourne [nbPoints] combinaisons tirées uniformément dans [intervalles] ({cle: (minimum, maximum)}).
+
+    Une valeur est entière (bornes comprises) si les deux bornes sont des entiers, flottante sinon.
+    """
+    rng = np.random.default_rng(graine)
+    colonnes = {}
+    for cle, (minimum, maximum) in intervalles.items():
+        if minimum > maximum:
+            raise ValueError(f"Intervalle vide pour {cle} : {minimum} > {maximum}")
+        if isinstance(minimum, int) and isinstance(maximum, int):
+            colonnes[cle] = [int(v) for v in rng.integers(minimum, maximum, size=nbPoints, endpoint=True)]
+        else:
+            colonnes[cle] = [float(v) for v in rng.uniform(minimum, maximum, size=nbPoints)]
+    return [{cle: colonnes[cle][i] for cle in colonnes} for i in range(nbPoints)]
+
+
+def mesures(comptes, nbGenerations):
+    """Retourne les mesures (voir le module) d'une simulation à partir de ses effectifs par génération."""
+    renards = np.asarray(comptes["renards"])
+    lapins = np.asarray(comptes["lapins"])
+    fin = np.flatnonzero((renards == 0) | (lapins == 0))
+    resultat = {
+        "generations": len(renards) - 1,
+        "duree_coexistence": int(fin[0]) if len(fin) else nbGenerations,
+    }
+    for espece in ESPECES:
+        serie = np.asarray(comptes[espece], dtype=np.float64)
+        resultat[f"moyenne_{espece}"] = float(serie.mean())
+        regime = serie[len(serie) // 2:]
+        q05, q95 = np.quantile(regime, (0.05, 0.95))
+        resultat[f"amplitude_{espece}"] = float((q95 - q05) / 2)
+    return resultat
+
+
+def simulerPoint(indice, replique, point, parametresFixes, graine, nbGenerations, arretSiFini):
+    """Simule un point du balayage et retourne sa ligne de résultats. Exécutée dans un processus de travail."""
+    parametres, parametresAnimaux = separerParametres({**parametresFixes, **point})
+    resultats = simuler(parametres, parametresAnimaux, graine=graine, nbGenerations=nbGenerations,
+                        arretSiFini=arretSiFini)
+    return {"point": indice, "replique": replique, "graine": graine.entropy, "indice_graine": graine.spawn_key[-1],
+            **point,
+            **mesures(resultats, nbGenerations)}
+
+
+def balayer(points, parametresFixes=None, nbGenerations=100, graine=None, nbRepliques=1,
+            arretSiFini=True, nbProcessus=None, rappel=None):
+    """Simule chaque point de [points] ([nbRepliques] fois, graines distinctes) et retourne le tableau
+    des résultats, trié par point puis par réplique. Une ligne se rejoue avec la graine
+    `np.random.SeedSequence(ligne["graine"], spawn_key=(ligne["indice_graine"],))`.
+
+    Arguments :
+        - points (list de dict) : valeurs à essayer (voir `pointsGrille` et `pointsAleatoires`) ; les clés
+          appartiennent à `GameRules.PARAMETERS` ou à `Animal.PARAMETERS`.
+        - parametresFixes (dict) : valeurs communes à tous les points.
+        - nbProcessus (int) : nombre de processus de travail (None : un par cœur ; 1 : processus courant).
+        - rappel (callable) : appelé avec chaque ligne, dans l'ordre où les simulations se terminent.
+    """
+    parametresFixes = dict(parametresFixes or {})
+    separerParametres({**parametresFixes, **(points[0] if points else {})})  # Clés inconnues : ValueError immédiate
+    graines = grainesRepliques(graine, len(points) * nbRepliques)
+    arguments = [(indice, replique, point, parametresFixes, graines[indice * nbRepliques + replique],
+                  nbGenerations, arretSiFini)
+                 for indice, point in enumerate(points) for replique in range(nbRepliques)]
+    lignes = []
+    for ligne in executer(simulerPoint, arguments, nbProcessus):
+        lignes.append(ligne)
+        if rappel is not None:
+            rappel(ligne)
+    return sorted(lignes, key=lambda ligne: (ligne["point"], ligne["replique"]))
+
+
+def ecrireTableau(lignes, chemin):
+    """Écrit le tableau des résultats en CSV (une colonne par paramètre balayé et par mesure)."""
+    colonnes = []
+    for ligne in lignes:
+        colonnes += [cle for cle in ligne if cle not in colonnes]
+    with open(chemin, "w", newline="") as fichier:
+        ecrivain = csv.DictWriter(fichier, fieldnames=colonnes)
+        ecrivain.writeheader()
+        ecrivain.writerows(lignes)
+
+
+def lireValeurs(valeurs, separateur):
+    """Lit les arguments `cle=v1<separateur>v2...` en {cle: [v1, v2, ...]}."""
+    lues = {}
+    for valeur in valeurs:
+        cle, _, texte = valeur.partition("=")
+        if not texte:
+            raise ValueError(f"Valeur invalide (attendu cle=valeurs) : {valeur}")
+        lues[cle] = [lireNombre(morceau) for morceau in texte.split(separateur)]
+    return lues
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Balayage des paramètres de la simulation proies-prédateurs, en parallèle.")
+    parser.add_argument("--grille", action="append", default=[], metavar="CLE=V1,V2,...",
+                        help="valeurs à essayer pour un paramètre (répétable, toutes les combinaisons)")
+    parser.add_argument("--aleatoire", action="append", default=[], metavar="CLE=MIN:MAX",
+                        help="intervalle de tirage d'un paramètre (répétable)")
+    parser.add_argument("--points", type=int, default=20, help="nombre de tirages avec --aleatoire")
+    parser.add_argument("--param", action="append", default=[], metavar="CLE=VALEUR",
+                        help="paramètre fixe (répétable)")
+    parser.add_argument("--repliques", type=int, default=1, help="simulations par point")
+    parser.add_argument("--generations", type=int, default=100, help="nombre maximal de générations")
+    parser.add_argument("--graine", type=int, default=None, help="graine du balayage")
+    parser.add_argument("--processus", type=int, default=None,
+                        help="nombre de processus (par défaut, un par cœur)")
+    parser.add_argument("--continuer", action="store_true",
+                        help="ne pas s'arrêter à l'extinction des renards ou des lapins")
+    parser.add_argument("--sortie", default="balayage.csv", help="fichier de sortie (.csv)")
+    args = parser.parse_args(arguments)
+
+    if bool(args.grille) == bool(args.aleatoire):
+        parser.error("utiliser soit --grille, soit --aleatoire")
+    if args.grille:
+        points = pointsGrille(lireValeurs(args.grille, ","))
+    else:
+        intervalles = {cle: tuple(bornes) for cle, bornes in lireValeurs(args.aleatoire, ":").items()}
+        if any(len(bornes) != 2 for bornes in intervalles.values()):
+            parser.error("--aleatoire attend CLE=MIN:MAX")
+        points = pointsAleatoires(intervalles, args.points, args.graine)
+    parametres, parametresAnimaux = lireParametres(args.param)
+
+    lignes = balayer(points, {**parametres, **parametresAnimaux}, nbGenerations=args.generations,
+                     graine=args.graine, nbRepliques=args.repliques, arretSiFini=not args.continuer,
+                     nbProcessus=args.processus,
+                     rappel=lambda ligne: print(f"point {ligne['point']} (réplique {ligne['replique']}) : "
+                                                f"coexistence {ligne['duree_coexistence']} générations"))
+    ecrireTableau(lignes, args.sortie)
+    print(f"{len(lignes)} simulations écrites dans {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
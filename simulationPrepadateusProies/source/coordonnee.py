@@ -1,3 +1,10 @@
+from functools import lru_cache
+
+# Déplacements possibles, dans l'ordre utilisé par case_voisine
+# (diagonales et verticales, puis gauche et droite)
+MOUVEMENTS = [(i, j) for i in [-1, 0, 1] for j in [-1, 1]] + [(-1, 0), (1, 0)]
+
+
 class Coordonnee():
 
     """
@@ -6,11 +13,16 @@ class Coordonnee():
     Cette classe permet de gérer les coordonnées d'une case dans une grille carrée 
     et de déterminer les cases voisines.
 
+    Une Coordonnee est immuable et hachable (utilisable comme clé de dictionnaire). Le moteur 
+    ne manipule que des index de case ; quand l'API publique doit rendre une Coordonnee, elle 
+    la prend dans le `PoolCoordonnees` de la grille, qui rend toujours la même instance pour 
+    une case donnée.
+
     Attributs :
     -----------
-    - x : int
+    - x : int (lecture seule)
         Coordonnée x de la case.
-    - y : int
+    - y : int (lecture seule)
         Coordonnée y de la case.
 
     Méthodes :
@@ -23,21 +35,96 @@ class Coordonnee():
         de taille donnée. Les déplacements incluent les directions cardinales 
         (haut, bas, gauche, droite) et les diagonales. Vérifie que les coordonnées 
         des voisins restent dans les limites de la grille.
+
+    Fonctions du module (index de case) :
+    -------------------------------------
+    Le moteur repère une case par un entier : son index dans la grille entourée d'une bordure 
+    sentinelle d'une case (largeur `taille + 2`). Les voisins d'une case s'obtiennent alors en 
+    ajoutant des décalages constants, sans test de limites : les voisins hors grille tombent 
+    sur la bordure.
+
+    - indexCase(x, y, taille) -> int : index de la case (x, y).
+    - coordCase(case, taille) -> tuple : coordonnées (x, y) de la case d'index donné.
+    - decalagesVoisins(taille) -> tuple : décalages d'index des 8 voisins, dans l'ordre de case_voisine.
     """
 
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        self._x = x
+        self._y = y
+
+    @property
+    def x(self):
+        return self._x
+
+    @property
+    def y(self):
+        return self._y
 
     def get_coord(self):
-        return (self.x, self.y)
+        return (self._x, self._y)
+
+    def __eq__(self, autre):
+        if not isinstance(autre, Coordonnee):
+            return NotImplemented
+        return self._x == autre._x and self._y == autre._y
+
+    def __hash__(self):
+        return hash((self._x, self._y))
+
+    def __repr__(self):
+        return f"Coordonnee({self._x}, {self._y})"
 
     def case_voisine(self, taille):
         # Liste des déplacements possibles (haut, bas, gauche, droite et diagonales)
-        mouvements = [(i+self.x, j+self.y) for i in [-1, 0, 1]
-                      for j in [-1, 1]] + [(-1+self.x, self.y)] + [(1+self.x, self.y)]
+        mouvements = [(i+self.x, j+self.y) for i, j in MOUVEMENTS]
         voisins = []
         for dx, dy in mouvements:
             if 0 <= dx < taille and 0 <= dy < taille:  # Vérifie que la nouvelle case est valide
                 voisins.append(Coordonnee(dx, dy))
         return voisins
+
+
+def indexCase(x, y, taille):
+    """Retourne l'index de la case (x, y) dans la grille bordée de largeur taille + 2."""
+    return (x + 1) * (taille + 2) + y + 1
+
+
+def coordCase(case, taille):
+    """Retourne les coordonnées (x, y) de la case d'index donné."""
+    x, y = divmod(case, taille + 2)
+    return (x - 1, y - 1)
+
+
+@lru_cache(maxsize=None)
+def decalagesVoisins(taille):
+    """Table des voisins, calculée une fois par taille de grille : voisins de la case c = c + décalage."""
+    return tuple(i * (taille + 2) + j for i, j in MOUVEMENTS)
+
+
+class PoolCoordonnees():
+
+    """
+    Pool des Coordonnee d'une grille : une seule instance par case, créée à la première demande.
+
+    Méthodes :
+        - depuisCase(case) -> Coordonnee : Coordonnee de la case d'index donné.
+        - get(x, y) -> Coordonnee : Coordonnee partagée de la case (x, y).
+    """
+
+    def __init__(self, taille):
+        self.__taille = taille
+        self.__coordonnees = {}
+
+    def depuisCase(self, case):
+        case = int(case)
+        coord = self.__coordonnees.get(case)
+        if coord is None:
+            coord = Coordonnee(*coordCase(case, self.__taille))
+            self.__coordonnees[case] = coord
+        return coord
+
+    def get(self, x, y):
+        return self.depuisCase(indexCase(x, y, self.__taille))
+
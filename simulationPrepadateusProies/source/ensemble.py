@@ -0,0 +1,175 @@
+"""
+Ensemble de simulations indépendantes (répliques) d'un même jeu de paramètres, réparties sur plusieurs processus.
+
+Chaque réplique est une simulation `simulationBatch.simuler` avec sa propre graine, une `np.random.SeedSequence`
+issue de la graine de l'ensemble par `SeedSequence.spawn` : l'ensemble est reproductible et les répliques sont
+indépendantes, quel que soit le nombre de processus. Par défaut, toutes les répliques vont jusqu'à la dernière
+génération (une espèce éteinte reste à 0) : les statistiques de chaque génération portent sur toutes les répliques.
+
+Utilisation en Python :
+
+    for indice, comptes in repliques({"Taille": 100}, nbRepliques=32, graine=1, nbGenerations=300):
+        ...  # comptes = {"generation", "renards", "lapins", "ours", "herbe"}, reçus au fil de l'eau
+    statistiques = ensemble({"Taille": 100}, nbRepliques=32, graine=1, nbGenerations=300)
+    statistiques["lapins"]["moyenne"], statistiques["lapins"]["quantiles"][0.05], statistiques["lapins"]["extinction"]
+
+En ligne de commande, depuis la racine du projet :
+
+    python3 -m source.ensemble --repliques 32 --generations 300 --graine 1 --param Taille=100 --sortie ensemble.npz
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from source.simulationBatch import simuler, lireParametres
+
+ESPECES = ("renards", "lapins", "ours")
+COLONNES_COMPTES = ("generation",) + ESPECES + ("herbe",)
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def grainesRepliques(graine, nbRepliques):
+    """Retourne [nbRepliques] graines indépendantes (`np.random.SeedSequence`) dérivées de [graine].
+
+    La graine d'indice i est `np.random.SeedSequence(entropie, spawn_key=(i,))`, où l'entropie est [graine]
+    (tirée au hasard si [graine] vaut None, lisible dans l'attribut `entropy` de chaque graine).
+    """
+    return np.random.SeedSequence(graine).spawn(nbRepliques)
+
+
+def simulerReplique(indice, parametres, parametresAnimaux, graine, nbGenerations, arretSiFini, ajoutsOurs):
+    """Simule une réplique et retourne (indice, comptes par génération). Exécutée dans un processus de travail."""
+    resultats = simuler(parametres, parametresAnimaux, graine=graine, nbGenerations=nbGenerations,
+                        arretSiFini=arretSiFini, ajoutsOurs=ajoutsOurs)
+    return indice, {colonne: resultats[colonne] for colonne in COLONNES_COMPTES}
+
+
+def repliques(parametres=None, parametresAnimaux=None, nbRepliques=10, graine=None, nbGenerations=100,
+              arretSiFini=False, ajoutsOurs=(), nbProcessus=None):
+    """Lance [nbRepliques] simulations et produit (indice, comptes) à mesure que les répliques se terminent.
+
+    Arguments :
+        - parametres, parametresAnimaux, nbGenerations, arretSiFini, ajoutsOurs : voir `simulationBatch.simuler`.
+        - graine (int) : graine de l'ensemble (None : graines tirées au hasard).
+        - nbProcessus (int) : nombre de processus de travail (None : un par cœur ; 1 : dans le processus courant).
+
+    L'indice d'une réplique (0 à nbRepliques - 1) détermine sa graine : l'ordre de réception n'influe pas
+    sur les résultats.
+    """
+    graines = grainesRepliques(graine, nbRepliques)
+    arguments = [(indice, parametres, parametresAnimaux, graineReplique, nbGenerations, arretSiFini,
+                  tuple(ajoutsOurs)) for indice, graineReplique in enumerate(graines)]
+    yield from executer(simulerReplique, arguments, nbProcessus)
+
+
+def executer(fonction, listeArguments, nbProcessus=None):
+    """Appelle fonction(*arguments) pour chaque élément de [listeArguments] et produit les résultats
+    dans l'ordre où les appels se terminent.
+
+    [fonction] doit être définie au niveau d'un module (elle est transmise aux processus de travail).
+    nbProcessus : None pour un processus par cœur, 1 pour tout exécuter dans le processus courant.
+    """
+    if nbProcessus is None:
+        nbProcessus = os.cpu_count() or 1
+    if nbProcessus == 1 or len(listeArguments) <= 1:
+        for arguments in listeArguments:
+            yield fonction(*arguments)
+        return
+    with ProcessPoolExecutor(max_workers=min(nbProcessus, len(listeArguments))) as executeur:
+        futurs = [executeur.submit(fonction, *arguments) for arguments in listeArguments]
+        for futur in as_completed(futurs):
+            yield futur.result()
+
+
+def agreger(comptesRepliques, nbGenerations, quantiles=QUANTILES):
+    """Agrège les comptes de plusieurs répliques, génération par génération.
+
+    Une réplique arrêtée avant [nbGenerations] (extinction, avec arretSiFini) est complétée par des NaN. Les
+    statistiques ne sont calculées que pour les générations où toutes les répliques sont en cours (`"enCours"`),
+    NaN ensuite : ne garder que les répliques survivantes biaiserait la moyenne et les quantiles.
+
+    Retourne {espece: {"moyenne", "quantiles": {q: tableau}, "extinction"}, "generation", "enCours"}, où
+    "extinction" donne pour chaque réplique la première génération sans animal de l'espèce (NaN si aucune).
+    """
+    statistiques = {"generation": np.arange(nbGenerations + 1)}
+    tableaux = {}
+    for espece in ESPECES:
+        tableau = np.full((len(comptesRepliques), nbGenerations + 1), np.nan)
+        for i, comptes in enumerate(comptesRepliques):
+            serie = np.asarray(comptes[espece], dtype=np.float64)[:nbGenerations + 1]
+            tableau[i, :len(serie)] = serie
+        tableaux[espece] = tableau
+    statistiques["enCours"] = np.count_nonzero(~np.isnan(tableaux["lapins"]), axis=0)
+
+    for espece, tableau in tableaux.items():
+        calculable = statistiques["enCours"] == len(comptesRepliques)
+        moyenne = np.full(nbGenerations + 1, np.nan)
+        moyenne[calculable] = np.nanmean(tableau[:, calculable], axis=0)
+        valeursQuantiles = {}
+        for q in quantiles:
+            valeurs = np.full(nbGenerations + 1, np.nan)
+            valeurs[calculable] = np.nanquantile(tableau[:, calculable], q, axis=0)
+            valeursQuantiles[q] = valeurs
+        eteinte = tableau == 0
+        extinction = np.where(eteinte.any(axis=1), eteinte.argmax(axis=1), np.nan)
+        statistiques[espece] = {"moyenne": moyenne, "quantiles": valeursQuantiles, "extinction": extinction}
+    return statistiques
+
+
+def ensemble(parametres=None, parametresAnimaux=None, nbRepliques=10, graine=None, nbGenerations=100,
+             arretSiFini=False, ajoutsOurs=(), nbProcessus=None, rappel=None):
+    """Lance les répliques (voir `repliques`) et retourne leurs statistiques (voir `agreger`).
+
+    [rappel] est appelé avec (indice, comptes) à la réception de chaque réplique.
+    """
+    comptesRepliques = [None] * nbRepliques
+    for indice, comptes in repliques(parametres, parametresAnimaux, nbRepliques, graine, nbGenerations,
+                                     arretSiFini, ajoutsOurs, nbProcessus):
+        comptesRepliques[indice] = comptes
+        if rappel is not None:
+            rappel(indice, comptes)
+    return agreger(comptesRepliques, nbGenerations)
+
+
+def aplatir(statistiques):
+    """Retourne les statistiques sous forme {nom: tableau}, pour `np.savez`."""
+    tableaux = {"generation": statistiques["generation"], "enCours": statistiques["enCours"]}
+    for espece in ESPECES:
+        tableaux[f"{espece}_moyenne"] = statistiques[espece]["moyenne"]
+        for q, valeurs in statistiques[espece]["quantiles"].items():
+            tableaux[f"{espece}_q{round(q * 100):02d}"] = valeurs
+        tableaux[f"{espece}_extinction"] = statistiques[espece]["extinction"]
+    return tableaux
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Ensemble de simulations proies-prédateurs indépendantes, en parallèle.")
+    parser.add_argument("--repliques", type=int, default=10, help="nombre de répliques")
+    parser.add_argument("--generations", type=int, default=100, help="nombre maximal de générations")
+    parser.add_argument("--graine", type=int, default=None, help="graine de l'ensemble")
+    parser.add_argument("--processus", type=int, default=None,
+                        help="nombre de processus (par défaut, un par cœur)")
+    parser.add_argument("--param", action="append", default=[], metavar="CLE=VALEUR",
+                        help="paramètre de GameRules.PARAMETERS ou Animal.PARAMETERS (répétable)")
+    parser.add_argument("--ours", action="append", type=int, default=[], metavar="GENERATION",
+                        help="génération à laquelle ajouter des ours (répétable)")
+    parser.add_argument("--arret", action="store_true",
+                        help="arrêter chaque réplique à l'extinction des renards ou des lapins (statistiques "
+                             "limitées aux générations où toutes les répliques sont en cours)")
+    parser.add_argument("--sortie", default="ensemble.npz", help="fichier de sortie (.npz)")
+    args = parser.parse_args(arguments)
+
+    parametres, parametresAnimaux = lireParametres(args.param)
+    statistiques = ensemble(parametres, parametresAnimaux, nbRepliques=args.repliques, graine=args.graine,
+                            nbGenerations=args.generations, arretSiFini=args.arret,
+                            ajoutsOurs=args.ours, nbProcessus=args.processus,
+                            rappel=lambda indice, comptes: print(
+                                f"réplique {indice} terminée ({len(comptes['generation']) - 1} générations)"))
+    np.savez_compressed(args.sortie, **aplatir(statistiques))
+    print(f"{args.repliques} répliques agrégées dans {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
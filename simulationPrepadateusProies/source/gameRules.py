@@ -1,7 +1,10 @@
 from source.grille import *
+from source.grilleCreuse import GrilleCreuse
 from source.population import *
 from source.environnement import *
-from random import randint
+from time import perf_counter
+from source.validation import NiveauValidation, verifierCompteurs, verifierEchantillon, verifierComplet
+from source.reserveAleatoire import ReserveAleatoire
 
 
 class GameRules():
@@ -25,23 +28,71 @@ class GameRules():
         Représentation de la grille de jeu.
     - __population : Population
         Gestion de la population animale sur la grille.
+    - __rng : ReserveAleatoire
+        Unique source aléatoire de la simulation (un `numpy.random.Generator` servi par une réserve
+        d'uniformes tirés par blocs), partagée avec la grille, la population et les animaux :
+        une même graine rejoue exactement la même simulation.
 
     Méthodes principales :
     ----------------------
-    - __init__() :
+    - __init__(graine=None, etat=None, creuse=False) :
         Initialise une grille, une population et ajoute les éléments initiaux (animaux et herbe) selon `PARAMETERS`.
+        [graine] (int, `numpy.random.SeedSequence` ou None) initialise le générateur de la simulation ; des
+        répliques indépendantes reçoivent des `SeedSequence` issues d'un même `SeedSequence.spawn`.
+        Avec [etat] (voir `exporterEtat`), la simulation reprend cet état au lieu de placer de nouveaux animaux.
+        Avec [creuse], la grille est une `GrilleCreuse` (tuiles allouées à la demande) et la population
+        s'agrandit avec le nombre d'animaux : la mémoire ne dépend plus de TAILLE², pour les très grandes
+        grilles peu peuplées. L'herbe initiale y est tirée case par case (densité `Apparition herbe (%)`) au
+        lieu d'un nombre exact de cases ; la sauvegarde et l'affichage ne sont pas pris en charge.
+
+    - exporterEtat() -> dict / restaurerEtat(etat) :
+        Copie complète de l'état (grille, population, identifiants libres, génération, générateurs aléatoires)
+        et reprise de cet état ; voir le module `sauvegarde` pour l'écriture dans un fichier. Lève une
+        ValueError sur grille creuse.
+
+    - estCreuse() -> bool :
+        Indique si la grille est une `GrilleCreuse` (simulation qui ne peut pas être sauvegardée).
 
     - bouge(iden: int) :
         Gère le mouvement et les interactions d'un animal spécifique, y compris la reproduction et l'alimentation.
 
     - generation() :
         Avance la simulation d'une génération, en déplaçant tous les animaux et en ajoutant de l'herbe si nécessaire.
+        Voir `generationParallele.GenerationParallele` pour répartir les tours des animaux sur plusieurs processus.
+
+    - terminerGeneration() :
+        Fin de génération commune aux deux moteurs : repousse de l'herbe, compteur de générations, observateurs.
+
+    - moteur(grille, population, rng) -> GameRules (méthode de classe) :
+        Moteur réduit à `bouge` sur une grille et une population fournies (les bandes de `generationParallele`).
+
+    - get_generation() -> int :
+        Retourne le nombre de générations déjà simulées.
+
+    - grilleEspeces() -> np.ndarray :
+        Retourne l'occupation de la grille (TAILLE x TAILLE, uint8) : 0 pour une case libre, l'espèce + 1 sinon.
+
+    - ajouterObservateur(observateur) / retirerObservateur(observateur) :
+        [observateur(gameRules)] est appelé à la fin de chaque `generation` (par exemple un
+        `EnregistreurTrajectoire`).
+
+    - set_instrumentation(instrumentation: Instrumentation | None) :
+        Active ou désactive la mesure du temps de chaque phase de `generation` (lots de `bouge` par espèce,
+        vieillissement, repousse de l'herbe).
 
     - estFiniJeu() -> bool :
         Vérifie si les conditions de fin de jeu (extinction des lapins ou renards) sont remplies.
 
     - checkInvariant() :
-        Effectue des vérifications pour garantir la cohérence entre la grille et la population.
+        Effectue des vérifications pour garantir la cohérence entre la grille et la population
+        (vérification complète, vectorisée, en O(TAILLE²)).
+
+    - set_validation(niveau: NiveauValidation, periode: int = 1, nbCases: int = 256) :
+        Choisit le niveau des vérifications faites par `valider()` : les compteurs sont vérifiés à chaque appel,
+        l'échantillon de [nbCases] cases ou la vérification complète une génération sur [periode].
+
+    - valider() :
+        Effectue les vérifications du niveau choisi ; à appeler après chaque génération.
 
     - addOursAleatoire() :
         Ajoute un ours aléatoirement sur une case vide, selon les paramètres de simulation.
@@ -52,37 +103,94 @@ class GameRules():
 
     PARAMETERS = {}
 
-    # Constructeur
+    # Espèces que chaque espèce peut manger (codes de Population)
+    PROIES = {
+        Population.RENARD: (Population.LAPIN,),
+        Population.LAPIN: (),
+        Population.OURS: (Population.LAPIN, Population.RENARD),
+    }
 
-    def __init__(self):
+    # Constructeur
 
-        TAILLE = self.PARAMETERS["Taille"]
+    def __init__(self, graine=None, etat=None, creuse=False):
+
+        if creuse and etat is not None:
+            raise ValueError("Une simulation sur grille creuse ne peut pas reprendre un état sauvegardé")
+        TAILLE = self.PARAMETERS["Taille"] if etat is None else etat["grille"]["ids"].shape[0]
+        sequence = graine if isinstance(graine, np.random.SeedSequence) else np.random.SeedSequence(graine)
+        self.__rng = ReserveAleatoire(np.random.default_rng(sequence))
+        if creuse:
+            self.__grille = GrilleCreuse(TAILLE, self.__rng, self.PARAMETERS["Apparition herbe (%)"] / 100)
+            nbAnimaux = self.PARAMETERS["Renards"] + self.PARAMETERS["Lapins"]
+            self.__population = Population(TAILLE, self.__rng, capaciteInitiale=max(1024, 2 * nbAnimaux),
+                                           pool=self.__grille.get_pool())
+        else:
+            self.__grille = Grille(TAILLE, self.__rng)
+            self.__population = Population(TAILLE, self.__rng, pool=self.__grille.get_pool())
+        self.__decalages = decalagesVoisins(TAILLE)
+        self.__generation = 0
+        self.__instrumentation = None
+        self.__observateurs = []
+        self.__niveauValidation = NiveauValidation.COMPTEURS
+        self.__periodeValidation = 1
+        self.__nbCasesValidation = 256
+        # Générateur propre aux vérifications (flux indépendant issu de la même graine) :
+        # l'échantillonnage ne modifie pas le tirage de la simulation
+        self.__rngValidation = np.random.default_rng(sequence.spawn(1)[0])
+        if etat is not None:
+            self.restaurerEtat(etat)
+            return
+        if creuse:
+            self.__placerAnimauxCreuse()
+            return
         POURCENTAGE_HERBE = self.PARAMETERS["Apparition herbe (%)"]
-        self.__grille = Grille(TAILLE)
-        self.__population = Population(TAILLE)
         nb_herbe = (POURCENTAGE_HERBE*(TAILLE*TAILLE)) // 100
-        tab_coord = [Coordonnee(i, j) for i in range(TAILLE)
-                     for j in range(TAILLE)]
+        ids = self.__grille.get_idsCases()
+
+        # Tirage sans remise des cases (index de case) : la case tirée est échangée avec la dernière puis retirée
+        def tirer(tab_cases):
+            aleatoire = self.__rng.integers(len(tab_cases))
+            tab_cases[aleatoire], tab_cases[-1] = tab_cases[-1], tab_cases[aleatoire]
+            return tab_cases.pop()
 
+        tab_cases = [indexCase(i, j, TAILLE) for i in range(TAILLE)
+                     for j in range(TAILLE)]
         for i in range(GameRules.PARAMETERS["Renards"]):
-            aleatoire = randint(0, len(tab_coord)-1)
-            c_aleatoire = tab_coord.pop(aleatoire)
-            id_ = self.__population.addAnimal(0, c_aleatoire)
-            self.set_id(c_aleatoire, id_)
+            case = tirer(tab_cases)
+            ids[case] = self.__population.addAnimalCase(0, case)
         for i in range(GameRules.PARAMETERS["Lapins"]):
-            aleatoire = randint(0, len(tab_coord)-1)
-            c_aleatoire = tab_coord.pop(aleatoire)
-            id_ = self.__population.addAnimal(1, c_aleatoire)
-            self.set_id(c_aleatoire, id_)
+            case = tirer(tab_cases)
+            ids[case] = self.__population.addAnimalCase(1, case)
 
-        tab_coord = [Coordonnee(i, j) for i in range(TAILLE)
+        tab_cases = [indexCase(i, j, TAILLE) for i in range(TAILLE)
                      for j in range(TAILLE)]
+        envs = self.__grille.get_envCases()
         for i in range(nb_herbe):
-            aleatoire = randint(0, len(tab_coord)-1)
-            c_aleatoire = tab_coord.pop(aleatoire)
-            self.set_envi(c_aleatoire, Environnement.HERBE)
+            envs[tirer(tab_cases)] = Environnement.HERBE.value
+
+    def __placerAnimauxCreuse(self):
+        """Place les renards puis les lapins sur des cases distinctes tirées sans parcourir la grille."""
+        TAILLE = self.__grille.get_TAILLE()
+        nbRenards = GameRules.PARAMETERS["Renards"]
+        cellules = self.__rng.get_generateur().choice(
+            TAILLE * TAILLE, size=nbRenards + GameRules.PARAMETERS["Lapins"], replace=False)
+        ids = self.__grille.get_idsCases()
+        for i, cellule in enumerate(cellules.tolist()):
+            case = indexCase(*divmod(cellule, TAILLE), TAILLE)
+            ids[case] = self.__population.addAnimalCase(0 if i < nbRenards else 1, case)
 
     # Getters
+    @classmethod
+    def moteur(cls, grille, population, rng):
+        """Retourne un GameRules sans état propre qui fait jouer (`bouge`) les animaux de [population] sur
+        [grille] avec [rng] ; [grille] n'a besoin que de get_idsCases() et get_envCases()."""
+        moteur = cls.__new__(cls)
+        moteur.__grille = grille
+        moteur.__population = population
+        moteur.__rng = rng
+        moteur.__decalages = decalagesVoisins(population.getTAILLE())
+        return moteur
+
     def get_id(self, c):
         return self.__grille.get_id(c)
 
@@ -95,6 +203,19 @@ class GameRules():
     def get_population(self):
         return self.__population
 
+    def get_rng(self):
+        return self.__rng
+
+    def get_generation(self):
+        """Retourne le nombre de générations déjà simulées."""
+        return self.__generation
+
+    def get_instrumentation(self):
+        return self.__instrumentation
+
+    def get_niveauValidation(self):
+        return self.__niveauValidation
+
     # Setters
 
     def set_id(self, c, iden):
@@ -109,188 +230,182 @@ class GameRules():
     def set_grille(self):
         self.__grille
 
-    def bouge(self, iden):
-        coord = self.__population.getAnimal(iden).get_coord()
-        TAILLE = self.PARAMETERS["Taille"]
-        ajout_herbe = True  # Indique si de l'herbe doit être ajoutée après un mouvement
-        x = 1
-        couple = None
+    def set_instrumentation(self, instrumentation):
+        """Active (avec une `Instrumentation`) ou désactive (avec None) la mesure des phases de `generation`."""
+        self.__instrumentation = instrumentation
 
-        if iden != -1:  # Si la case contient un animal
-            animal = self.__population.getAnimal(iden)
-            sexe_animal = animal.get_sexe()
-            cases_voisines = coord.case_voisine(
-                TAILLE)  # Indique si l'animal a mangé
-            reproduction = False  # Indique si l'animal peut se reproduire
-            a_bouge = False
-
-            # Vérification si l'animal doit mourir
-            if animal.vaMourir():
-                self.__population.deleteAnimal(animal)
-                self.set_id(coord, -1)  # Case devient vide
-                return
-
-            # Gestion spécifique selon le type d'animal
-            if isinstance(animal, Renard):
-                x = 0
-                perdtour = False
-                # Cherche un lapin à manger
-                cases_lapin = [
-                    c for c in cases_voisines if self.is_prey(c, Lapin)]
-                if cases_lapin:
-                    cible = self.choisir_au_hasard(cases_lapin)
-                    lapin_cible = self.__population.getAnimal(
-                        self.get_id(cible))
-                    lapin_genes = lapin_cible.get_genes()
-                    reprod = np.random.binomial(
-                        1, lapin_genes[Genes.ESQUIVE]/Animal.PARAMETERS['CoeffGeneE'])
-                    if (reprod == 0):
-                        self.manger_animal(coord, cible, iden)
-                        a_bouge = True
-                    else:
-                        perdtour = True
-
-                # Vérifie les possibilités de reproduction
-                cases_libres = [
-                    c for c in cases_voisines if self.get_id(c) == -1]
-                voisins_opposés = [
-                    c for c in cases_voisines if self.is_opposite_sex(c, sexe_animal, Renard)
-                ]
-
-                # Se déplace si possible (priorité au déplacement après avoir mangé)
-                if not a_bouge and len(cases_libres) > 0 and not perdtour:
-                    cible = self.choisir_au_hasard(cases_libres)
-                    self.deplacer_animal(coord, cible, iden)
-                    a_bouge = True
+    def ajouterObservateur(self, observateur):
+        self.__observateurs.append(observateur)
 
-                if a_bouge and len(voisins_opposés) > 0:
-                    if (animal.peutSeReproduire()):
-                        couple = self.__population.getAnimal(
-                            self.get_id(self.choisir_au_hasard(voisins_opposés)))
-                        reproduction = True
+    def retirerObservateur(self, observateur):
+        self.__observateurs.remove(observateur)
 
-            elif isinstance(animal, Lapin):
-                ajout_herbe = False
-                # Cherche de l'herbe à manger
-                x = 1
-                cases_herbe = [c for c in cases_voisines if (self.get_envi(
-                    c) == Environnement.HERBE and self.get_id(c) == -1)]
-                if cases_herbe:
-                    cible = self.choisir_au_hasard(cases_herbe)
-                    self.manger_herbe(coord, cible, iden)
-                    a_bouge = True
-                    ajout_herbe = True
-
-                # Vérifie les possibilités de reproduction
-                cases_libres = [
-                    c for c in cases_voisines if self.get_id(c) == -1]
-                voisins_opposés = [
-                    c for c in cases_voisines if self.is_opposite_sex(c, sexe_animal, Lapin)
-                ]
-                if voisins_opposés and (len(cases_libres) > 0):
-                    if (animal.peutSeReproduire()):
-                        reproduction = True
-                        couple = self.__population.getAnimal(
-                            self.get_id(self.choisir_au_hasard(voisins_opposés)))
-
-                # Se déplace si possible (priorité au déplacement après avoir mangé)
-                if not a_bouge and cases_libres:
-                    cible = self.choisir_au_hasard(cases_libres)
-                    self.deplacer_animal(coord, cible, iden)
-                    a_bouge = True
-                    ajout_herbe = True
-
-            elif isinstance(animal, Ours):
-                perdtour = False
-                x = 2
-                # Cherche un lapin ou renard à manger
-                cases_proix = [c for c in cases_voisines if (
-                    self.is_prey(c, Lapin) or self.is_prey(c, Renard))]
-                if cases_proix:
-                    cible = self.choisir_au_hasard(cases_proix)
-                    lapin_cible = self.__population.getAnimal(
-                        self.get_id(cible))
-                    lapin_genes = lapin_cible.get_genes()
-                    reprod = np.random.binomial(
-                        1, lapin_genes[Genes.ESQUIVE]/Animal.PARAMETERS['CoeffGeneE'])
-                    if ( reprod == 0):
-                        self.manger_animal(coord, cible, iden)
-                        a_bouge = True
-                    else:
-                        perdtour = True
-
-                # Vérifie les possibilités de reproduction
-                cases_libres = [
-                    c for c in cases_voisines if self.get_id(c) == -1]
-                voisins_opposés = [
-                    c for c in cases_voisines if self.is_opposite_sex(c, sexe_animal, Ours)
-                ]
-
-                # Se déplace si possible (priorité au déplacement après avoir mangé)
-                if not a_bouge and len(cases_libres) > 0 and not perdtour:
-                    cible = self.choisir_au_hasard(cases_libres)
-                    self.deplacer_animal(coord, cible, iden)
-                    a_bouge = True
+    def set_validation(self, niveau, periode=1, nbCases=256):
+        if periode < 1 or nbCases < 1:
+            raise ValueError("La période et le nombre de cases doivent être strictement positifs")
+        self.__niveauValidation = NiveauValidation(niveau)
+        self.__periodeValidation = periode
+        self.__nbCasesValidation = nbCases
+
+    def bouge(self, iden, vieillir=True):
+        """Fait jouer l'animal [iden]. Retourne True s'il a survécu à son tour.
 
-                if (a_bouge and len(voisins_opposés) > 0):
-                    if (animal.peutSeReproduire()):
-                        reproduction = True
-
-            # Si reproduction possible, création d'un nouvel animal
-            if reproduction and len(self.get_population().getIdsUtilisables()) > 0:
-                if (not isinstance(animal, Ours)):
-                    nouveau_gene = genes_parent(
-                        animal.get_genes(), couple.get_genes())
-                    nouveau_id = self.__population.addAnimal(
-                        x, coord, nouveau_gene)
-                    self.set_id(coord, nouveau_id)
+        Si [vieillir] vaut False, le vieillissement et la réduction de vie sont laissés à l'appelant
+        (voir `generation`, qui les applique en une seule opération sur les survivants).
+        """
+        population = self.__population
+        ids = self.__grille.get_idsCases()
+        especes = population.get_especes()
+        sexes = population.get_sexes()
+
+        animal = population.getAnimal(iden)
+        case = int(population.get_cases()[iden])
+        ajout_herbe = True  # Indique si de l'herbe doit être ajoutée après un mouvement
+        couple = None
+        reproduction = False  # Indique si l'animal peut se reproduire
+        a_bouge = False
+
+        # Vérification si l'animal doit mourir
+        if animal.vaMourir():
+            population.deleteAnimal(animal)
+            ids[case] = -1  # Case devient vide
+            return False
+
+        # Un seul passage sur les voisins : la bordure sentinelle (Grille.BORD) évite tout test
+        # de limites, et l'ordre des listes est celui de Coordonnee.case_voisine
+        espece = int(especes[iden])
+        sexe_animal = sexes[iden]
+        proies = GameRules.PROIES[espece]
+        envs = self.__grille.get_envCases()
+        cases_libres = []
+        cases_herbe = []
+        cases_proies = []
+        voisins_opposés = []
+        for decalage in self.__decalages:
+            voisine = case + decalage
+            id_voisin = ids[voisine]
+            if id_voisin == -1:
+                cases_libres.append(voisine)
+                if envs[voisine] == Environnement.HERBE.value:
+                    cases_herbe.append(voisine)
+            elif id_voisin >= 0:
+                espece_voisin = especes[id_voisin]
+                if espece_voisin == espece:
+                    if sexes[id_voisin] != sexe_animal:
+                        voisins_opposés.append(voisine)
+                elif espece_voisin in proies:
+                    cases_proies.append(voisine)
+
+        # Gestion spécifique selon le type d'animal
+        if espece == Population.LAPIN:
+            ajout_herbe = False
+            # Cherche de l'herbe à manger
+            if cases_herbe:
+                cible = self.choisir_au_hasard(cases_herbe)
+                self.__mangerHerbe(case, cible, iden)
+                cases_libres.remove(cible)
+                a_bouge = True
+                ajout_herbe = True
+
+            # Vérifie les possibilités de reproduction
+            if voisins_opposés and (len(cases_libres) > 0):
+                if (animal.peutSeReproduire()):
+                    reproduction = True
+                    couple = ids[self.choisir_au_hasard(voisins_opposés)]
+
+            # Se déplace si possible (priorité au déplacement après avoir mangé)
+            if not a_bouge and cases_libres:
+                cible = self.choisir_au_hasard(cases_libres)
+                self.__deplacer(case, cible, iden)
+                a_bouge = True
+                ajout_herbe = True
+
+        else:
+            # Renard (mange les lapins) ou ours (mange les lapins et les renards)
+            perdtour = False
+            if cases_proies:
+                cible = self.choisir_au_hasard(cases_proies)
+                genes_proie = population.get_genes()[ids[cible]]
+                esquive = self.__rng.binomial(
+                    1, genes_proie[Genes.ESQUIVE.value - 1]/Animal.PARAMETERS['CoeffGeneE'])
+                if (esquive == 0):
+                    self.__mangerAnimal(case, cible, iden)
+                    a_bouge = True
                 else:
-                    nouveau_id = self.__population.addAnimal(x, coord)
-                    self.set_id(coord, nouveau_id)
+                    perdtour = True
+
+            # Se déplace si possible (priorité au déplacement après avoir mangé)
+            if not a_bouge and len(cases_libres) > 0 and not perdtour:
+                cible = self.choisir_au_hasard(cases_libres)
+                self.__deplacer(case, cible, iden)
+                a_bouge = True
+
+            if a_bouge and len(voisins_opposés) > 0:
+                if (animal.peutSeReproduire()):
+                    reproduction = True
+                    if espece == Population.RENARD:
+                        couple = ids[self.choisir_au_hasard(voisins_opposés)]
+
+        # Si reproduction possible, création d'un nouvel animal sur la case quittée
+        if reproduction and population.nbIdsUtilisables() > 0:
+            if espece != Population.OURS:
+                nouveau_gene = genes_parent(
+                    animal.get_genes(), population.getAnimal(couple).get_genes(), self.__rng)
+                nouveau_id = population.addAnimalCase(
+                    espece, case, nouveau_gene)
+            else:
+                nouveau_id = population.addAnimalCase(espece, case)
+            ids[case] = nouveau_id
 
-                if (type(animal) == Lapin):
-                    ajout_herbe = False
+            if espece == Population.LAPIN:
+                ajout_herbe = False
 
-            # Vieillissement et réduction de la vie
+        # Vieillissement et réduction de la vie
+        if vieillir:
             animal.vieillit()
             animal.reduireVie()
 
         # Gestion d'ajout d'herbe
         if ajout_herbe:
-            r = randint(0, 100)
+            r = self.__rng.integers(0, 101)
             if 0 <= r < self.PARAMETERS["Apparition herbe (%)"]:
-                self.set_envi(coord, Environnement.HERBE)
-        # Fonctions utilitaires
+                envs[case] = Environnement.HERBE.value
+        return True
+
+    # Fonctions utilitaires
 
     def is_prey(self, coord, prey_type):
         """Vérifie si une case contient une proie du type donné."""
         id_voisin = self.get_id(coord)
         if id_voisin != -1:
-            animal = self.get_population().getAnimal(id_voisin)
-            return isinstance(animal, prey_type)
+            return self.__population.get_especes()[id_voisin] == Population.CODES[prey_type]
         return False
 
     def is_opposite_sex(self, coord, sexe, animal_type):
         """Vérifie si une case contient un animal du sexe opposé et du même type."""
         id_voisin = self.get_id(coord)
         if id_voisin != -1:
-            animal = self.get_population().getAnimal(id_voisin)
-            return isinstance(animal, animal_type) and animal.get_sexe() != sexe
+            return (self.__population.get_especes()[id_voisin] == Population.CODES[animal_type]
+                    and self.__population.get_sexes()[id_voisin] != sexe)
         return False
 
     def choisir_au_hasard(self, cases):
         """Retourne une case choisie aléatoirement parmi une liste."""
-        return cases[randint(0, len(cases) - 1)]
+        return cases[self.__rng.integers(len(cases))]
 
-    def manger_animal(self, origine, cible, iden):
-        """Un animal mange une autre proie et occupe sa case."""
-        id_proie = self.get_id(cible)
+    def __placer(self, origine, cible, iden):
+        """Déplace l'identifiant [iden] de la case [origine] vers la case [cible] (index de case)."""
+        ids = self.__grille.get_idsCases()
+        ids[cible] = iden
+        ids[origine] = -1
+        self.__population.get_cases()[iden] = cible
+
+    def __mangerAnimal(self, origine, cible, iden):
+        id_proie = self.__grille.get_idsCases()[cible]
         animal = self.__population.getAnimal(iden)
         proix = self.__population.getAnimal(id_proie)
         self.__population.deleteAnimal(proix)
-        self.set_id(cible, iden)
-        self.set_id(origine, -1)
-        animal.set_coord(cible)
+        self.__placer(origine, cible, iden)
         if (isinstance(animal, Ours)):
             if (isinstance(proix, Lapin)):
                 animal.mange('lapin')
@@ -299,46 +414,74 @@ class GameRules():
         else:
             animal.mange()
 
+    def __mangerHerbe(self, origine, cible, iden):
+        self.__grille.get_envCases()[cible] = Environnement.VIDE.value
+        self.__placer(origine, cible, iden)
+        self.__population.getAnimal(iden).mange()
+
+    def __deplacer(self, origine, cible, iden):
+        self.__placer(origine, cible, iden)
+
+    def __case(self, coord):
+        return self.__grille.indexCase(*coord.get_coord())
+
+    def manger_animal(self, origine, cible, iden):
+        """Un animal mange une autre proie et occupe sa case."""
+        self.__mangerAnimal(self.__case(origine), self.__case(cible), iden)
+
     def manger_herbe(self, origine, cible, iden):
         """Un animal mange de l'herbe sur une case."""
-        animal = self.__population.getAnimal(iden)
-        self.set_envi(cible, Environnement.VIDE)
-        self.set_id(cible, iden)
-        self.set_id(origine, -1)
-        animal.set_coord(cible)
-        animal.mange()
+        self.__mangerHerbe(self.__case(origine), self.__case(cible), iden)
 
     def deplacer_animal(self, origine, cible, iden):
         """Un animal se déplace vers une case libre."""
-
-        animal = self.__population.getAnimal(iden)
-        self.set_id(cible, iden)
-        self.set_id(origine, -1)
-        animal.set_coord(cible)
+        self.__deplacer(self.__case(origine), self.__case(cible), iden)
 
     def generation(self):
-        ours = self.get_population().ours_ids()
-        for c in ours:
-            self.bouge(c)
-
-        renard_jouer = self.get_population().renard_ids()
-        for c in renard_jouer:
-            self.bouge(c)
-        lapin_jouer = self.get_population().lapin_ids()
-        for c in lapin_jouer:
-            self.bouge(c)
-
-        case_vide = self.__grille.case_Vide()
-        for c in case_vide:
-            if self.get_envi(c) == Environnement.VIDE:
-                r = randint(0, 100)
-                if 0 <= r < self.PARAMETERS["Apparition herbe (%)"]:
-                    self.set_envi(c, Environnement.HERBE)
+        # Les ours, puis les renards, puis les lapins jouent. Le vieillissement des survivants
+        # d'une espèce est appliqué en une seule opération à la fin de son tour : aucun autre
+        # animal de la même espèce ne lit l'âge ou la nourriture d'un animal qui a déjà joué.
+        instrumentation = self.__instrumentation
+        for phase, listerIds in (("ours", self.get_population().ours_ids),
+                                 ("renards", self.get_population().renard_ids),
+                                 ("lapins", self.get_population().lapin_ids)):
+            if instrumentation is None:
+                survivants = [c for c in listerIds() if self.bouge(c, vieillir=False)]
+                self.__vieillit(survivants)
+            else:
+                debut = perf_counter()
+                joueurs = listerIds()
+                survivants = [c for c in joueurs if self.bouge(c, vieillir=False)]
+                milieu = perf_counter()
+                self.__vieillit(survivants)
+                fin = perf_counter()
+                instrumentation.ajouter(f"bouge {phase}", milieu - debut, len(joueurs))
+                instrumentation.ajouter(f"vieillissement {phase}", fin - milieu, len(survivants))
+        self.terminerGeneration()
+
+    def terminerGeneration(self):
+        """Repousse de l'herbe, génération suivante et notification des observateurs, une fois que tous
+        les animaux ont joué."""
+        instrumentation = self.__instrumentation
+        if instrumentation is None:
+            self.__grille.repousserHerbe(self.PARAMETERS["Apparition herbe (%)"])
+        else:
+            debut = perf_counter()
+            self.__grille.repousserHerbe(self.PARAMETERS["Apparition herbe (%)"])
+            instrumentation.ajouter("herbe", perf_counter() - debut)
+        self.__generation += 1
+        for observateur in self.__observateurs:
+            observateur(self)
+
+    def __vieillit(self, ids):
+        self.__population.vieillit(ids)
+        self.__population.reduireVie(ids)
 
     def estFiniJeu(self):
-        if len(self.get_population().renard_coord()) == 0:
+        effectifs = self.get_population().effectifs()
+        if effectifs[Population.RENARD] == 0:
             return True
-        if len(self.get_population().lapin_coord()) == 0:
+        if effectifs[Population.LAPIN] == 0:
             return True
 
         return False
@@ -346,37 +489,54 @@ class GameRules():
     def addOursAleatoire(self):
         quantite = self.PARAMETERS['Ours']
         for _ in range(quantite):
-            if (len(self.get_population().getIdsUtilisables()) > 0):
+            if (self.get_population().nbIdsUtilisables() > 0):
                 coord_hasard = self.__grille.coord_hasard()
                 nv_id = self.__population.addAnimal(2, coord_hasard)
                 self.set_id(coord_hasard, nv_id)
 
+    def grilleEspeces(self):
+        ids = self.__grille.get_grilleIds()
+        occupees = ids >= 0
+        especes = np.zeros(ids.shape, dtype=np.uint8)
+        especes[occupees] = self.__population.get_especes()[ids[occupees]] + 1
+        return especes
+
+    def estCreuse(self):
+        return isinstance(self.__grille, GrilleCreuse)
+
+    def exporterEtat(self):
+        if self.estCreuse():
+            raise ValueError("Une simulation sur grille creuse ne peut pas être sauvegardée")
+        return {"generation": self.__generation,
+                "grille": self.__grille.exporterEtat(),
+                "population": self.__population.exporterEtat(),
+                "rng": self.__rng.exporterEtat(),
+                "rngValidation": self.__rngValidation.bit_generator.state}
+
+    def restaurerEtat(self, etat):
+        if self.estCreuse():
+            raise ValueError("Une simulation sur grille creuse ne peut pas reprendre un état sauvegardé")
+        self.__grille.restaurerEtat(etat["grille"])
+        self.__population.restaurerEtat(etat["population"])
+        self.__rng.restaurerEtat(etat["rng"])
+        self.__rngValidation.bit_generator.state = etat["rngValidation"]
+        self.__generation = int(etat["generation"])
+
     def checkInvariant(self):
-        nbAnimauxGrille = 0
-        TAILLE = self.get_grille().get_TAILLE()
-        for i in range(TAILLE):
-            for j in range(TAILLE):
-                index = i*TAILLE + j
-                id_ = self.get_id(Coordonnee(i, j))
-                if id_ != -1:
-                    nbAnimauxGrille += 1
-                    assert self.get_population().getAnimal(id_).get_coord().get_coord() == (i, j)
-                    assert self.get_population().getAnimal(id_).get_id() == id_
-                if self.get_population().getAnimal(index) == -1:
-                    assert index in self.get_population().getIdsUtilisables()
-                else:
-                    assert index not in self.get_population().getIdsUtilisables()
-        animaux_coord = [coord.get_coord()
-                         for coord in self.get_population().animaux_coord()]
-        for i, (x, y) in enumerate(animaux_coord):
-            nbVu = 0
-            if animaux_coord[i] == (x, y):
-                nbVu += 1
-            assert nbVu == 1
-        try:
-            assert nbAnimauxGrille == len(self.get_population().animaux_ids())
-        except AssertionError as e:
-            print(nbAnimauxGrille, len(self.get_population().animaux_ids()))
+        verifierComplet(self.__grille, self.__population)
+
+    def valider(self):
+        niveau = self.__niveauValidation
+        if niveau == NiveauValidation.AUCUNE:
+            return
+        verifierCompteurs(self.__grille, self.__population)
+        if niveau == NiveauValidation.COMPTEURS or self.__generation % self.__periodeValidation != 0:
+            return
+        if niveau == NiveauValidation.ECHANTILLON:
+            verifierEchantillon(self.__grille, self.__population,
+                                self.__nbCasesValidation, self.__rngValidation)
+        else:
+            verifierComplet(self.__grille, self.__population)
 
     def __str__(self):
         return str(self.__grille)
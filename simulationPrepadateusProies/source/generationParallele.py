@@ -0,0 +1,285 @@
+"""
+Génération répartie sur plusieurs processus : la grille est découpée en bandes de lignes (toute la largeur).
+
+Pendant le tour d'une espèce, les bandes paires jouent d'abord, toutes en même temps, puis les bandes impaires.
+Chaque processus reçoit une copie de sa bande bordée d'une ligne de halo de chaque côté (la dernière ligne
+de la bande précédente, la première de la suivante) : un animal de la bande lit ses voisins et peut manger ou
+se déplacer dans le halo, jamais au-delà. Avec des bandes d'au moins deux lignes, deux bandes de même parité
+ne partagent aucune ligne (ni bande, ni halo) : leurs tours sont indépendants, sans conflit à arbitrer.
+
+Le processus principal reporte ensuite les bandes dans l'ordre : morts, survivants (âge, nourriture, case),
+puis naissances, dont les identifiants sont distribués par la population de la simulation. Les animaux qui
+ont migré dans le halo changent ainsi de bande pour la phase suivante.
+
+Chaque bande tire ses nombres aléatoires d'un flux propre (`np.random.SeedSequence` issue d'une graine tirée
+par génération et de (espèce, bande)) : pour une graine et un découpage donnés (par défaut, des bandes d'environ
+`HAUTEUR_BANDE` lignes), les résultats ne dépendent pas du nombre de processus. Ils diffèrent en revanche de ceux de `GameRules.generation`, où les
+animaux jouent tous à la suite avec un seul générateur. Le sexe et les gènes d'ours des nouveau-nés sont tirés
+par le générateur de la simulation, au report.
+
+Coût : chaque phase extrait les bandes, restaure leurs animaux dans la population de bande (gardée d'une phase
+à l'autre, voir `BANDES`) puis reporte morts, survivants et naissances ; chaque naissance est donc enregistrée
+deux fois, dans la bande puis dans la simulation. Avec un seul processus, une génération prend ainsi environ
+1,5 fois le temps de `GameRules.generation` (mesuré sur une grille de 300) ; avec plusieurs processus sur un
+seul cœur, c'est plus lent encore (transfert des bandes entre processus). Le gain n'est à attendre qu'avec
+plusieurs cœurs et de grandes grilles.
+
+Utilisation en Python (grille dense uniquement) :
+
+    with GenerationParallele(gameRules, nbProcessus=8) as parallele:
+        for _ in range(100):
+            parallele.generation()
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+import numpy as np
+from source.animal import Animal
+from source.gameRules import GameRules
+from source.genes import Genes
+from source.grille import Grille
+from source.population import Population
+from source.reserveAleatoire import ReserveAleatoire
+
+# Hauteur minimale d'une bande : en dessous, les halos de deux bandes de même parité se recouvrent
+HAUTEUR_MIN = 2
+# Hauteur des bandes par défaut : le découpage, donc les résultats, ne dépend pas du nombre de processus
+HAUTEUR_BANDE = 16
+
+# Gènes dans l'ordre des colonnes de `Population.get_genes()`
+GENES = sorted(Genes, key=lambda gene: gene.value)
+
+# Population de chaque bande, par (TAILLE, bande), gardée d'une phase à l'autre dans chaque processus : ses
+# colonnes gardent leur capacité et sont réécrites par `restaurerEtat`, son générateur est réinitialisé
+BANDES = {}
+
+
+class GrilleBande():
+
+    """Identifiants et environnements (à plat) d'une bande et de ses halos, lus par `GameRules.bouge`."""
+
+    def __init__(self, ids, envs):
+        self.__ids = ids
+        self.__envs = envs
+
+    def get_idsCases(self):
+        return self.__ids
+
+    def get_envCases(self):
+        return self.__envs
+
+
+class PopulationBande(Population):
+
+    """Population d'une bande : retient, dans l'ordre, les identifiants des animaux morts et nés."""
+
+    def __init__(self, TAILLE, rng=None, capaciteInitiale=None):
+        super().__init__(TAILLE, rng, capaciteInitiale)
+        self.morts = []
+        self.naissances = []
+
+    def recommencer(self, graine):
+        """Oublie les morts et naissances retenus et repart du flux aléatoire de [graine] (SeedSequence)."""
+        self.morts = []
+        self.naissances = []
+        # Même suite de tirages qu'un `ReserveAleatoire(np.random.default_rng(graine))` neuf
+        self.get_rng().restaurerEtat({"generateur": np.random.PCG64(graine).state, "reserve": []})
+
+    def deleteAnimal(self, animal):
+        self.morts.append(animal.get_id())
+        super().deleteAnimal(animal)
+
+    def addAnimalCase(self, sexe, case, genes=None):
+        id_ = super().addAnimalCase(sexe, case, genes)
+        self.naissances.append(id_)
+        return id_
+
+
+def fixerParametres(parametres, parametresAnimaux):
+    """Initialise les paramètres de classe d'un processus de travail."""
+    GameRules.PARAMETERS = parametres
+    Animal.PARAMETERS = parametresAnimaux
+
+
+def jouerBande(TAILLE, bande, ids, envs, colonnes, joueurs, graine):
+    """Fait jouer les animaux [joueurs] (identifiants locaux, dans l'ordre) de la bande [bande]. Exécutée dans
+    un processus de travail.
+
+    [ids] et [envs] sont les cases à plat de la bande et de ses halos, [ids] en identifiants locaux (indices
+    dans [colonnes], dont les cases sont relatives à la bande). Retourne (ids, envs, colonnes, morts, naissances)
+    après le tour, les colonnes couvrant aussi les nouveau-nés. Dans le processus courant, les colonnes
+    retournées sont des vues sur la population de la bande, valables jusqu'à son tour suivant.
+    """
+    nombre = len(colonnes["especes"])
+    population = BANDES.get((TAILLE, bande))
+    if population is None:
+        rng = ReserveAleatoire(np.random.default_rng(graine))
+        population = BANDES[TAILLE, bande] = PopulationBande(TAILLE, rng, capaciteInitiale=max(1, 2 * nombre))
+    population.recommencer(graine)
+    population.restaurerEtat(colonnes | {"allocateur": {"recycles": [], "prochainId": nombre}})
+    moteur = GameRules.moteur(GrilleBande(ids, envs), population, population.get_rng())
+    survivants = [joueur for joueur in joueurs if moteur.bouge(joueur, vieillir=False)]
+    population.vieillit(survivants)
+    population.reduireVie(survivants)
+    fin = population.get_prochainId()
+    colonnes = {"especes": population.get_especes()[:fin], "sexes": population.get_sexes()[:fin],
+                "ages": population.get_ages()[:fin], "foods": population.get_foods()[:fin],
+                "cases": population.get_cases()[:fin], "genes": population.get_genes()[:fin]}
+    return ids, envs, colonnes, population.morts, population.naissances
+
+
+class GenerationParallele():
+
+    """
+    Classe GenerationParallele
+
+    Exécute les générations d'un `GameRules` (grille dense) bande par bande sur plusieurs processus ; voir la
+    description du module.
+
+    Attributs :
+        - __gameRules (GameRules) : Simulation avancée.
+        - __bornes (np.ndarray) : Première ligne de chaque bande, suivie de TAILLE.
+        - __nbProcessus (int) : Nombre de processus de travail (1 : tout dans le processus courant).
+        - __executeur (ProcessPoolExecutor | None) : Processus de travail, créés à la première génération.
+
+    Méthodes :
+        - generation() : Avance la simulation d'une génération (puis `GameRules.terminerGeneration`).
+        - get_bornes() -> np.ndarray : Première ligne de chaque bande, suivie de TAILLE.
+        - fermer() : Arrête les processus de travail et libère les populations de bande (aussi à la sortie
+          d'un bloc `with`).
+    """
+
+    def __init__(self, gameRules, nbBandes=None, nbProcessus=None):
+        if not isinstance(gameRules.get_grille(), Grille):
+            raise ValueError("La génération parallèle demande une grille dense")
+        TAILLE = gameRules.get_grille().get_TAILLE()
+        self.__nbProcessus = nbProcessus if nbProcessus is not None else (os.cpu_count() or 1)
+        if nbBandes is None:
+            nbBandes = max(1, TAILLE // HAUTEUR_BANDE)
+        if not 1 <= nbBandes <= max(1, TAILLE // HAUTEUR_MIN):
+            raise ValueError(f"Nombre de bandes invalide : {nbBandes} (au plus TAILLE / {HAUTEUR_MIN})")
+        self.__gameRules = gameRules
+        self.__bornes = np.linspace(0, TAILLE, nbBandes + 1).astype(np.int64)
+        self.__executeur = None
+
+    # Getters
+
+    def get_bornes(self):
+        return self.__bornes
+
+    # Méthodes de classe
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+    def fermer(self):
+        if self.__executeur is not None:
+            self.__executeur.shutdown()
+            self.__executeur = None
+        BANDES.clear()
+
+    def __executer(self, listeArguments):
+        """Résultats de jouerBande pour chaque élément de [listeArguments], dans l'ordre des arguments."""
+        if self.__nbProcessus == 1 or len(listeArguments) <= 1:
+            return [jouerBande(*arguments) for arguments in listeArguments]
+        if self.__executeur is None:
+            self.__executeur = ProcessPoolExecutor(
+                max_workers=self.__nbProcessus, initializer=fixerParametres,
+                initargs=(GameRules.PARAMETERS, Animal.PARAMETERS))
+        return list(self.__executeur.map(jouerBande, *zip(*listeArguments)))
+
+    def generation(self):
+        gameRules = self.__gameRules
+        population = gameRules.get_population()
+        instrumentation = gameRules.get_instrumentation()
+        largeur = gameRules.get_grille().get_TAILLE() + 2
+        graine = int(gameRules.get_rng().get_generateur().integers(2**63))
+        for phase, espece, listerIds in (("ours", Population.OURS, population.ours_ids),
+                                         ("renards", Population.RENARD, population.renard_ids),
+                                         ("lapins", Population.LAPIN, population.lapin_ids)):
+            debut = perf_counter()
+            joueurs = np.array(listerIds(), dtype=np.int64)
+            lignes = population.get_cases()[joueurs] // largeur - 1
+            bandes = np.searchsorted(self.__bornes, lignes, side="right") - 1
+            # Joueurs fixés au début du tour : un animal qui migre dans une bande de l'autre parité n'y rejoue pas
+            joueursBandes = [joueurs[bandes == bande] for bande in range(len(self.__bornes) - 1)]
+            for parite in (0, 1):
+                numeros = range(parite, len(self.__bornes) - 1, 2)
+                extraits = [self.__extraire(bande, espece, joueursBandes[bande], graine) for bande in numeros]
+                resultats = self.__executer([arguments for arguments, _ in extraits])
+                for bande, (_, presents), resultat in zip(numeros, extraits, resultats):
+                    self.__reporter(bande, presents, *resultat)
+            if instrumentation is not None:
+                instrumentation.ajouter(f"bouge {phase}", perf_counter() - debut, len(joueurs))
+        gameRules.terminerGeneration()
+
+    def __tranche(self, bande):
+        """Tranche des cases à plat de la bande [bande] et de ses halos."""
+        largeur = self.__gameRules.get_grille().get_TAILLE() + 2
+        # Ligne x de la grille = ligne x + 1 du tableau bordé : le halo du haut est la ligne bordée bornes[bande]
+        return slice(int(self.__bornes[bande]) * largeur, (int(self.__bornes[bande + 1]) + 2) * largeur)
+
+    def __extraire(self, bande, espece, joueurs, graine):
+        """Retourne les arguments de jouerBande pour la bande [bande] et les identifiants (croissants) des animaux
+        de la bande et de ses halos, dont les identifiants locaux sont les indices."""
+        gameRules = self.__gameRules
+        population = gameRules.get_population()
+        grille = gameRules.get_grille()
+        tranche = self.__tranche(bande)
+        ids = grille.get_idsCases()[tranche].copy()
+        envs = grille.get_envCases()[tranche].copy()
+        occupees = ids >= 0
+        presents = np.unique(ids[occupees])
+        ids[occupees] = np.searchsorted(presents, ids[occupees])
+        # Les joueurs encore en vie et toujours dans la bande (un identifiant libéré a pu être redistribué)
+        largeur = grille.get_TAILLE() + 2
+        cases = population.get_cases()[joueurs]
+        restants = ((population.get_especes()[joueurs] == espece)
+                    & (cases >= tranche.start + largeur) & (cases < tranche.stop - largeur))
+        joueurs = joueurs[restants]
+        colonnes = {"especes": population.get_especes()[presents], "sexes": population.get_sexes()[presents],
+                    "ages": population.get_ages()[presents], "foods": population.get_foods()[presents],
+                    "cases": population.get_cases()[presents] - tranche.start,
+                    "genes": population.get_genes()[presents]}
+        joueursLocaux = np.searchsorted(presents, joueurs).tolist()
+        sequence = np.random.SeedSequence(graine, spawn_key=(espece, bande))
+        return (grille.get_TAILLE(), bande, ids, envs, colonnes, joueursLocaux, sequence), presents
+
+    def __reporter(self, bande, presents, ids, envs, colonnes, morts, naissances):
+        """Reporte dans la simulation le tour joué par la bande [bande]."""
+        gameRules = self.__gameRules
+        population = gameRules.get_population()
+        grille = gameRules.get_grille()
+        tranche = self.__tranche(bande)
+        nombre = len(presents)
+        especes = colonnes["especes"]
+        globaux = np.full(len(especes), -1, dtype=np.int64)
+
+        mortsPresents = [id_ for id_ in dict.fromkeys(morts) if id_ < nombre]
+        for id_ in mortsPresents:
+            population.deleteAnimal(population.getAnimal(presents[id_]))
+        survivants = np.ones(nombre, dtype=bool)
+        survivants[mortsPresents] = False
+        ids_ = presents[survivants]
+        population.get_ages()[ids_] = colonnes["ages"][:nombre][survivants]
+        population.get_foods()[ids_] = colonnes["foods"][:nombre][survivants]
+        population.get_cases()[ids_] = colonnes["cases"][:nombre][survivants] + tranche.start
+        globaux[:nombre][survivants] = ids_
+
+        # Un identifiant local peut naître, mourir et renaître : seul le dernier nouveau-né compte
+        nes = list(dict.fromkeys(reversed(naissances)))[::-1]
+        for id_ in nes:
+            if especes[id_] == -1 or population.nbIdsUtilisables() == 0:
+                continue
+            genes = dict(zip(GENES, colonnes["genes"][id_].tolist()))
+            globaux[id_] = population.addAnimalCase(int(especes[id_]), int(colonnes["cases"][id_]) + tranche.start,
+                                                    genes)
+
+        occupees = ids >= 0
+        ids[occupees] = globaux[ids[occupees]]
+        grille.get_idsCases()[tranche] = ids
+        grille.get_envCases()[tranche] = envs
@@ -28,21 +28,35 @@ class Genes(Enum):
             raise ValueError("Impossible")
 
 
-def create_random():
+# Nombre d'allèles tirés par create_random (allèles 0 à NB_ALLELES - 1)
+NB_ALLELES = 4
+
+# Générateur utilisé par les animaux créés hors d'une simulation (sans générateur fourni)
+GENERATEUR_DEFAUT = np.random.default_rng()
+
+
+def generateur(rng=None):
+    """Retourne [rng], ou le générateur par défaut du module si [rng] vaut None."""
+    return GENERATEUR_DEFAUT if rng is None else rng
+
+
+def create_random(rng=None):
+    rng = generateur(rng)
     # Définir les valeurs possibles et leurs probabilités
     dic = {}
     valeurs = [0, 1, 2, 3]
     probabilites = [0.25, 0.25, 0.25, 0.25]
     # Tirer une valeur
-    dic[Genes.MANGE] = float(np.random.choice(valeurs, p=probabilites))
-    dic[Genes.ESQUIVE] = float(np.random.choice(valeurs, p=probabilites))
+    dic[Genes.MANGE] = float(rng.choice(valeurs, p=probabilites))
+    dic[Genes.ESQUIVE] = float(rng.choice(valeurs, p=probabilites))
     return dic
 
 
-def genes_parent(gene1, gene2):
+def genes_parent(gene1, gene2, rng=None):
+    rng = generateur(rng)
     dic = {}
-    prem_gene = np.random.randint(0, 1)
+    prem_gene = rng.integers(0, 1)
     dic[Genes.MANGE] = gene1[Genes.MANGE] if prem_gene == 0 else gene2[Genes.MANGE]
-    deuxieme_gene = np.random.randint(0, 1)
+    deuxieme_gene = rng.integers(0, 1)
     dic[Genes.ESQUIVE] = gene1[Genes.ESQUIVE] if deuxieme_gene == 0 else gene2[Genes.ESQUIVE]
     return dic
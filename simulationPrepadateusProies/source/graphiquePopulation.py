@@ -0,0 +1,150 @@
+import numpy as np
+import pygame
+from source.serieTemporelle import SerieTemporelle
+
+
+class GraphiquePopulation():
+
+    """
+    Classe GraphiquePopulation
+
+    Courbes d'évolution des populations dessinées directement avec pygame, à coût constant quelle que soit
+    la durée de la simulation.
+
+    L'historique est une `SerieTemporelle` dont la capacité est le nombre de colonnes de pixels de la zone de
+    tracé : tout l'historique tient en au plus une colonne par pixel, chacune gardant le minimum et le maximum
+    des points qu'elle couvre, et les derniers points restent disponibles à pleine résolution (`dessiner` avec
+    une fenêtre). Ajouter un point coûte O(1) (amorti) ; dessiner coûte O(nombre de colonnes). Les oscillations
+    rapides restent visibles : chaque colonne est tracée du minimum au maximum de ses points.
+
+    Chaque série a sa propre échelle verticale (comme les lapins et les renards « scalés » du graphique
+    d'origine) : la première est graduée à gauche, la seconde à droite, les suivantes ne sont pas graduées.
+    Le cadre, le titre et la légende sont dessinés une seule fois, à la création.
+
+    Attributs :
+        - __series (tuple) : (nom, couleur) de chaque série.
+        - __historique (SerieTemporelle) : Points ajoutés, en mémoire bornée.
+        - __fond (pygame.Surface) : Cadre, titre et légende, dessinés à la création.
+
+    Méthodes :
+        - ajouter(valeurs) : Ajoute un point (une valeur par série).
+        - reinitialiser() : Efface l'historique.
+        - colonnes() -> (np.ndarray, np.ndarray) : Minimums et maximums des colonnes de tout l'historique
+          (séries x colonnes).
+        - dessiner(fenetre=None) -> pygame.Surface : Surface du graphique de tout l'historique, ou des
+          [fenetre] derniers points.
+    """
+
+    MARGE_GAUCHE = 60
+    MARGE_DROITE = 60
+    MARGE_HAUT = 40
+    MARGE_BAS = 40
+
+    def __init__(self, largeur, hauteur, series, couleurFond=(0, 0, 0), couleurTexte=(255, 255, 255),
+                 titre="Évolution des Populations"):
+        """[series] : (nom, couleur) de chaque série ; la première est graduée à gauche, la seconde à droite."""
+        self.__LARGEUR = largeur
+        self.__HAUTEUR = hauteur
+        self.__series = tuple(series)
+        self.__couleurFond = couleurFond
+        self.__couleurTexte = couleurTexte
+        self.__zone = pygame.Rect(GraphiquePopulation.MARGE_GAUCHE, GraphiquePopulation.MARGE_HAUT,
+                                  largeur - GraphiquePopulation.MARGE_GAUCHE - GraphiquePopulation.MARGE_DROITE,
+                                  hauteur - GraphiquePopulation.MARGE_HAUT - GraphiquePopulation.MARGE_BAS)
+        # Une colonne par pixel (nombre pair, pour les fusionner deux à deux)
+        nbColonnes = max(2, self.__zone.width - self.__zone.width % 2)
+        self.__historique = SerieTemporelle(len(self.__series), capacite=nbColonnes,
+                                            facteur=2, nbNiveaux=max(1, min(8, nbColonnes.bit_length())))
+        self.__font = pygame.font.Font(None, 20)
+        self.__fond = self.__dessinerFond(titre)
+        self.__surface = pygame.Surface((largeur, hauteur))
+
+    # Getters
+
+    def get_nbPoints(self):
+        return self.__historique.get_nbPoints()
+
+    def get_pas(self):
+        return self.__historique.get_pas()
+
+    def get_historique(self):
+        return self.__historique
+
+    # Méthodes de classe
+
+    def reinitialiser(self):
+        self.__historique.reinitialiser()
+
+    def ajouter(self, valeurs):
+        self.__historique.ajouter(valeurs)
+
+    def colonnes(self):
+        _, mins, maxs, _ = self.__historique.fenetre()
+        return mins.T, maxs.T
+
+    def __texte(self, texte, couleur=None):
+        return self.__font.render(texte, True, self.__couleurTexte if couleur is None else couleur)
+
+    def __dessinerFond(self, titre):
+        fond = pygame.Surface((self.__LARGEUR, self.__HAUTEUR))
+        fond.fill(self.__couleurFond)
+        pygame.draw.rect(fond, self.__couleurTexte, self.__zone.inflate(2, 2), 1)
+        texteTitre = self.__texte(titre)
+        fond.blit(texteTitre, (self.__LARGEUR // 2 - texteTitre.get_width() // 2, 10))
+        # Légende : une ligne par série, en haut à gauche de la zone de tracé
+        for i, (nom, couleur) in enumerate(self.__series):
+            y = self.__zone.top + 8 + 16 * i
+            pygame.draw.line(fond, couleur, (self.__zone.left + 6, y), (self.__zone.left + 22, y), 2)
+            fond.blit(self.__texte(nom), (self.__zone.left + 26, y - 7))
+        texteTemps = self.__texte("Temps")
+        fond.blit(texteTemps, (self.__zone.centerx - texteTemps.get_width() // 2, self.__HAUTEUR - 18))
+        return fond
+
+    def __dessinerGraduations(self, surface, maximums):
+        """Graduations 0, max/2 et max de la première série à gauche, de la seconde à droite."""
+        zone = self.__zone
+        for i, maximum in enumerate(maximums[:2]):
+            couleur = self.__series[i][1]
+            for fraction in (0, 0.5, 1):
+                texte = self.__texte(str(int(round(maximum * fraction))), couleur)
+                y = zone.bottom - fraction * zone.height - texte.get_height() // 2
+                x = zone.left - texte.get_width() - 6 if i == 0 else zone.right + 6
+                surface.blit(texte, (x, y))
+
+    def dessiner(self, fenetre=None):
+        surface = self.__surface
+        surface.blit(self.__fond, (0, 0))
+        zone = self.__zone
+        nbPoints = self.get_nbPoints()
+        debuts, mins, maxs, _ = self.__historique.fenetre(fenetre)
+        mins, maxs = mins.T, maxs.T
+        n = mins.shape[1]
+        if n == 0:
+            return surface
+        premier = nbPoints - min(nbPoints, fenetre) if fenetre is not None else 0
+
+        # Échelle de chaque série : son maximum sur les points affichés (au moins 1)
+        maximums = [max(int(m), 1) for m in maxs.max(axis=1)]
+        self.__dessinerGraduations(surface, maximums)
+        texteFin = self.__texte(str(nbPoints - 1))
+        surface.blit(texteFin, (zone.right - texteFin.get_width(), zone.bottom + 4))
+        surface.blit(self.__texte(str(premier)), (zone.left, zone.bottom + 4))
+
+        # Abscisse de chaque colonne : premier point qu'elle couvre, la fenêtre occupant toute la largeur
+        # (la première colonne peut commencer avant la fenêtre)
+        debuts = np.maximum(debuts, premier) - premier
+        xs = zone.left + (zone.width - 1) * debuts // max(nbPoints - 1 - premier, 1)
+        for i, (nom, couleur) in enumerate(self.__series):
+            hauts = zone.bottom - 1 - (zone.height - 1) * maxs[i] // maximums[i]
+            bas = zone.bottom - 1 - (zone.height - 1) * mins[i] // maximums[i]
+            if n == 1:
+                pygame.draw.line(surface, couleur, (xs[0], bas[0]), (xs[0], hauts[0]))
+                continue
+            # Ligne brisée bas -> haut de chaque colonne : enveloppe min / max, courbe simple si min == max
+            points = np.empty((2 * n, 2), dtype=np.int64)
+            points[0::2, 0] = xs
+            points[1::2, 0] = xs
+            points[0::2, 1] = bas
+            points[1::2, 1] = hauts
+            pygame.draw.lines(surface, couleur, False, points.tolist())
+        return surface
@@ -1,6 +1,10 @@
 from source.coordonnee import *
 from source.environnement import *
-from random import randint
+import numpy as np
+from source.genes import generateur
+
+# Correspondance valeur stockée dans le tableau -> membre de l'énumération
+ENVIRONNEMENT_PAR_VALEUR = {e.value: e for e in Environnement}
 
 
 class Grille():
@@ -28,8 +32,29 @@ class Grille():
         Objet représentant la grille de jeu, contenant des informations sur les animaux et l'environnement.
     - __population : Population
         Objet contenant la liste des animaux, leurs positions et leurs propriétés (vie, âge, sexe, etc.).
-      __grilleEnvironnement : 
-        Objet contenant la liste des  environnements
+    - __grilleId : numpy.ndarray (int32, TAILLE x TAILLE)
+        Identifiant de l'animal présent sur chaque case (-1 si la case est libre).
+    - __grilleEnvironnement : numpy.ndarray (uint8, TAILLE x TAILLE)
+        Valeur (`Environnement.value`) de l'environnement de chaque case.
+    Ces deux tableaux sont des vues sur l'intérieur de tableaux (TAILLE+2 x TAILLE+2) entourés d'une 
+    bordure sentinelle (identifiant `Grille.BORD`), lue à plat par le moteur via les index de case 
+    (voir `coordonnee.indexCase` et `coordonnee.decalagesVoisins`).
+    - __rng : numpy.random.Generator
+        Générateur de la simulation, utilisé par `coord_hasard` et `repousserHerbe`.
+
+    Accès groupés (sans créer de `Coordonnee`) :
+    --------------------------------------------
+    - get_grilleIds() / get_grilleEnvironnements() : vues sur les tableaux numpy.
+    - masque_vide() : cases sans animal.
+    - masque_vide_herbe() : cases sans animal et contenant de l'herbe.
+    - masque_vide_sol_nu() : cases sans animal dont l'environnement est VIDE.
+    - casesOccupees() : index de case et identifiants des cases occupées par un animal.
+    - nbHerbe() : nombre de cases d'herbe.
+    - get_idsCases() / get_envCases() : vues à plat sur les tableaux bordés, indexées par index de case.
+    - coordonnee(x, y) : Coordonnee partagée de la case (pool de la grille, sans allocation répétée).
+    - get_pool() : `PoolCoordonnees` propre à la grille (libéré avec elle), prêté à la `Population`.
+    - repousserHerbe(pourcentage) : repousse de l'herbe sur ces cases en un seul tirage.
+    - exporterEtat() / restaurerEtat(etat) : copie des tableaux d'identifiants et d'environnements, et reprise.
 
     Méthodes principales :
     ----------------------
@@ -66,34 +91,105 @@ class Grille():
         Retourne une représentation textuelle de la grille de jeu, utile pour afficher l'état actuel du jeu.
     """
 
-    def __init__(self, TAILLE):
+    # Identifiant des cases sentinelles qui entourent la grille (ni libres, ni occupées par un animal)
+    BORD = -2
+
+    def __init__(self, TAILLE, rng=None):
         self.__TAILLE = TAILLE
-        self.__grilleId = [[-1 for _ in range(TAILLE)] for _ in range(TAILLE)]
-        self.__grilleEnvironnement = [
-            [Environnement(1) for _ in range(TAILLE)] for _ in range(TAILLE)]
+        self.__rng = generateur(rng)
+        idsBordes = np.full((TAILLE + 2, TAILLE + 2), Grille.BORD, dtype=np.int32)
+        envBordes = np.full((TAILLE + 2, TAILLE + 2),
+                            Environnement.VIDE.value, dtype=np.uint8)
+        self.__grilleId = idsBordes[1:-1, 1:-1]
+        self.__grilleId[...] = -1
+        self.__grilleEnvironnement = envBordes[1:-1, 1:-1]
+        # Vues à plat (les tableaux bordés sont contigus)
+        self.__idsCases = idsBordes.reshape(-1)
+        self.__envCases = envBordes.reshape(-1)
+        self.__pool = PoolCoordonnees(TAILLE)
 
     # Getters
 
+    def get_pool(self):
+        return self.__pool
+
     def get_TAILLE(self):
         return self.__TAILLE
 
     def get_id(self, coord):
         x, y = coord.get_coord()
-        return self.__grilleId[x][y]
+        return int(self.__grilleId[x, y])
 
     def get_environnement(self, coord):
         x, y = coord.get_coord()
-        return self.__grilleEnvironnement[x][y]
+        return ENVIRONNEMENT_PAR_VALEUR[int(self.__grilleEnvironnement[x, y])]
+
+    def get_grilleIds(self):
+        """Retourne le tableau (vue modifiable) des identifiants, indexé par [x, y]."""
+        return self.__grilleId
+
+    def get_grilleEnvironnements(self):
+        """Retourne le tableau (vue modifiable) des valeurs d'environnement, indexé par [x, y]."""
+        return self.__grilleEnvironnement
+
+    def get_idsCases(self):
+        """Retourne la vue à plat des identifiants, bordure comprise, indexée par index de case."""
+        return self.__idsCases
+
+    def get_envCases(self):
+        """Retourne la vue à plat des valeurs d'environnement, bordure comprise, indexée par index de case."""
+        return self.__envCases
+
+    def indexCase(self, x, y):
+        return indexCase(x, y, self.__TAILLE)
+
+    def coordCase(self, case):
+        return coordCase(case, self.__TAILLE)
+
+    def coordonnee(self, x, y):
+        """Retourne la Coordonnee partagée (issue du pool de la grille) de la case (x, y)."""
+        return self.__pool.get(x, y)
+
+    def masque_vide(self):
+        """Retourne le masque booléen des cases sans animal."""
+        return self.__grilleId == -1
+
+    def masque_vide_herbe(self):
+        """Retourne le masque booléen des cases sans animal contenant de l'herbe."""
+        return (self.__grilleId == -1) & (self.__grilleEnvironnement == Environnement.HERBE.value)
+
+    def masque_vide_sol_nu(self):
+        """Retourne le masque booléen des cases sans animal dont l'environnement est VIDE."""
+        return (self.__grilleId == -1) & (self.__grilleEnvironnement == Environnement.VIDE.value)
+
+    def casesOccupees(self):
+        """Retourne (index de case, identifiant) des cases occupées par un animal, par index de case croissant."""
+        cases = np.flatnonzero(self.__idsCases >= 0)
+        return cases, self.__idsCases[cases]
+
+    def nbHerbe(self):
+        return int(np.count_nonzero(self.__grilleEnvironnement == Environnement.HERBE.value))
+
+    def exporterEtat(self):
+        """Retourne une copie des tableaux {"ids", "environnements"} (TAILLE x TAILLE)."""
+        return {"ids": self.__grilleId.copy(), "environnements": self.__grilleEnvironnement.copy()}
 
     # Setters
 
+    def restaurerEtat(self, etat):
+        """Reprend des tableaux produits par `exporterEtat` (même TAILLE), bordure comprise."""
+        if etat["ids"].shape != self.__grilleId.shape or etat["environnements"].shape != self.__grilleId.shape:
+            raise ValueError("Taille de grille incompatible")
+        self.__grilleId[...] = etat["ids"]
+        self.__grilleEnvironnement[...] = etat["environnements"]
+
     def set_animalId(self, coord, id):
         if not isinstance(coord, Coordonnee):
             raise TypeError("Argument [coord] doit être de type Coordonnée")
         x, y = coord.get_coord()
         if not (0 <= x < self.get_TAILLE() and 0 <= y < self.get_TAILLE()):
             raise ValueError("Coordonnée(s) invalide(s)")
-        self.__grilleId[x][y] = id
+        self.__grilleId[x, y] = id
 
     def set_environnement(self, coord, environnement):
         if not isinstance(environnement, Environnement):
@@ -104,7 +200,7 @@ class Grille():
         x, y = coord.get_coord()
         if not (0 <= x < self.get_TAILLE() and 0 <= y < self.get_TAILLE()):
             raise ValueError("Coordonnée(s) invalide(s)")
-        self.__grilleEnvironnement[x][y] = environnement
+        self.__grilleEnvironnement[x, y] = environnement.value
 
     # Méthodes de classe
 
@@ -112,34 +208,37 @@ class Grille():
         x, y = coord.get_coord()
         if not (0 <= x < self.get_TAILLE() and 0 <= y < self.get_TAILLE()):
             raise ValueError("Coordonnée(s) invalide(s)")
-        self.__grilleId[x][y] = -1
+        self.__grilleId[x, y] = -1
 
     def coord_hasard(self):
-        available = []
-        for i in range(self.__TAILLE):
-            for j in range(self.__TAILLE):
-                if self.__grilleId[i][j] == -1:
-                    available.append((i, j))
+        available = np.flatnonzero(self.masque_vide())
         if (len(available) == 0):
             raise ValueError("Erreur logique ")
-        hasard = randint(0, len(available)-1)
-        x, y = available[hasard]
-        return Coordonnee(x, y)
+        hasard = self.__rng.integers(len(available))
+        x, y = divmod(int(available[hasard]), self.__TAILLE)
+        return self.__pool.get(x, y)
+
+    def repousserHerbe(self, pourcentage):
+        """Fait pousser de l'herbe sur les cases sans animal dont l'environnement est VIDE.
+
+        Un seul tirage vectorisé remplace le `randint(0, 100)` fait auparavant case par case :
+        chaque case pousse avec la même probabilité `pourcentage / 101`.
+        """
+        masque = self.masque_vide_sol_nu()
+        tirages = self.__rng.integers(0, 101, size=np.count_nonzero(masque))
+        pousse = np.zeros_like(masque)
+        pousse[masque] = tirages < pourcentage
+        self.__grilleEnvironnement[pousse] = Environnement.HERBE.value
 
     def case_Vide(self):
-        available = []
-        for i in range(self.__TAILLE):
-            for j in range(self.__TAILLE):
-                if self.__grilleId[i][j] == -1:
-                    available.append(Coordonnee(i, j))
-        return available
+        return [self.__pool.get(x, y) for x, y in np.argwhere(self.masque_vide()).tolist()]
 
     def __str__(self):
         res = f""
         for x in range(self.get_TAILLE()):
             res += "|"
             for y in range(self.get_TAILLE()):
-                res += f" {self.get_id(Coordonnee(x, y))
-                           } {self.get_environnement(Coordonnee(x, y)).__str__()} |"
+                environnement = ENVIRONNEMENT_PAR_VALEUR[int(self.__grilleEnvironnement[x, y])]
+                res += f" {self.__grilleId[x, y]} {environnement} |"
             res += "\n"
         return res
@@ -0,0 +1,381 @@
+import math
+import numpy as np
+from source.coordonnee import *
+from source.environnement import *
+from source.genes import generateur
+from source.grille import Grille, ENVIRONNEMENT_PAR_VALEUR
+
+VIDE = Environnement.VIDE.value
+
+
+class CasesCreuses():
+
+    """
+    Accès par index de case (voir `coordonnee.indexCase`) aux identifiants ou aux environnements d'une
+    `GrilleCreuse`, comme les vues à plat `Grille.get_idsCases` et `Grille.get_envCases` : le moteur (`bouge`)
+    lit les voisins d'une case en ajoutant les décalages de `decalagesVoisins`, sans savoir dans quelle tuile
+    ils tombent. La lecture accepte un index ou un tableau d'index ; l'écriture, un index.
+    """
+
+    def __init__(self, lire, lireTableau, ecrire):
+        self.__lire = lire
+        self.__lireTableau = lireTableau
+        self.__ecrire = ecrire
+
+    def __getitem__(self, case):
+        if case.__class__ is int:
+            return self.__lire(case)
+        if isinstance(case, np.integer):
+            return self.__lire(int(case))
+        return self.__lireTableau(np.asarray(case, dtype=np.int64))
+
+    def __setitem__(self, case, valeur):
+        self.__ecrire(int(case), valeur)
+
+
+class GrilleCreuse():
+
+    """
+    Classe GrilleCreuse
+
+    Grille de TAILLE x TAILLE découpée en tuiles de TAILLE_TUILE x TAILLE_TUILE cases (une puissance de 2),
+    allouées à la demande :
+    une tuile sans animal dont toutes les cases ont le même environnement n'occupe aucune mémoire. La mémoire
+    suit la zone où vivent les animaux, pas TAILLE², ce qui permet des mondes de 20000 x 20000 cases peuplés
+    de quelques centaines de milliers d'animaux (avec une `Population` créée avec `capaciteInitiale`).
+
+    Même interface que `Grille` pour le moteur : identifiants et environnements par index de case (les mêmes
+    index que `Grille`, bordure comprise : une case hors de la grille vaut `Grille.BORD`), voisinage par
+    décalages constants, cases occupées, repousse de l'herbe, tirage d'une case libre.
+
+    Environnement d'une tuile non allouée :
+        L'herbe ne disparaît que mangée par un lapin, donc sur une tuile allouée ; sur une tuile sans animal,
+        chaque case de sol nu devient herbe avec la probabilité p = pourcentage / 101 à chaque `repousserHerbe`.
+        Une case d'une tuile non allouée depuis la génération t0, herbe avec la probabilité g0 à cette date,
+        est donc herbe avec la probabilité 1 - (1 - g0)(1 - p)^(t - t0), indépendamment des autres cases. La
+        grille garde pour chaque tuile (g0, log du produit des (1 - p) à t0), et tire l'environnement de ses
+        cases selon cette loi quand la tuile est allouée. Au départ, g0 est la densité d'herbe initiale ; une
+        tuile libérée (sans animal, toute en herbe ou toute en sol nu) repart de g0 = 1 ou g0 = 0.
+        La simulation suit la même loi qu'avec `Grille`, mais pas les mêmes tirages : à graine égale, les deux
+        grilles ne donnent pas la même simulation.
+
+    Attributs :
+        - __TAILLE (int) : Taille de la grille.
+        - __TAILLE_TUILE (int) : Taille d'une tuile.
+        - __nbTuilesCote (int) : Nombre de tuiles par côté.
+        - __emplacements (np.ndarray int32) : Emplacement de chaque tuile (numéro tx * nbTuilesCote + ty) dans
+          les tableaux des tuiles allouées, -1 si elle n'est pas allouée.
+        - __ids, __envs (np.ndarray) : Identifiants et environnements des tuiles allouées ([emplacement, case de
+          la tuile]) ; les cases hors de la grille et les emplacements libres valent `Grille.BORD`.
+        - __tuiles (np.ndarray int64) : Numéro de la tuile de chaque emplacement (-1 si libre).
+        - __nbEmplacements (int) : Nombre d'emplacements utilisés (les suivants sont réservés).
+        - __emplacementsLibres (list) : Emplacements libérés, réutilisés en premier.
+        - __densites, __logsSolNu (np.ndarray float64) : g0 et log du produit des (1 - p) de chaque tuile.
+        - __logSolNu (float) : Log du produit des (1 - p) de toutes les repousses depuis le début.
+        - __rng : Générateur de la simulation.
+
+    Méthodes :
+        - get_idsCases() / get_envCases() -> CasesCreuses : Accès par index de case.
+        - casesOccupees() -> (np.ndarray, np.ndarray) : Index de case et identifiants des cases occupées.
+        - repousserHerbe(pourcentage) : Repousse de l'herbe sur les tuiles allouées, libère les tuiles uniformes.
+        - nbHerbe() -> int : Nombre de cases d'herbe (exact sur les tuiles allouées, espérance ailleurs).
+        - coord_hasard() -> Coordonnee : Case libre tirée au hasard.
+        - get_grilleIds() -> np.ndarray : Copie dense des identifiants (TAILLE x TAILLE, pour les petites grilles).
+        - get_nbTuiles() -> int : Nombre de tuiles allouées.
+        - get_pool() -> PoolCoordonnees : Pool des Coordonnee de la grille (seulement les cases demandées).
+    Pas de vue dense des environnements ni de sauvegarde : l'affichage, l'enregistrement de trajectoire et
+    `sauvegarde` restent réservés à `Grille`.
+    """
+
+    TAILLE_TUILE = 16
+
+    def __init__(self, TAILLE, rng=None, densiteHerbe=0.0, tailleTuile=None):
+        self.__TAILLE = TAILLE
+        self.__TAILLE_TUILE = GrilleCreuse.TAILLE_TUILE if tailleTuile is None else tailleTuile
+        if self.__TAILLE_TUILE < 1 or self.__TAILLE_TUILE & (self.__TAILLE_TUILE - 1):
+            raise ValueError("La taille des tuiles doit être une puissance de 2")
+        # Une case (x, y) est dans la tuile (x >> decalage, y >> decalage), à la position (x & masque, y & masque)
+        self.__decalage = self.__TAILLE_TUILE.bit_length() - 1
+        self.__masque = self.__TAILLE_TUILE - 1
+        self.__rng = generateur(rng)
+        self.__nbTuilesCote = -(-TAILLE // self.__TAILLE_TUILE)
+        nbTuiles = self.__nbTuilesCote * self.__nbTuilesCote
+        self.__emplacements = np.full(nbTuiles, -1, dtype=np.int32)
+        self.__densites = np.full(nbTuiles, float(densiteHerbe))
+        self.__logsSolNu = np.zeros(nbTuiles)
+        self.__logSolNu = 0.0
+        taille = self.__TAILLE_TUILE * self.__TAILLE_TUILE
+        self.__ids = np.full((0, taille), Grille.BORD, dtype=np.int32)
+        self.__envs = np.full((0, taille), Environnement.VIDE.value, dtype=np.uint8)
+        self.__tuiles = np.zeros(0, dtype=np.int64)
+        self.__nbEmplacements = 0
+        self.__emplacementsLibres = []
+        # Position (x, y) dans la grille de chaque case d'une tuile, relative au coin de la tuile
+        self.__decalagesX, self.__decalagesY = np.divmod(np.arange(taille), self.__TAILLE_TUILE)
+        self.__idsCases = CasesCreuses(self.__lireId, self.__lireIds, self.__ecrireId)
+        self.__envCases = CasesCreuses(self.__lireEnv, self.__lireEnvs, self.__ecrireEnv)
+        self.__pool = PoolCoordonnees(TAILLE)
+
+    # Getters
+
+    def get_pool(self):
+        return self.__pool
+
+    def get_TAILLE(self):
+        return self.__TAILLE
+
+    def get_TAILLE_TUILE(self):
+        return self.__TAILLE_TUILE
+
+    def get_nbTuiles(self):
+        return self.__nbEmplacements - len(self.__emplacementsLibres)
+
+    def get_id(self, coord):
+        x, y = coord.get_coord()
+        return int(self.__lireId(indexCase(x, y, self.__TAILLE)))
+
+    def get_environnement(self, coord):
+        x, y = coord.get_coord()
+        return ENVIRONNEMENT_PAR_VALEUR[int(self.__lireEnv(indexCase(x, y, self.__TAILLE)))]
+
+    def get_idsCases(self):
+        return self.__idsCases
+
+    def get_envCases(self):
+        return self.__envCases
+
+    def get_grilleIds(self):
+        """Retourne une copie dense (TAILLE x TAILLE) des identifiants, en O(TAILLE²)."""
+        grille = np.full((self.__TAILLE, self.__TAILLE), -1, dtype=np.int32)
+        cases, ids = self.casesOccupees()
+        x, y = np.divmod(cases, self.__TAILLE + 2)
+        grille[x - 1, y - 1] = ids
+        return grille
+
+    def indexCase(self, x, y):
+        return indexCase(x, y, self.__TAILLE)
+
+    def coordCase(self, case):
+        return coordCase(case, self.__TAILLE)
+
+    def coordonnee(self, x, y):
+        return self.__pool.get(x, y)
+
+    def casesOccupees(self):
+        """Retourne (index de case, identifiant) des cases occupées par un animal, par index de case croissant."""
+        emplacements, positions = np.nonzero(self.__ids >= 0)
+        cases = self.__cases(self.__tuiles[emplacements], positions)
+        ordre = np.argsort(cases)
+        return cases[ordre], self.__ids[emplacements, positions][ordre]
+
+    def nbHerbe(self):
+        """Nombre de cases d'herbe : exact sur les tuiles allouées, espérance (arrondie) sur les autres."""
+        herbe = int(np.count_nonzero((self.__envs == Environnement.HERBE.value) & (self.__ids != Grille.BORD)))
+        absentes = np.flatnonzero(self.__emplacements < 0)
+        probabilites = 1 - (1 - self.__densites[absentes]) * np.exp(self.__logSolNu - self.__logsSolNu[absentes])
+        return herbe + int(round(float(np.dot(probabilites, self.__nbCasesTuiles(absentes)))))
+
+    # Setters
+
+    def set_animalId(self, coord, id):
+        if not isinstance(coord, Coordonnee):
+            raise TypeError("Argument [coord] doit être de type Coordonnée")
+        x, y = coord.get_coord()
+        if not (0 <= x < self.__TAILLE and 0 <= y < self.__TAILLE):
+            raise ValueError("Coordonnée(s) invalide(s)")
+        self.__ecrireId(indexCase(x, y, self.__TAILLE), id)
+
+    def set_environnement(self, coord, environnement):
+        if not isinstance(environnement, Environnement):
+            raise TypeError(
+                "Argument [environnement] doit être de type Environnement")
+        if not isinstance(coord, Coordonnee):
+            raise TypeError("Argument [coord] doit être de type Coordonnée")
+        x, y = coord.get_coord()
+        if not (0 <= x < self.__TAILLE and 0 <= y < self.__TAILLE):
+            raise ValueError("Coordonnée(s) invalide(s)")
+        self.__ecrireEnv(indexCase(x, y, self.__TAILLE), environnement.value)
+
+    # Méthodes de classe
+
+    def removeId(self, coord):
+        x, y = coord.get_coord()
+        if not (0 <= x < self.__TAILLE and 0 <= y < self.__TAILLE):
+            raise ValueError("Coordonnée(s) invalide(s)")
+        self.__ecrireId(indexCase(x, y, self.__TAILLE), -1)
+
+    def __localiser(self, case):
+        """Retourne (numéro de tuile, position dans la tuile) de la case, ou None hors de la grille."""
+        x, y = divmod(case, self.__TAILLE + 2)
+        x -= 1
+        y -= 1
+        if not (0 <= x < self.__TAILLE and 0 <= y < self.__TAILLE):
+            return None
+        decalage, masque = self.__decalage, self.__masque
+        return ((x >> decalage) * self.__nbTuilesCote + (y >> decalage),
+                ((x & masque) << decalage) + (y & masque))
+
+    def __localiserTableau(self, cases):
+        """Version vectorisée de `__localiser` : (dans la grille, numéro de tuile, position dans la tuile)."""
+        x, y = np.divmod(cases, self.__TAILLE + 2)
+        x -= 1
+        y -= 1
+        dedans = (x >= 0) & (x < self.__TAILLE) & (y >= 0) & (y < self.__TAILLE)
+        x, y = np.where(dedans, x, 0), np.where(dedans, y, 0)
+        tx, ox = np.divmod(x, self.__TAILLE_TUILE)
+        ty, oy = np.divmod(y, self.__TAILLE_TUILE)
+        return dedans, tx * self.__nbTuilesCote + ty, ox * self.__TAILLE_TUILE + oy
+
+    def __cases(self, tuiles, positions):
+        """Index de case des positions [positions] des tuiles [tuiles]."""
+        tx, ty = np.divmod(tuiles, self.__nbTuilesCote)
+        x = tx * self.__TAILLE_TUILE + self.__decalagesX[positions]
+        y = ty * self.__TAILLE_TUILE + self.__decalagesY[positions]
+        return (x + 1) * (self.__TAILLE + 2) + y + 1
+
+    def __nbCasesTuiles(self, tuiles):
+        """Nombre de cases de la grille dans chacune des tuiles [tuiles] (moins sur le dernier rang)."""
+        tx, ty = np.divmod(tuiles, self.__nbTuilesCote)
+        cote = self.__TAILLE_TUILE
+        return (np.minimum(cote, self.__TAILLE - tx * cote) * np.minimum(cote, self.__TAILLE - ty * cote))
+
+    def __allouer(self, tuile):
+        """Alloue la tuile [tuile] et tire l'environnement de ses cases (voir la docstring de la classe)."""
+        if self.__emplacementsLibres:
+            emplacement = self.__emplacementsLibres.pop()
+        else:
+            emplacement = self.__nbEmplacements
+            if emplacement == len(self.__ids):
+                ajout = max(16, len(self.__ids))
+                self.__ids = np.concatenate((self.__ids, np.full(
+                    (ajout, self.__ids.shape[1]), Grille.BORD, dtype=np.int32)))
+                self.__envs = np.concatenate((self.__envs, np.full(
+                    (ajout, self.__envs.shape[1]), Environnement.VIDE.value, dtype=np.uint8)))
+                self.__tuiles = np.concatenate((self.__tuiles, np.full(ajout, -1, dtype=np.int64)))
+            self.__nbEmplacements += 1
+        tx, ty = divmod(tuile, self.__nbTuilesCote)
+        dedans = ((tx * self.__TAILLE_TUILE + self.__decalagesX < self.__TAILLE)
+                  & (ty * self.__TAILLE_TUILE + self.__decalagesY < self.__TAILLE))
+        probabiliteSolNu = (1 - self.__densites[tuile]) * math.exp(self.__logSolNu - self.__logsSolNu[tuile])
+        herbe = self.__rng.random(size=len(dedans)) >= probabiliteSolNu
+        self.__ids[emplacement] = np.where(dedans, -1, Grille.BORD)
+        self.__envs[emplacement] = np.where(herbe & dedans, Environnement.HERBE.value, Environnement.VIDE.value)
+        self.__tuiles[emplacement] = tuile
+        self.__emplacements[tuile] = emplacement
+        return emplacement
+
+    def __lireId(self, case):
+        # Appelée pour chaque voisin de chaque animal : `__localiser` est recopiée ici
+        x, y = divmod(case, self.__TAILLE + 2)
+        x -= 1
+        y -= 1
+        if not (0 <= x < self.__TAILLE and 0 <= y < self.__TAILLE):
+            return Grille.BORD
+        decalage, masque = self.__decalage, self.__masque
+        emplacement = self.__emplacements[(x >> decalage) * self.__nbTuilesCote + (y >> decalage)]
+        if emplacement < 0:
+            return -1
+        return self.__ids[emplacement, ((x & masque) << decalage) + (y & masque)]
+
+    def __lireIds(self, cases):
+        dedans, tuiles, positions = self.__localiserTableau(cases)
+        emplacements = self.__emplacements[tuiles]
+        ids = np.where(dedans, -1, Grille.BORD).astype(np.int32)
+        allouees = dedans & (emplacements >= 0)
+        ids[allouees] = self.__ids[emplacements[allouees], positions[allouees]]
+        return ids
+
+    def __ecrireId(self, case, id_):
+        tuile = self.__localiser(case)
+        if tuile is None:
+            raise ValueError("Case hors de la grille")
+        emplacement = self.__emplacements[tuile[0]]
+        if emplacement < 0:
+            if id_ == -1:
+                return
+            emplacement = self.__allouer(tuile[0])
+        self.__ids[emplacement, tuile[1]] = id_
+
+    def __lireEnv(self, case):
+        # Appelée pour chaque voisin libre de chaque animal : `__localiser` est recopiée ici
+        x, y = divmod(case, self.__TAILLE + 2)
+        x -= 1
+        y -= 1
+        if not (0 <= x < self.__TAILLE and 0 <= y < self.__TAILLE):
+            return VIDE
+        decalage, masque = self.__decalage, self.__masque
+        tuile = (x >> decalage) * self.__nbTuilesCote + (y >> decalage)
+        emplacement = self.__emplacements[tuile]
+        if emplacement < 0:
+            emplacement = self.__allouer(tuile)
+        return self.__envs[emplacement, ((x & masque) << decalage) + (y & masque)]
+
+    def __lireEnvs(self, cases):
+        dedans, tuiles, positions = self.__localiserTableau(cases)
+        for tuile in np.unique(tuiles[dedans & (self.__emplacements[tuiles] < 0)]).tolist():
+            self.__allouer(tuile)
+        envs = np.full(cases.shape, Environnement.VIDE.value, dtype=np.uint8)
+        envs[dedans] = self.__envs[self.__emplacements[tuiles[dedans]], positions[dedans]]
+        return envs
+
+    def __ecrireEnv(self, case, valeur):
+        tuile = self.__localiser(case)
+        if tuile is None:
+            raise ValueError("Case hors de la grille")
+        emplacement = self.__emplacements[tuile[0]]
+        if emplacement < 0:
+            emplacement = self.__allouer(tuile[0])
+        self.__envs[emplacement, tuile[1]] = valeur
+
+    def repousserHerbe(self, pourcentage):
+        """Fait pousser de l'herbe sur les cases sans animal dont l'environnement est VIDE, comme
+        `Grille.repousserHerbe`, sur les tuiles allouées ; les autres suivent la loi de la docstring de la classe.
+
+        Les tuiles sans animal devenues uniformes (toute en herbe ou toute en sol nu) sont ensuite libérées.
+        """
+        ids = self.__ids[:self.__nbEmplacements]
+        envs = self.__envs[:self.__nbEmplacements]
+        masque = (ids == -1) & (envs == Environnement.VIDE.value)
+        tirages = self.__rng.integers(0, 101, size=np.count_nonzero(masque))
+        pousse = np.zeros_like(masque)
+        pousse[masque] = tirages < pourcentage
+        envs[pousse] = Environnement.HERBE.value
+        probabilite = min(max(pourcentage, 0), 101) / 101
+        # Une repousse certaine est bornée (exp(-1e6) = 0) pour garder des différences finies
+        self.__logSolNu += math.log1p(-probabilite) if probabilite < 1 else -1e6
+
+        horsGrille = ids == Grille.BORD
+        libres = ~(ids >= 0).any(axis=1) & (self.__tuiles[:self.__nbEmplacements] >= 0)
+        toutHerbe = ((envs == Environnement.HERBE.value) | horsGrille).all(axis=1)
+        toutSolNu = ((envs == Environnement.VIDE.value) | horsGrille).all(axis=1)
+        for emplacement in np.flatnonzero(libres & (toutHerbe | toutSolNu)).tolist():
+            tuile = int(self.__tuiles[emplacement])
+            self.__densites[tuile] = 1.0 if toutHerbe[emplacement] else 0.0
+            self.__logsSolNu[tuile] = self.__logSolNu
+            self.__emplacements[tuile] = -1
+            self.__tuiles[emplacement] = -1
+            self.__ids[emplacement] = Grille.BORD
+            self.__emplacementsLibres.append(emplacement)
+
+    def coord_hasard(self):
+        # Grille presque vide : quelques tirages suffisent, sans parcourir la grille
+        for _ in range(64):
+            x = self.__rng.integers(0, self.__TAILLE)
+            y = self.__rng.integers(0, self.__TAILLE)
+            if self.__lireId(indexCase(x, y, self.__TAILLE)) == -1:
+                return self.__pool.get(x, y)
+        # Sinon : une case libre d'une tuile allouée, ou une case d'une tuile non allouée
+        emplacements, positions = np.nonzero(self.__ids == -1)
+        libres = self.__cases(self.__tuiles[emplacements], positions)
+        absentes = np.flatnonzero(self.__emplacements < 0)
+        if len(absentes):
+            tuile = absentes[self.__rng.integers(len(absentes))]
+            dans = np.flatnonzero((tuile // self.__nbTuilesCote * self.__TAILLE_TUILE + self.__decalagesX < self.__TAILLE)
+                                  & (tuile % self.__nbTuilesCote * self.__TAILLE_TUILE + self.__decalagesY < self.__TAILLE))
+            libres = np.append(libres, self.__cases(np.full(len(dans), tuile), dans))
+        if len(libres) == 0:
+            raise ValueError("Erreur logique ")
+        return self.__pool.depuisCase(libres[self.__rng.integers(len(libres))])
+
+    def __str__(self):
+        return f"GrilleCreuse({self.__TAILLE} x {self.__TAILLE}, {self.get_nbTuiles()} tuiles allouées)"
@@ -0,0 +1,106 @@
+import threading
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+
+class Instrumentation():
+
+    """
+    Classe Instrumentation
+
+    Accumule, par phase, le temps écoulé (horloge murale), le nombre d'appels et le nombre
+    d'éléments traités (par exemple le nombre d'animaux d'un lot de `bouge`).
+
+    Une instance est confiée à `GameRules.set_instrumentation` ou à `InterfaceGraphique` ;
+    sans instance (None, la valeur par défaut), aucune mesure n'est prise et le coût se
+    limite à un test `is not None` par phase. Une même instance peut recevoir les mesures
+    de plusieurs fils d'exécution (simulation en fond et affichage) : les compteurs sont
+    protégés par un verrou.
+
+    Attributs :
+        - __durees (dict) : Temps cumulé (en secondes) par phase.
+        - __appels (dict) : Nombre de mesures par phase.
+        - __elements (dict) : Nombre d'éléments traités par phase.
+        - __rappel (callable) : Appelé avec (phase, duree, nombre) à chaque mesure, ou None.
+        - __verrou (threading.Lock) : Protège les compteurs.
+
+    Méthodes :
+        - ajouter(phase, duree, nombre=1) : Enregistre une mesure.
+        - mesurer(phase, nombre=1) : Gestionnaire de contexte qui mesure le bloc qu'il entoure.
+        - get_durees(), get_appels(), get_elements() -> dict : Copies des compteurs.
+        - resultats() -> dict : {phase: {"secondes", "appels", "elements"}}.
+        - reinitialiser() : Remet les compteurs à zéro.
+        - __str__() -> str : Tableau des phases, de la plus coûteuse à la moins coûteuse.
+    """
+
+    def __init__(self, rappel=None):
+        self.__durees = {}
+        self.__appels = {}
+        self.__elements = {}
+        self.__rappel = rappel
+        self.__verrou = threading.Lock()
+
+    # Getters
+
+    def get_durees(self):
+        with self.__verrou:
+            return dict(self.__durees)
+
+    def get_appels(self):
+        with self.__verrou:
+            return dict(self.__appels)
+
+    def get_elements(self):
+        with self.__verrou:
+            return dict(self.__elements)
+
+    # Méthodes de classe
+
+    def ajouter(self, phase, duree, nombre=1):
+        with self.__verrou:
+            self.__durees[phase] = self.__durees.get(phase, 0.0) + duree
+            self.__appels[phase] = self.__appels.get(phase, 0) + 1
+            self.__elements[phase] = self.__elements.get(phase, 0) + nombre
+        if self.__rappel is not None:
+            self.__rappel(phase, duree, nombre)
+
+    @contextmanager
+    def mesurer(self, phase, nombre=1):
+        debut = perf_counter()
+        try:
+            yield
+        finally:
+            self.ajouter(phase, perf_counter() - debut, nombre)
+
+    def resultats(self):
+        with self.__verrou:
+            return {phase: {"secondes": self.__durees[phase], "appels": self.__appels[phase],
+                            "elements": self.__elements[phase]} for phase in self.__durees}
+
+    def reinitialiser(self):
+        with self.__verrou:
+            self.__durees.clear()
+            self.__appels.clear()
+            self.__elements.clear()
+
+    def __str__(self):
+        resultats = self.resultats()
+        total = sum(resultat["secondes"] for resultat in resultats.values())
+        lignes = [f"{'phase':30s} {'secondes':>10s} {'%':>6s} {'appels':>8s} {'elements':>10s}"]
+        for phase in sorted(resultats, key=lambda phase: resultats[phase]["secondes"], reverse=True):
+            duree = resultats[phase]["secondes"]
+            part = 100 * duree / total if total > 0 else 0.0
+            lignes.append(f"{phase:30s} {duree:10.4f} {part:6.1f} {resultats[phase]['appels']:8d} "
+                          f"{resultats[phase]['elements']:10d}")
+        return "\n".join(lignes)
+
+
+# Contexte sans effet, partagé par tous les appels à `mesurer` sans instrumentation
+SANS_MESURE = nullcontext()
+
+
+def mesurer(instrumentation, phase, nombre=1):
+    """Retourne `instrumentation.mesurer(phase, nombre)`, ou un contexte sans effet si [instrumentation] vaut None."""
+    if instrumentation is None:
+        return SANS_MESURE
+    return instrumentation.mesurer(phase, nombre)
@@ -3,7 +3,17 @@ import matplotlib.pyplot as plt
 from source.gameRules import GameRules
 from source.coordonnee import Coordonnee
 from source.animal import Animal
+from source.environnement import Environnement
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+from source.instrumentation import mesurer
+from source.validation import NiveauValidation
+from source.sauvegarde import sauvegarder, charger
+from source.trajectoire import LecteurTrajectoire
+from source.population import Population
+from source.simulationFond import SimulationEnFond
+from source.renduGrille import RenduGrille
+from source.graphiquePopulation import GraphiquePopulation
+import numpy as np
 import sys
 
 
@@ -34,8 +44,13 @@ class InterfaceGraphique:
     TAILLE_FONT_TXT (int) : Taille de la police pour le texte.
     
     Méthodes :
-    __init__(self, largeur, hauteur, nom_fenetre="Simulation Écosystème", FPS=5):
+    __init__(self, largeur, hauteur, nom_fenetre="Simulation Écosystème", FPS=5, instrumentation=None,
+             reprise=None, fichierSauvegarde=None, trajectoire=None, sauvegarderALaFermeture=False):
         Initialise l'interface graphique avec les dimensions spécifiées de la fenêtre, le titre de la fenêtre, et les FPS.
+        Une `Instrumentation` optionnelle mesure le temps passé dans chaque phase de la simulation et de l'affichage.
+        La simulation peut reprendre une sauvegarde ([reprise]) ; la touche S la sauvegarde dans [fichierSauvegarde]
+        (par défaut, le fichier repris, sinon FICHIER_SAUVEGARDE), et la fermeture de la fenêtre aussi si
+        [sauvegarderALaFermeture] est vrai. Avec [trajectoire], `run` rejoue ce fichier enregistré au lieu de simuler.
     
     ecranInitial(self):
         Affiche le menu initial avec le titre du jeu et les boutons pour entrer dans le jeu ou voir les crédits.
@@ -49,13 +64,15 @@ class InterfaceGraphique:
     ecranParametresAvances(self):
         Affiche un écran pour configurer les paramètres avancés de la simulation, comme la fréquence d'images (FPS) et d'autres paramètres avancés.
 
-    plotSurface(self, populationLapinsOverTime, populationRenardsOverTime):
-        Crée une surface représentant un graphique montrant l'évolution des populations de lapins et de renards.
+    graphiquePopulation(self):
+        Crée le graphique (`GraphiquePopulation`) de l'évolution des populations de lapins, de renards et d'ours,
+        complété point par point, en mémoire bornée et dessiné à coût constant quelle que soit la durée de la
+        simulation.
         
     alleleHistogramSurface(self, alleleFrequenciesByGeneByAnimal):
         Crée une surface représentant un histogramme des fréquences des allèles pour chaque animal.
     
-    grilleSurface(self, grille, population):
+    grilleSurface(self, especes, environnements):
         Crée une surface représentant la grille de simulation avec les animaux (lapins, renards, ours) et l'herbe.
         
     parametresSurface(self):
@@ -63,6 +80,12 @@ class InterfaceGraphique:
         
     run(self):
         Lance la simulation du jeu, en gérant l'affichage des éléments graphiques, les événements et la mise à jour des populations.
+        La simulation avance dans un fil séparé (`SimulationEnFond`) ; la fenêtre affiche le dernier instantané publié
+        et reste réactive (pause, bouton ours, fermeture) même quand une génération est longue.
+
+    rejouer(self):
+        Rejoue une trajectoire enregistrée (voir le module `trajectoire`), sans simulation : la vitesse ne dépend
+        que de l'affichage, et la barre de progression permet d'aller directement à n'importe quelle génération.
 
     """
 
@@ -88,17 +111,47 @@ class InterfaceGraphique:
     TAILLE_FONT_SSTITRE = 40
     TAILLE_FONT_BOUTTON = 60
     TAILLE_FONT_TXT = 28
-
-    def __init__(self, largeur, hauteur, nom_fenetre="Simulation Écosystème", FPS=5):
-        """Initialise l'interface graphique."""
+    # Fichier écrit par la touche S quand ni fichier de sauvegarde, ni reprise ne sont donnés
+    FICHIER_SAUVEGARDE = "sauvegarde.npz"
+
+    def __init__(self, largeur, hauteur, nom_fenetre="Simulation Écosystème", FPS=5, instrumentation=None,
+                 reprise=None, fichierSauvegarde=None, trajectoire=None, sauvegarderALaFermeture=False):
+        """Initialise l'interface graphique.
+
+        [instrumentation] (Instrumentation ou None) mesure les phases de chaque génération et de chaque image ;
+        le bilan est affiché à la fermeture de la fenêtre.
+        [reprise] (chemin ou None) : sauvegarde dont la simulation repart, sans passer par les écrans de paramètres.
+        [fichierSauvegarde] (chemin ou None) : fichier écrit par la touche S (None : [reprise] si la simulation
+        en repart, FICHIER_SAUVEGARDE sinon).
+        [sauvegarderALaFermeture] (bool) : sauvegarde aussi dans ce fichier à la fermeture de la fenêtre.
+        [trajectoire] (chemin ou None) : trajectoire enregistrée à rejouer au lieu de lancer une simulation.
+        """
+        self.instrumentation = instrumentation
+        self.reprise = reprise
+        if fichierSauvegarde is None:
+            fichierSauvegarde = reprise if reprise is not None else InterfaceGraphique.FICHIER_SAUVEGARDE
+        self.fichierSauvegarde = fichierSauvegarde
+        self.sauvegarderALaFermeture = sauvegarderALaFermeture
+        self.trajectoire = trajectoire
+        # Vérification de la cohérence grille / population après chaque génération (voir GameRules.valider)
+        self.niveauValidation = NiveauValidation.ECHANTILLON
+        self.periodeValidation = 1
         self.HAUTEUR = hauteur
         self.LARGEUR = largeur
         self.ratioHauteurGrille = 1
         self.ratioLargeurGrille = 0.67
         self.ecran = pygame.display.set_mode((self.LARGEUR, self.HAUTEUR))
         pygame.display.set_caption(nom_fenetre)
-        # Vitesse de la simulation en images par seconde
+        # Vitesse de la simulation en générations par seconde
         self.FPS = 2
+        # Images par seconde de l'affichage (indépendant de la vitesse de la simulation)
+        self.FPSAffichage = 30
+        # Dessin de la grille, conservé d'une image à l'autre (voir grilleSurface)
+        self.renduGrille = None
+        # Images par seconde du mode rejeu (la vitesse se règle en générations par image)
+        self.FPSRejeu = 30
+        # Nombre de générations de la vue « récente » du graphique (touche F), à pleine résolution
+        self.fenetreGraphique = 200
 
     def ecranInitial(self):
         """Affiche le menu initial. Ce dernier contient :
@@ -523,60 +576,14 @@ class InterfaceGraphique:
 
         return OPT_PARAMETERS
 
-    def plotSurface(self, populationLapinsOverTime, populationRenardsOverTime):
-        """Crée une surface représentant un graphique."""
-
-        def normaliseCouleur(couleur):
-            return (couleur[0] / 255, couleur[1] / 255, couleur[2] / 255)
-
-        LARGEUR = int(self.LARGEUR * (1 - self.ratioLargeurGrille))
-        HAUTEUR = int(self.HAUTEUR * self.ratioHauteurGrille // 2)
-
-        # Calcul du facteur d'échelle pour les renards
-        maxLapins = max(populationLapinsOverTime)
-        maxRenards = max(populationRenardsOverTime)
-
-        scaleFactor = maxLapins / maxRenards
-
-        scaledRenards = [
-            value * scaleFactor for value in populationRenardsOverTime]
-
-        fig, ax_lapins = plt.subplots(
-            figsize=(LARGEUR / 100, HAUTEUR / 100), dpi=100)
-
-        # Tracé des lapins
-        ax_lapins.plot(populationLapinsOverTime, label="Lapins",
-                       color=normaliseCouleur(InterfaceGraphique.COULEUR_LAPIN))
-        ax_lapins.set_ylabel("Population Lapins", fontsize=10, labelpad=10)
-        ax_lapins.set_xlabel("Temps", fontsize=10, labelpad=10)
-        ax_lapins.legend(loc="upper left")
-        ax_lapins.grid(True)
-
-        # Tracé des renards scalés
-        ax_lapins.plot(scaledRenards, label="Renards (scalés)",
-                       color=normaliseCouleur(InterfaceGraphique.COULEUR_RENARDS))
-        ax_lapins.legend(loc="upper left")
-
-        # Création d'un axe secondaire pour les valeurs réelles des renards
-        ax_renards = ax_lapins.twinx()
-        ax_renards.set_ylabel("Population Renards (réelle)",
-                              fontsize=10, labelpad=10)
-        ax_renards.set_ylim(0, max(populationRenardsOverTime) * 1.1)
-
-        # Titre du graphique
-        ax_lapins.set_title("Évolution des Populations", fontsize=12, pad=15)
-
-        # Ajustement automatique des espaces
-        fig.tight_layout()
-
-        # Dessin du canvas
-        canvas = FigureCanvas(fig)
-        canvas.draw()
-        raw_data = canvas.tostring_rgb()
-        size = canvas.get_width_height()
-        surface = pygame.image.fromstring(raw_data, size, "RGB")
-        plt.close(fig)
-        return surface
+    def graphiquePopulation(self):
+        """Crée le graphique de l'évolution des populations (lapins à gauche, renards à droite, ours sans graduation)."""
+        return GraphiquePopulation(int(self.LARGEUR * (1 - self.ratioLargeurGrille)),
+                                   int(self.HAUTEUR * self.ratioHauteurGrille // 2),
+                                   (("Lapins", InterfaceGraphique.COULEUR_LAPIN),
+                                    ("Renards", InterfaceGraphique.COULEUR_RENARDS),
+                                    ("Ours", InterfaceGraphique.BLANC)),
+                                   InterfaceGraphique.COULEUR_FOND, InterfaceGraphique.COULEUR_TEXTE)
 
     def alleleHistogramSurface(self, alleleFrequenciesByGeneByAnimal):
 
@@ -636,59 +643,29 @@ class InterfaceGraphique:
         # Convertir en image et renvoyer pour l'affichage dans la simulation
         canvas = FigureCanvas(fig)
         canvas.draw()
-        raw_data = canvas.tostring_rgb()
+        raw_data = canvas.buffer_rgba()
         size = canvas.get_width_height()
-        surface = pygame.image.fromstring(raw_data, size, "RGB")
+        surface = pygame.image.frombuffer(bytes(raw_data), size, "RGBA")
         plt.close(fig)
 
         return surface
 
-    def grilleSurface(self, grille, population):
-        """Crée une surface représentant la grille."""
-        LARGEUR = int(self.LARGEUR * self.ratioLargeurGrille)
-        HAUTEUR = int(self.HAUTEUR * self.ratioHauteurGrille)
-        TAILLE = grille.get_TAILLE()
-
-        # Création de la surface
-        surface = pygame.Surface((LARGEUR, HAUTEUR))
-
-        # Calcul des tailles des cases
-        taille_case_x = LARGEUR // TAILLE
-        taille_case_y = HAUTEUR // TAILLE
-
-        # Dessin des éléments
-        for i in range(TAILLE):
-            for j in range(TAILLE):
-                x, y = j * taille_case_x, i * taille_case_y
-                rect = pygame.Rect(x, y, taille_case_x, taille_case_y)
-                if grille.get_environnement(Coordonnee(j, i)).value == 2:
-                    pygame.draw.rect(
-                        surface, InterfaceGraphique.COULEUR_HERBE, rect)
-
-        # Dessiner les lapins
-        for coordonneeLapin in population.lapin_coord():
-            x, y = coordonneeLapin.get_coord()
-            x = x * taille_case_x + taille_case_x // 2
-            y = y * taille_case_y + taille_case_y // 2
-            pygame.draw.circle(surface, InterfaceGraphique.COULEUR_LAPIN, (x, y), min(
-                taille_case_x, taille_case_y) // 3)  # Marron pour les lapins
-
-        # Dessiner les renards
-        for coordonneeRenard in population.renard_coord():
-            x, y = coordonneeRenard.get_coord()
-            x = x * taille_case_x + taille_case_x // 2
-            y = y * taille_case_y + taille_case_y // 2
-            pygame.draw.circle(surface, InterfaceGraphique.COULEUR_RENARDS, (x, y), min(
-                taille_case_x, taille_case_y) // 3)  # Orange pour les renards
-
-        for coordonneeRenard in population.ours_coord():
-            x, y = coordonneeRenard.get_coord()
-            x = x * taille_case_x + taille_case_x // 2
-            y = y * taille_case_y + taille_case_y // 2
-            pygame.draw.circle(surface, InterfaceGraphique.BLANC, (x, y), min(
-                taille_case_x, taille_case_y) // 3)  # Orange pour les renards
+    def grilleSurface(self, especes, environnements):
+        """Retourne une surface représentant la grille.
 
-        return surface
+        [especes] (codes de `GameRules.grilleEspeces`) et [environnements] (valeurs d'`Environnement`) sont des
+        tableaux (TAILLE x TAILLE) indexés par [x, y] : ceux de la simulation en cours ou d'une trajectoire.
+        La surface est celle d'un `RenduGrille` conservé d'une image à l'autre : seules les cases modifiées depuis
+        l'image précédente sont redessinées.
+        """
+        if self.renduGrille is None:
+            LARGEUR = int(self.LARGEUR * self.ratioLargeurGrille)
+            HAUTEUR = int(self.HAUTEUR * self.ratioHauteurGrille)
+            self.renduGrille = RenduGrille(LARGEUR, HAUTEUR,
+                                           (InterfaceGraphique.COULEUR_RENARDS, InterfaceGraphique.COULEUR_LAPIN,
+                                            InterfaceGraphique.BLANC),
+                                           InterfaceGraphique.COULEUR_HERBE, InterfaceGraphique.COULEUR_FOND)
+        return self.renduGrille.dessiner(especes, environnements)
 
     def parametresSurface(self):
         """Affiche les paramètres de jeu en bas de la fenêtre."""
@@ -720,23 +697,30 @@ class InterfaceGraphique:
     def run(self):
         """Lance la simulation."""
         pygame.init()
-        self.ecranInitial()
-        PARAMETERS, OPT_PARAMETERS = self.ecranParametres()
-        GameRules.PARAMETERS = PARAMETERS
-        if OPT_PARAMETERS != None:
-            del OPT_PARAMETERS["fps"]
-            Animal.PARAMETERS = OPT_PARAMETERS
-
-        gameRules = GameRules()
+        if self.trajectoire is not None:
+            self.rejouer()
+        if self.reprise is None:
+            self.ecranInitial()
+            PARAMETERS, OPT_PARAMETERS = self.ecranParametres()
+            GameRules.PARAMETERS = PARAMETERS
+            if OPT_PARAMETERS != None:
+                del OPT_PARAMETERS["fps"]
+                Animal.PARAMETERS = OPT_PARAMETERS
+
+            gameRules = GameRules()
+        else:
+            gameRules = charger(self.reprise)
+        gameRules.set_instrumentation(self.instrumentation)
+        gameRules.set_validation(self.niveauValidation, self.periodeValidation)
+        instrumentation = self.instrumentation
         gameRules.checkInvariant()
         pygame.mixer.music.load("assets/music/son_ours.mp3")
 
-        # Historique des populations
-        populationLapinsOverTime = []
-        populationRenardsOverTime = []
+        # Historique des populations ; touche F : tout l'historique ou les dernières générations
+        graphique = self.graphiquePopulation()
+        fenetre = None
 
         clock = pygame.time.Clock()
-        pause = False
         en_cours = True
 
         # Charger l'image d'ours
@@ -747,60 +731,177 @@ class InterfaceGraphique:
         bouton_ours_rect = image_ours.get_rect(
             bottomright=(self.LARGEUR//1.02, self.HAUTEUR//1.02))
 
+        # La simulation avance dans son propre fil ; la boucle ci-dessous ne fait qu'afficher et transmettre les commandes
+        simulation = SimulationEnFond(gameRules, generationsParSeconde=self.FPS)
+        simulation.demarrer()
+        alleleHistogramSurface = pygame.Surface((0, 0))
+        # Compteurs d'allèles de l'histogramme affiché : il n'est redessiné que s'ils changent
+        comptesHistogramme = None
+
         while en_cours :
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     en_cours = False
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
-                        pause = not pause
+                        if simulation.estEnPause():
+                            simulation.reprendre()
+                        else:
+                            simulation.pause()
+                    if event.key == pygame.K_s:
+                        simulation.sauvegarder(self.fichierSauvegarde)
+                    if event.key == pygame.K_f:
+                        fenetre = self.fenetreGraphique if fenetre is None else None
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Clic gauche
                         if bouton_ours_rect.collidepoint(event.pos):
-                            gameRules.addOursAleatoire()  # Action à exécuter
+                            simulation.ajouterOurs()  # Appliqué avant la prochaine génération
                             pygame.mixer.music.play()
-            if not pause:
-                # Mise à jour des données de simulation
-                gameRules.generation()
-                gameRules.checkInvariant()
-                populationLapinsOverTime.append(
-                    len(gameRules.get_population().lapin_ids()))
-                populationRenardsOverTime.append(
-                    len(gameRules.get_population().renard_ids()))
-
-            # Affichage
-            self.ecran.fill(InterfaceGraphique.COULEUR_FOND)
 
-            # Dessiner la grille
-            grilleSurface = self.grilleSurface(
+            # Instantanés publiés depuis la dernière image : tous alimentent les courbes, seul le dernier est dessiné
+            with mesurer(instrumentation, "statistiques"):
+                instantanes = simulation.instantanes()
+                for instantane in instantanes:
+                    effectifs = instantane.get_effectifs()
+                    graphique.ajouter((effectifs[1], effectifs[0], effectifs[2]))
+
+            if instantanes:
+                instantane = instantanes[-1]
+
+                # Dessiner la grille
+                with mesurer(instrumentation, "rendu grille"):
+                    grilleSurface = self.grilleSurface(
+                        instantane.get_especes(), instantane.get_environnements())
+                with mesurer(instrumentation, "rendu courbes"):
+                    plotSurface = graphique.dessiner(fenetre)
+
+                # Tracer l'histogramme des allèles
+                comptesAlleles = instantane.get_comptesAlleles()
+                if comptesHistogramme is None or not np.array_equal(comptesAlleles, comptesHistogramme):
+                    with mesurer(instrumentation, "rendu histogramme"):
+                        try :
+                            alleleHistogramSurface = self.alleleHistogramSurface(
+                                instantane.get_alleles())
+                            comptesHistogramme = comptesAlleles
+                        except ValueError as e :
+                            pass
+
+                with mesurer(instrumentation, "affichage"):
+                    self.ecran.fill(InterfaceGraphique.COULEUR_FOND)
+                    self.ecran.blit(grilleSurface, (0, 0))
+                    self.ecran.blit(
+                        plotSurface, (int(self.LARGEUR * self.ratioLargeurGrille), 0))
+
+                    self.ecran.blit(alleleHistogramSurface, (int(
+                        self.LARGEUR * (self.ratioLargeurGrille)), self.HAUTEUR // 2))
+
+                    # Afficher le bouton d'ours
+                    self.ecran.blit(image_ours, bouton_ours_rect.topleft)
+
+                    pygame.display.flip()
+            clock.tick(self.FPSAffichage)
+
+        simulation.arreter()
+        if self.sauvegarderALaFermeture:
+            sauvegarder(gameRules, self.fichierSauvegarde)
+        if instrumentation is not None:
+            print(instrumentation)
+        pygame.quit()
+        sys.exit()
 
-                gameRules.get_grille(), gameRules.get_population())
-            plotSurface = self.plotSurface(
-                populationLapinsOverTime, populationRenardsOverTime)
+    def rejouer(self):
+        """Rejoue la trajectoire enregistrée dans [self.trajectoire], sans simulation.
 
-            # Calcul des fréquences des allèles
-            alleleFrequenciesByGeneByAnimal = gameRules.get_population(
-            ).alleleFrequenciesByGeneByAnimal()
-            # Tracer l'histogramme des allèles
-            try :
-                alleleHistogramSurface = self.alleleHistogramSurface(
-                    alleleFrequenciesByGeneByAnimal)
-            except ValueError as e :
-                pass
+        Espace : pause ; flèches gauche / droite : génération précédente / suivante ; flèches haut / bas :
+        vitesse doublée / divisée par deux (en générations par image) ; Début / Fin : première / dernière
+        génération ; F : graphique de tout l'historique ou des dernières générations ; clic sur la barre de
+        progression : accès direct à une génération.
+        """
+        lecteur = LecteurTrajectoire(self.trajectoire)
+        if len(lecteur) == 0:
+            raise ValueError(f"{self.trajectoire} ne contient aucune génération")
+        comptes = lecteur.get_comptes()
+        instrumentation = self.instrumentation
+        fontTxt = pygame.font.Font(None, InterfaceGraphique.TAILLE_FONT_TXT)
 
-            self.ecran.blit(grilleSurface, (0, 0))
-            self.ecran.blit(
-                plotSurface, (int(self.LARGEUR * self.ratioLargeurGrille), 0))
-            
-            self.ecran.blit(alleleHistogramSurface, (int(
-                self.LARGEUR * (self.ratioLargeurGrille)), self.HAUTEUR // 2))
+        xPanneau = int(self.LARGEUR * self.ratioLargeurGrille)
+        barre = pygame.Rect(xPanneau + 20, self.HAUTEUR - 60, self.LARGEUR - xPanneau - 40, 20)
+        dernier = len(lecteur) - 1
 
+        # Le graphique est complété au fil de la lecture et reconstruit après un retour en arrière
+        graphique = self.graphiquePopulation()
+        fenetre = None
 
-            # Afficher le bouton d'ours
-            self.ecran.blit(image_ours, bouton_ours_rect.topleft)
+        clock = pygame.time.Clock()
+        indice, vitesse = 0, 1
+        pause = False
+        en_cours = True
 
-            pygame.display.flip()
-            clock.tick(self.FPS)
+        while en_cours:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    en_cours = False
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        pause = not pause
+                    elif event.key == pygame.K_RIGHT:
+                        indice += 1
+                    elif event.key == pygame.K_LEFT:
+                        indice -= 1
+                    elif event.key == pygame.K_UP:
+                        vitesse *= 2
+                    elif event.key == pygame.K_DOWN:
+                        vitesse = max(1, vitesse // 2)
+                    elif event.key == pygame.K_HOME:
+                        indice = 0
+                    elif event.key == pygame.K_END:
+                        indice = dernier
+                    elif event.key == pygame.K_f:
+                        fenetre = self.fenetreGraphique if fenetre is None else None
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1 and barre.collidepoint(event.pos):  # Clic gauche sur la barre
+                        indice = round((event.pos[0] - barre.x) / barre.width * dernier)
+            indice = min(max(indice, 0), dernier)
+
+            with mesurer(instrumentation, "lecture trajectoire"):
+                generation, especes, environnements, (renards, lapins, ours, herbe) = lecteur.lireIndice(indice)
+
+            self.ecran.fill(InterfaceGraphique.COULEUR_FOND)
+            with mesurer(instrumentation, "rendu grille"):
+                grilleSurface = self.grilleSurface(especes, environnements)
+            with mesurer(instrumentation, "rendu courbes"):
+                if indice < graphique.get_nbPoints() - 1:
+                    graphique.reinitialiser()
+                for point in comptes[graphique.get_nbPoints():indice + 1,
+                                     [Population.LAPIN, Population.RENARD, Population.OURS]].tolist():
+                    graphique.ajouter(point)
+                plotSurface = graphique.dessiner(fenetre)
+
+            with mesurer(instrumentation, "affichage"):
+                self.ecran.blit(grilleSurface, (0, 0))
+                self.ecran.blit(plotSurface, (xPanneau, 0))
+
+                lignes = [f"Génération {generation} ({indice + 1} / {dernier + 1})",
+                          f"Renards : {renards}   Lapins : {lapins}   Ours : {ours}   Herbe : {herbe}",
+                          f"Vitesse : {vitesse} génération(s) par image" + ("   (pause)" if pause else ""),
+                          "Espace : pause, <> : pas à pas, ^v : vitesse, F : fenêtre, clic : aller à"]
+                for i, ligne in enumerate(lignes):
+                    texte = fontTxt.render(ligne, True, InterfaceGraphique.COULEUR_TEXTE)
+                    self.ecran.blit(texte, (xPanneau + 20, self.HAUTEUR // 2 + 20 + i * 30))
+
+                # Barre de progression
+                pygame.draw.rect(self.ecran, InterfaceGraphique.COULEUR_TEXTE, barre, 1)
+                avancement = barre.copy()
+                avancement.width = max(1, round(barre.width * indice / max(dernier, 1)))
+                pygame.draw.rect(self.ecran, InterfaceGraphique.COULEUR_SURVOL, avancement)
+
+                pygame.display.flip()
+
+            if not pause:
+                indice = min(indice + vitesse, dernier)
+            clock.tick(self.FPSRejeu)
 
+        if instrumentation is not None:
+            print(instrumentation)
         pygame.quit()
         sys.exit()
@@ -1,8 +1,81 @@
-from random import randint
+import numpy as np
+from source.allocateurIds import AllocateurIds
 from source.animal import *
+from source.coordonnee import *
 from source.genes import *
 
 
+class VueAnimal():
+
+    """
+    Vue légère sur une ligne du stockage en colonnes de `Population`.
+
+    Une vue ne possède aucune donnée : chaque attribut lu ou écrit par les méthodes héritées
+    de `Animal`, `Renard`, `Lapin` ou `Ours` est redirigé vers les tableaux de la population.
+    Les classes concrètes (`VueRenard`, `VueLapin`, `VueOurs`) héritent de l'espèce correspondante,
+    ce qui permet aux appelants existants (`isinstance`, `vaMourir`, `mange`...) de fonctionner sans changement.
+    """
+
+    def __init__(self, population, id_):
+        self._population = population
+        self._id = id_
+
+    def __get_id(self):
+        return self._id
+
+    def __get_age(self):
+        return float(self._population.get_ages()[self._id])
+
+    def __set_age(self, age):
+        self._population.get_ages()[self._id] = age
+
+    def __get_sexe(self):
+        return int(self._population.get_sexes()[self._id])
+
+    def __get_coord(self):
+        return self._population.get_pool().depuisCase(self._population.get_cases()[self._id])
+
+    def __set_coord(self, coord):
+        x, y = coord.get_coord()
+        self._population.get_cases()[self._id] = indexCase(x, y, self._population.getTAILLE())
+
+    def __get_food(self):
+        return float(self._population.get_foods()[self._id])
+
+    def __set_food(self, food):
+        self._population.get_foods()[self._id] = food
+
+    def __get_genes(self):
+        ligne = self._population.get_genes()[self._id]
+        return {gene: float(ligne[gene.value - 1]) for gene in Genes}
+
+    def __get_rng(self):
+        return self._population.get_rng()
+
+    # Attributs (privés) de Animal et de ses classes filles
+    _Animal__id = property(__get_id)
+    _Animal__age = property(__get_age, __set_age)
+    _Animal__sexe = property(__get_sexe)
+    _Animal__coord = property(__get_coord, __set_coord)
+    _Renard__food = property(__get_food, __set_food)
+    _Lapin__food = property(__get_food, __set_food)
+    _Ours__food = property(__get_food, __set_food)
+    _genes = property(__get_genes)
+    _rng = property(__get_rng)
+
+
+class VueRenard(VueAnimal, Renard):
+    pass
+
+
+class VueLapin(VueAnimal, Lapin):
+    pass
+
+
+class VueOurs(VueAnimal, Ours):
+    pass
+
+
 class Population():
 
     """
@@ -10,23 +83,75 @@ class Population():
 
     Cette classe gère une population d'animaux (renards, lapins et ours) dans une grille, avec la gestion des coordonnées, des identifiants, et des caractéristiques génétiques.
 
+    Les animaux sont stockés en colonnes : un tableau numpy par caractéristique, indexé par l'identifiant de l'animal.
+    `getAnimal()` retourne une vue (`VueRenard`, `VueLapin` ou `VueOurs`) qui se comporte comme un `Animal`.
+
+    Par défaut, les colonnes ont une ligne par case (TAILLE²). Avec [capaciteInitiale], elles n'en ont d'abord que
+    [capaciteInitiale] et sont agrandies (doublées) quand un identifiant neuf les dépasse : la mémoire suit le nombre
+    d'animaux, pas la taille de la grille (voir `grilleCreuse`). Les identifiants restent au plus TAILLE², et
+    les tableaux retournés par les getters de colonnes sont remplacés à chaque agrandissement.
+
     Attributs :
         - __TAILLE (int) : Taille de la grille (côté de la grille carrée).
-        - __AnimauxPopulation (list) : Liste contenant les animaux indexés par leurs identifiants. Les emplacements vides sont représentés par -1.
-        - __idsUtilisables (list) : Liste des identifiants disponibles pour ajouter de nouveaux animaux.
+        - __especes (np.ndarray int8) : Espèce de chaque animal (RENARD, LAPIN, OURS), -1 si l'identifiant est libre.
+        - __sexes (np.ndarray int8) : Sexe de chaque animal (0 ou 1).
+        - __ages (np.ndarray float64) : Âge de chaque animal.
+        - __foods (np.ndarray float64) : Nourriture de chaque animal.
+        - __cases (np.ndarray int64) : Index de la case de chaque animal (voir `coordonnee.indexCase`).
+        - __pool (PoolCoordonnees) : Pool des Coordonnee rendues par l'API publique, celui de la grille si
+          elle le prête (mêmes instances que la grille), sinon propre à la population.
+        - __genes (np.ndarray float64) : Allèles de chaque animal, une colonne par gène (colonne `gene.value - 1`).
+        - __idsUtilisables (AllocateurIds) : Identifiants disponibles pour ajouter de nouveaux animaux (allocation et libération en O(1)).
+        - __membres (tuple de list) : Pour chaque espèce, identifiants de ses animaux (ordre quelconque),
+          tenus à jour par addAnimal et deleteAnimal.
+        - __positions (np.ndarray int32) : Position de chaque animal dans la liste `__membres` de son espèce.
+        - __rng (np.random.Generator) : Générateur de la simulation, utilisé pour les sexes et les gènes des
+          nouveaux animaux et, via les vues, par `peutSeReproduire`.
+        - __valeursAlleles (list) : Valeurs d'allèles rencontrées, triées (au moins les NB_ALLELES tirées par
+          `create_random`) : la colonne i des compteurs compte l'allèle `__valeursAlleles[i]`.
+        - __indicesAlleles (dict) : Colonne des compteurs de chaque valeur d'allèle.
+        - __comptesAlleles (np.ndarray int64) : Nombre d'animaux de chaque espèce portant chaque allèle de chaque
+          gène ([espece, gene.value - 1, colonne de l'allèle]), tenu à jour par addAnimal et deleteAnimal ; une
+          colonne est insérée à la première apparition d'une nouvelle valeur d'allèle.
 
     Méthodes :
-        - __init__(TAILLE) : Initialise une population vide dans une grille de taille TAILLE x TAILLE.
-        - getAnimauxPopulation() -> list : Retourne la liste des animaux dans la population.
-        - getIdsUtilisables() -> list : Retourne la liste des identifiants disponibles.
-        - getAnimal(id) -> object : Retourne l'animal correspondant à l'identifiant donné.
+        - __init__(TAILLE, rng=None, capaciteInitiale=None, pool=None) : Initialise une population vide dans une
+          grille de taille TAILLE x TAILLE, qui tire ses valeurs aléatoires avec le générateur [rng]
+          (`genes.GENERATEUR_DEFAUT` par défaut), avec des colonnes de [capaciteInitiale] lignes (TAILLE² par défaut)
+          et les Coordonnee du pool [pool] (`get_pool()` de la grille ; un pool propre par défaut).
+        - getAnimauxPopulation() -> list : Retourne la liste des animaux (vues) dans la population, -1 pour les identifiants libres
+          (une entrée par ligne des colonnes).
+        - getIdsUtilisables() -> list : Retourne la liste des identifiants disponibles, dans l'ordre où ils seront attribués (O(TAILLE²)).
+        - nbIdsUtilisables() -> int : Nombre d'identifiants disponibles, en O(1).
+        - estIdUtilisable(id) -> bool : Indique si un identifiant est disponible, en O(1).
+        - masqueIdsUtilisables() -> np.ndarray : Masque booléen (en lecture seule) des identifiants disponibles.
+        - get_prochainId() -> int : Plus petit identifiant jamais distribué (les animaux sont dans [0, get_prochainId()[).
+        - getAnimal(id) -> object : Retourne une vue sur l'animal correspondant à l'identifiant donné (-1 si libre).
+          Lève une IndexError si l'identifiant n'est pas dans [0, capacité[.
         - getTAILLE() -> int : Retourne la taille de la grille.
+        - get_especes(), get_sexes(), get_ages(), get_foods(), get_cases(), get_genes() : Accès aux colonnes.
+        - get_rng() -> np.random.Generator : Générateur de la population.
+        - exporterEtat() -> dict : Copie des colonnes et de l'état de l'allocateur d'identifiants.
+        - restaurerEtat(etat) : Reprend un état produit par `exporterEtat` (opérations sur les tableaux,
+          sans créer d'animal), éventuellement avec moins de lignes ; les index par espèce sont reconstruits.
+        - coordonnees(ids) -> tuple : Tableaux (x, y) des coordonnées des animaux donnés.
         - deleteAnimal(animal) : Supprime un animal de la population et libère son identifiant.
         - selectId() -> int : Sélectionne un identifiant libre. Lève une ValueError s'il n'y en a plus.
         - addAnimal(sexe, coord, genes=None) -> int : Ajoute un animal dans la grille en fonction du sexe (0=Renard, 1=Lapin, 2=Ours) et des coordonnées. Retourne l'identifiant de l'animal ajouté.
-        - geneFrequency(gene) -> dict : Retourne les fréquences relatives d'un gène spécifique dans la population.
-        - alleleFrequenciesByGeneByAnimal() -> dict : Retourne les fréquences d'allèles par gène et par espèce dans la population.
+        - addAnimalCase(espece, case, genes=None) -> int : Comme addAnimal, à partir d'un index de case (sans vérification).
+        - vieillit(ids) : Fait vieillir d'un tour les animaux donnés (opération sur les tableaux).
+        - reduireVie(ids) : Réduit la nourriture des animaux donnés (opération sur les tableaux).
+        - effectifs() -> np.ndarray : Nombre d'animaux par espèce (indexé par RENARD, LAPIN, OURS), en O(1).
+        - nbAnimaux(espece=None) -> int : Nombre d'animaux d'une espèce (ou de toutes), en O(1).
+        - alleleFrequenciesByGeneByAnimal() -> dict : Retourne les fréquences d'allèles par gène et par espèce dans la population,
+          calculées à partir des compteurs en O(gènes x allèles).
+        - comptesAlleles() -> np.ndarray : Compteurs d'allèles par espèce et par gène (en lecture seule), une
+          colonne par valeur de `valeursAlleles()`.
+        - valeursAlleles() -> np.ndarray : Valeur d'allèle de chaque colonne des compteurs (croissantes).
+        - comptesAllelesColonnes() -> np.ndarray : Mêmes compteurs, recalculés à partir des colonnes (pour les vérifications).
         - animaux_ids() -> list : Retourne une liste des identifiants de tous les animaux présents.
+          Les listes d'identifiants et de coordonnées sont construites à partir des index par espèce,
+          en O(taille de l'espèce) et non en O(TAILLE²), et restent triées par identifiant.
         - renard_ids() -> list : Retourne une liste des identifiants des renards.
         - lapin_ids() -> list : Retourne une liste des identifiants des lapins.
         - ours_ids() -> list : Retourne une liste des identifiants des ours.
@@ -39,124 +164,302 @@ class Population():
         - ValueError : Levée dans `selectId()` si aucun identifiant n'est disponible ou dans `addAnimal()` si les coordonnées ou l'espèce sont invalides.
 """
 
-    def __init__(self, TAILLE):
+    # Codes des espèces (identiques à l'argument [sexe] de addAnimal)
+    RENARD = 0
+    LAPIN = 1
+    OURS = 2
+
+    VUES = (VueRenard, VueLapin, VueOurs)
+    CODES = {Renard: RENARD, Lapin: LAPIN, Ours: OURS}
+
+    def __init__(self, TAILLE, rng=None, capaciteInitiale=None, pool=None):
         self.__TAILLE = TAILLE
-        self.__AnimauxPopulation = [
-            -1 for _ in range(self.__TAILLE*self.__TAILLE)]
-        self.__idsUtilisables = list(range(self.__TAILLE*self.__TAILLE))
+        self.__rng = generateur(rng)
+        capacite = self.__TAILLE*self.__TAILLE
+        if capaciteInitiale is not None:
+            capacite = max(1, min(capaciteInitiale, capacite))
+        self.__especes = np.full(capacite, -1, dtype=np.int8)
+        self.__sexes = np.zeros(capacite, dtype=np.int8)
+        self.__ages = np.zeros(capacite, dtype=np.float64)
+        self.__foods = np.zeros(capacite, dtype=np.float64)
+        self.__cases = np.zeros(capacite, dtype=np.int64)
+        self.__pool = PoolCoordonnees(TAILLE) if pool is None else pool
+        self.__genes = np.zeros((capacite, len(Genes)), dtype=np.float64)
+        self.__idsUtilisables = AllocateurIds(self.__TAILLE*self.__TAILLE, capacite)
+        self.__membres = ([], [], [])
+        self.__positions = np.zeros(capacite, dtype=np.int32)
+        self.__valeursAlleles = [float(allele) for allele in range(NB_ALLELES)]
+        self.__indicesAlleles = {valeur: i for i, valeur in enumerate(self.__valeursAlleles)}
+        self.__comptesAlleles = np.zeros((3, len(Genes), NB_ALLELES), dtype=np.int64)
 
     # Getters
 
     def getAnimauxPopulation(self):
-        return self.__AnimauxPopulation
+        return [self.getAnimal(id_) for id_ in range(len(self.__especes))]
 
     def getIdsUtilisables(self):
-        return self.__idsUtilisables
+        return self.__idsUtilisables.idsLibres()
+
+    def nbIdsUtilisables(self):
+        return self.__idsUtilisables.nbLibres()
+
+    def estIdUtilisable(self, id):
+        return self.__idsUtilisables.estLibre(id)
+
+    def masqueIdsUtilisables(self):
+        return self.__idsUtilisables.masqueLibres()
+
+    def get_prochainId(self):
+        return self.__idsUtilisables.get_prochainId()
 
     def getAnimal(self, id):
-        return self.__AnimauxPopulation[id]
+        if not 0 <= id < len(self.__especes):
+            raise IndexError(f"Identifiant hors de la population : {id}")
+        espece = self.__especes[id]
+        if espece == -1:
+            return -1
+        return Population.VUES[espece](self, int(id))
 
     def getTAILLE(self):
         return self.__TAILLE
 
+    def get_especes(self):
+        return self.__especes
+
+    def get_sexes(self):
+        return self.__sexes
+
+    def get_ages(self):
+        return self.__ages
+
+    def get_foods(self):
+        return self.__foods
+
+    def get_cases(self):
+        return self.__cases
+
+    def get_pool(self):
+        return self.__pool
+
+    def get_rng(self):
+        return self.__rng
+
+    def coordonnees(self, ids):
+        """Retourne les tableaux (x, y) des coordonnées des animaux donnés."""
+        x, y = np.divmod(self.__cases[ids], self.__TAILLE + 2)
+        return x - 1, y - 1
+
+    def get_genes(self):
+        return self.__genes
+
     # Méthodes de classe
 
     def deleteAnimal(self, animal):
         id_ = animal.get_id()
-        self.__AnimauxPopulation[id_] = -1
-        self.__idsUtilisables.append(id_)
+        # Retrait en O(1) de l'index de l'espèce : le dernier membre prend la place de l'animal
+        membres = self.__membres[self.__especes[id_]]
+        self.__compterAlleles(self.__especes[id_], self.__genes[id_], -1)
+        position = self.__positions[id_]
+        dernier = membres.pop()
+        if dernier != id_:
+            membres[position] = dernier
+            self.__positions[dernier] = position
+        self.__especes[id_] = -1
+        self.__idsUtilisables.liberer(id_)
+
+    def exporterEtat(self):
+        return {"especes": self.__especes.copy(), "sexes": self.__sexes.copy(), "ages": self.__ages.copy(),
+                "foods": self.__foods.copy(), "cases": self.__cases.copy(), "genes": self.__genes.copy(),
+                "allocateur": self.__idsUtilisables.exporterEtat()}
+
+    def restaurerEtat(self, etat):
+        valeurs = [etat[nom] for nom in ("especes", "sexes", "ages", "foods", "cases", "genes")]
+        nombre = len(valeurs[0])
+        if (nombre > self.__TAILLE*self.__TAILLE or any(len(valeur) != nombre for valeur in valeurs)
+                or valeurs[-1].shape[1:] != self.__genes.shape[1:]):
+            raise ValueError("Taille de population incompatible")
+        if nombre > len(self.__especes):
+            self.__agrandir(nombre)
+        colonnes = (self.__especes, self.__sexes, self.__ages, self.__foods, self.__cases, self.__genes)
+        for colonne, valeur in zip(colonnes, valeurs):
+            colonne[:nombre] = valeur
+            colonne[nombre:] = 0
+        self.__especes[nombre:] = -1
+        self.__idsUtilisables.restaurerEtat(etat["allocateur"])
+        self.__idsUtilisables.agrandir(len(self.__especes))
+        for espece, membres in enumerate(self.__membres):
+            membres[:] = np.flatnonzero(self.__especes == espece).tolist()
+            self.__positions[membres] = np.arange(len(membres))
+        self.__valeursAlleles = [float(allele) for allele in range(NB_ALLELES)]
+        self.__comptesAlleles = self.comptesAllelesColonnes()
+        self.__valeursAlleles = self.__valeursAllelesColonnes().tolist()
+        self.__indicesAlleles = {valeur: i for i, valeur in enumerate(self.__valeursAlleles)}
 
     def selectId(self):
-        if len(self.__idsUtilisables) == 0:
-            raise ValueError("Plus de place")
-        res = self.getIdsUtilisables()[0]
-        self.__idsUtilisables = self.__idsUtilisables[1::]
-        return res
+        id_ = self.__idsUtilisables.allouer()
+        if id_ >= len(self.__especes):
+            self.__agrandir(self.__idsUtilisables.get_capaciteAllouee())
+        return id_
+
+    def __agrandir(self, capacite):
+        """Agrandit les colonnes à [capacite] lignes ; les nouvelles lignes sont des identifiants libres."""
+        def etendre(colonne, valeur=0):
+            ajout = np.full((capacite - len(colonne),) + colonne.shape[1:], valeur, dtype=colonne.dtype)
+            return np.concatenate((colonne, ajout))
+
+        self.__especes = etendre(self.__especes, -1)
+        self.__sexes = etendre(self.__sexes)
+        self.__ages = etendre(self.__ages)
+        self.__foods = etendre(self.__foods)
+        self.__cases = etendre(self.__cases)
+        self.__genes = etendre(self.__genes)
+        self.__positions = etendre(self.__positions)
+        self.__idsUtilisables.agrandir(capacite)
 
     def addAnimal(self, sexe, coord, genes=None):
         x, y = coord.get_coord()
         if not (0 <= x < self.getTAILLE() and 0 <= y < self.getTAILLE()):
             raise ValueError("Coordonnée(s) invalide(s)")
-        id_ = self.selectId()
-        if (sexe == 0):
-            self.__AnimauxPopulation[id_] = Renard(coord, id_, genes)
-        elif sexe == 1:
-            self.__AnimauxPopulation[id_] = Lapin(coord, id_, genes)
-        elif sexe == 2:
-            self.__AnimauxPopulation[id_] = Ours(coord, id_)
-        else:
+        if sexe not in (Population.RENARD, Population.LAPIN, Population.OURS):
             raise ValueError(
                 """L'argument [espece] est un entier entre 0 et 2""")
+        return self.addAnimalCase(sexe, indexCase(x, y, self.__TAILLE), genes)
+
+    def addAnimalCase(self, sexe, case, genes=None):
+        # L'ours ne reçoit jamais les gènes de ses parents
+        if genes is None or sexe == Population.OURS:
+            genes = create_random(self.__rng)
+        # Allèles vérifiés avant de réserver l'identifiant : un refus ne laisse aucune trace
+        alleles = np.zeros(len(Genes))
+        for gene, allele in genes.items():
+            alleles[gene.value - 1] = allele
+        if np.isnan(alleles).any():
+            raise ValueError(f"Allèle invalide : {genes}")
+        id_ = self.selectId()
+        nourritureInitiale = ("foodInitRenard", "foodInitLapin", "foodInitOurs")[sexe]
+        self.__especes[id_] = sexe
+        self.__positions[id_] = len(self.__membres[sexe])
+        self.__membres[sexe].append(id_)
+        self.__sexes[id_] = self.__rng.integers(0, 2)
+        self.__ages[id_] = 0
+        self.__foods[id_] = Animal.PARAMETERS[nourritureInitiale]
+        self.__cases[id_] = case
+        self.__genes[id_] = alleles
+        self.__compterAlleles(sexe, alleles, 1)
         return id_
 
+    def __compterAlleles(self, espece, alleles, delta):
+        """Ajoute [delta] aux compteurs de l'espèce pour les allèles (un par gène) d'un animal."""
+        for colonne, allele in enumerate(alleles.tolist()):
+            indice = self.__indicesAlleles.get(allele)
+            if indice is None:
+                indice = self.__ajouterValeurAllele(allele)
+            self.__comptesAlleles[espece, colonne, indice] += delta
+
+    def __ajouterValeurAllele(self, valeur):
+        """Insère une colonne de compteurs pour la valeur d'allèle [valeur], à sa place dans l'ordre croissant."""
+        indice = int(np.searchsorted(self.__valeursAlleles, valeur))
+        self.__valeursAlleles.insert(indice, valeur)
+        self.__indicesAlleles = {valeur: i for i, valeur in enumerate(self.__valeursAlleles)}
+        self.__comptesAlleles = np.insert(self.__comptesAlleles, indice, 0, axis=2)
+        return indice
+
+    def valeursAlleles(self):
+        return np.array(self.__valeursAlleles)
+
+    def __valeursAllelesColonnes(self):
+        """Valeurs d'allèles de la table, complétées par celles portées par les animaux vivants."""
+        return np.union1d(self.__valeursAlleles, self.__genes[self.__especes != -1])
+
+    def comptesAlleles(self):
+        vue = self.__comptesAlleles.view()
+        vue.flags.writeable = False
+        return vue
+
+    def comptesAllelesColonnes(self):
+        vivants = self.__especes != -1
+        # Colonnes de la table tenue à jour (plus les valeurs qui y manqueraient), pour pouvoir les comparer
+        valeurs = self.__valeursAllelesColonnes()
+        alleles = np.searchsorted(valeurs, self.__genes[vivants])
+        comptes = np.zeros((3, len(Genes), len(valeurs)), dtype=np.int64)
+        for colonne in range(len(Genes)):
+            np.add.at(comptes, (self.__especes[vivants], colonne, alleles[:, colonne]), 1)
+        return comptes
+
+    def vieillit(self, ids):
+        """Fait vieillir les animaux donnés, comme `Animal.vieillit`, en une seule opération."""
+        ids = np.asarray(ids, dtype=np.intp)
+        self.__ages[ids] += 1 + self.__genes[ids, Genes.MANGE.value - 1] * \
+            (Animal.PARAMETERS['CoeffGeneM']/10)
+
+    def reduireVie(self, ids):
+        """Réduit la nourriture des animaux donnés, comme `reduireVie` de chaque espèce, en une seule opération."""
+        ids = np.asarray(ids, dtype=np.intp)
+        # Le gène d'esquive coûte de la nourriture aux renards et aux lapins, pas aux ours
+        coutEsquive = np.where(self.__especes[ids] == Population.OURS, 0,
+                               self.__genes[ids, Genes.ESQUIVE.value - 1] * (Animal.PARAMETERS["CoeffGeneE"]/10))
+        self.__foods[ids] -= 1 + coutEsquive
+
+    def effectifs(self):
+        """Retourne le nombre d'animaux de chaque espèce, indexé par RENARD, LAPIN et OURS."""
+        return np.array([len(membres) for membres in self.__membres])
+
+    def nbAnimaux(self, espece=None):
+        """Retourne le nombre d'animaux de l'espèce donnée, ou de toute la population."""
+        if espece is None:
+            return sum(len(membres) for membres in self.__membres)
+        return len(self.__membres[espece])
+
     def alleleFrequenciesByGeneByAnimal(self):
 
         def alleleFrequenciesByGene(espece):
-
-            allelesByGene = dict()
-
-            for id_ in self.animaux_ids():
-                animal = self.getAnimal(id_)
-                if isinstance(animal, espece):
-                    # Pour chaque gène de l'animal, on met à jour les fréquences des allèles
-                    for gene, allele in animal.get_genes().items():
-                        if gene not in allelesByGene:
-                            allelesByGene[gene] = {}
-                        if allele not in allelesByGene[gene]:
-                            allelesByGene[gene][allele] = 1
-                        else : allelesByGene[gene][allele] += 1
-            # Calcul des proportions des allèles
+            # Proportions des allèles à partir des compteurs de l'espèce, sans parcourir ses animaux
+            nombre = len(self.__membres[espece])
             alleleProportionsByGene = {}
-            for gene, countByAllele in allelesByGene.items():
-                alleleProportionsByGene[gene] = {}
-                if espece == Lapin:
-                    for allele, alleleCount in countByAllele.items():
-                        alleleProportionsByGene[gene][allele] = alleleCount / \
-                            len(self.lapin_ids())
-
-                elif espece == Renard:
-                    for allele, alleleCount in countByAllele.items():
-                        alleleProportionsByGene[gene][allele] = alleleCount / \
-                            len(self.renard_ids())
-                else:
-                    # espèce = Ours
-                    for allele, alleleCount in countByAllele.items():
-                        alleleProportionsByGene[gene][allele] = alleleCount / \
-                            len(self.ours_ids())
+            if nombre == 0:
+                return alleleProportionsByGene
+            for gene in Genes:
+                comptes = self.__comptesAlleles[espece, gene.value - 1].tolist()
+                alleleProportionsByGene[gene] = {
+                    allele: alleleCount / nombre
+                    for allele, alleleCount in zip(self.__valeursAlleles, comptes) if alleleCount > 0}
             return alleleProportionsByGene
 
         return {
-            "Renard": alleleFrequenciesByGene(Renard),
-            "Lapin": alleleFrequenciesByGene(Lapin)
+            "Renard": alleleFrequenciesByGene(Population.RENARD),
+            "Lapin": alleleFrequenciesByGene(Population.LAPIN)
         }
 
+    def __coords(self, ids):
+        return [self.__pool.depuisCase(case) for case in self.__cases[ids].tolist()]
+
     def animaux_ids(self):
         """Retourne une liste des ids des animaux"""
-        return [animal.get_id() for animal in self.__AnimauxPopulation if animal != -1]
+        return sorted(self.__membres[0] + self.__membres[1] + self.__membres[2])
 
     def renard_ids(self):
         """Retourne une liste des ids des renards."""
-        return [animal.get_id() for animal in self.__AnimauxPopulation if animal != -1 and isinstance(animal, Renard)]
+        return sorted(self.__membres[Population.RENARD])
 
     def lapin_ids(self):
         """Retourne une liste des ids des lapins."""
-        return [animal.get_id() for animal in self.__AnimauxPopulation if animal != -1 and isinstance(animal, Lapin)]
+        return sorted(self.__membres[Population.LAPIN])
 
     def ours_ids(self):
         """Retourne une liste des ids des lapins."""
-        return [animal.get_id() for animal in self.__AnimauxPopulation if animal != -1 and isinstance(animal, Ours)]
+        return sorted(self.__membres[Population.OURS])
 
     def animaux_coord(self):
         """Retourne une liste des ids des animaux"""
-        return [animal.get_coord() for animal in self.__AnimauxPopulation if animal != -1]
+        return self.__coords(self.animaux_ids())
 
     def renard_coord(self):
         """Retourne une liste des corrdonnées des renards."""
-        return [animal.get_coord() for animal in self.__AnimauxPopulation if animal != -1 and isinstance(animal, Renard)]
+        return self.__coords(self.renard_ids())
 
     def lapin_coord(self):
         """Retourne une liste des coordonnéés des lapins."""
-        return [animal.get_coord() for animal in self.__AnimauxPopulation if animal != -1 and isinstance(animal, Lapin)]
+        return self.__coords(self.lapin_ids())
 
     def ours_coord(self):
-        return [animal.get_coord() for animal in self.__AnimauxPopulation if animal != -1 and isinstance(animal, Ours)]
+        return self.__coords(self.ours_ids())
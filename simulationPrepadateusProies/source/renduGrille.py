@@ -0,0 +1,90 @@
+import numpy as np
+import pygame
+from source.environnement import Environnement
+from source.trajectoire import encoderImage
+
+
+class RenduGrille():
+
+    """
+    Classe RenduGrille
+
+    Dessine la grille de la simulation à partir des tableaux d'espèces et d'environnements, sans dessiner
+    case par case. Chaque case est un pixel d'une image 8 bits de TAILLE x TAILLE, dont la valeur est le code
+    de `trajectoire.encoderImage` (espèce + 4 * environnement) et la palette la couleur de ce code. D'une image
+    à l'autre, seuls les pixels des cases modifiées sont réécrits ; l'image est ensuite agrandie à la taille de
+    la zone d'affichage en une seule opération. Le coût d'une image dépend de la taille de la zone affichée et
+    du nombre de cases modifiées, pas du nombre de cases dessinées une à une.
+
+    Attributs :
+        - __LARGEUR, __HAUTEUR (int) : Taille de la zone d'affichage, en pixels.
+        - __palette (list) : Couleur de chaque code (16 codes).
+        - __codes (np.ndarray uint8) : Codes affichés à l'image précédente (None avant la première image).
+        - __image (pygame.Surface) : Image 8 bits, un pixel par case.
+        - __surface (pygame.Surface) : Image agrandie à la taille de la zone d'affichage.
+        - __nbModifiees (int) : Nombre de cases réécrites à la dernière image.
+
+    Méthodes :
+        - dessiner(especes, environnements) -> pygame.Surface : Met à jour et retourne la surface de la grille.
+        - get_nbModifiees() -> int : Nombre de cases réécrites à la dernière image.
+    """
+
+    def __init__(self, largeur, hauteur, couleurEspeces, couleurHerbe, couleurFond):
+        """[couleurEspeces] : couleur de chaque espèce, dans l'ordre des codes de Population (renard, lapin, ours)."""
+        self.__LARGEUR = largeur
+        self.__HAUTEUR = hauteur
+        self.__palette = RenduGrille.palette(couleurEspeces, couleurHerbe, couleurFond)
+        self.__codes = None
+        self.__image = None
+        self.__surface = None
+        self.__nbModifiees = 0
+
+    @staticmethod
+    def palette(couleurEspeces, couleurHerbe, couleurFond):
+        """Retourne la couleur de chaque code : celle de l'animal s'il y en a un, sinon celle de l'environnement."""
+        couleurs = []
+        for code in range(16):
+            espece, environnement = code & 3, code >> 2
+            if espece > 0:
+                couleurs.append(couleurEspeces[espece - 1])
+            elif environnement == Environnement.HERBE.value:
+                couleurs.append(couleurHerbe)
+            else:
+                couleurs.append(couleurFond)
+        return couleurs
+
+    # Getters
+
+    def get_nbModifiees(self):
+        return self.__nbModifiees
+
+    # Méthodes de classe
+
+    def __creer(self, TAILLE):
+        self.__image = pygame.Surface((TAILLE, TAILLE), depth=8)
+        self.__image.set_palette(self.__palette)
+        self.__surface = pygame.Surface((self.__LARGEUR, self.__HAUTEUR), depth=8)
+        self.__surface.set_palette(self.__palette)
+        self.__codes = None
+
+    def dessiner(self, especes, environnements):
+        codes = encoderImage(especes, environnements)
+        if self.__image is None or self.__image.get_width() != codes.shape[0]:
+            self.__creer(codes.shape[0])
+
+        # Les pixels de l'image 8 bits sont indexés [x, y], comme la grille
+        pixels = pygame.surfarray.pixels2d(self.__image)
+        if self.__codes is None:
+            pixels[...] = codes
+            self.__nbModifiees = codes.size
+        else:
+            modifiees = codes != self.__codes
+            self.__nbModifiees = int(np.count_nonzero(modifiees))
+            if self.__nbModifiees:
+                pixels[modifiees] = codes[modifiees]
+        del pixels  # Déverrouille l'image
+        self.__codes = codes
+
+        if self.__nbModifiees:
+            pygame.transform.scale(self.__image, (self.__LARGEUR, self.__HAUTEUR), self.__surface)
+        return self.__surface
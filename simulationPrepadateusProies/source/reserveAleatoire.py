@@ -0,0 +1,111 @@
+from operator import length_hint
+import numpy as np
+
+
+class ReserveAleatoire():
+
+    """
+    Classe ReserveAleatoire
+
+    Sert les tirages scalaires du moteur (un `integers`, un `binomial(1, p)` ou un `choice` par événement
+    de `bouge`) à partir d'une réserve de nombres uniformes sur [0, 1[, tirés par blocs de [taille] avec
+    le générateur de la simulation. Un appel scalaire à un `numpy.random.Generator` coûte quelques
+    microsecondes ; un nombre lu dans la réserve, une fraction de microseconde.
+
+    Les tirages gardent les mêmes lois :
+        - integers(low, high) : low + int(u * (high - low)), uniforme sur [low, high[ ;
+        - binomial(1, p) : 1 si u < p, 0 sinon ;
+        - choice(a, p) : premier élément dont la probabilité cumulée dépasse u.
+    Les tirages vectoriels (argument [size]) et les autres méthodes sont confiés au générateur.
+    Une même graine donne toujours la même suite de tirages.
+
+    Attributs :
+        - __generateur (np.random.Generator) : Générateur qui remplit la réserve.
+        - __taille (int) : Nombre de valeurs tirées à chaque remplissage.
+        - __suivant (callable) : Retourne la valeur suivante de la réserve (StopIteration si elle est vide).
+
+    Méthodes :
+        - random() -> float : Uniforme sur [0, 1[.
+        - integers(low, high=None, size=None, endpoint=False) -> int : Entier uniforme.
+        - binomial(n, p, size=None) -> int : Tirage binomial.
+        - choice(a, size=None, p=None) : Élément de [a] tiré selon les probabilités [p] (uniformes par défaut).
+        - get_generateur() -> np.random.Generator : Générateur sous-jacent.
+        - exporterEtat() -> dict : État du générateur et valeurs restant dans la réserve.
+        - restaurerEtat(etat) : Reprend un état produit par `exporterEtat` (même suite de tirages).
+    """
+
+    def __init__(self, generateur, taille=8192):
+        if taille < 1:
+            raise ValueError("La taille de la réserve doit être strictement positive")
+        self.__generateur = generateur
+        self.__taille = taille
+        self.__valeurs = []
+        self.__suivant = iter(self.__valeurs).__next__
+
+    # Getters
+
+    def get_generateur(self):
+        return self.__generateur
+
+    def get_taille(self):
+        return self.__taille
+
+    # Méthodes de classe
+
+    def __remplir(self):
+        self.__valeurs = self.__generateur.random(self.__taille).tolist()
+        self.__suivant = iter(self.__valeurs).__next__
+
+    def exporterEtat(self):
+        restantes = length_hint(self.__suivant.__self__)
+        return {"generateur": self.__generateur.bit_generator.state,
+                "reserve": np.array(self.__valeurs[len(self.__valeurs) - restantes:], dtype=np.float64)}
+
+    def restaurerEtat(self, etat):
+        self.__generateur.bit_generator.state = etat["generateur"]
+        self.__valeurs = [float(u) for u in etat["reserve"]]
+        self.__suivant = iter(self.__valeurs).__next__
+
+    def random(self, size=None):
+        if size is not None:
+            return self.__generateur.random(size)
+        try:
+            return self.__suivant()
+        except StopIteration:
+            self.__remplir()
+            return self.__suivant()
+
+    def integers(self, low, high=None, size=None, endpoint=False):
+        if size is not None:
+            return self.__generateur.integers(low, high, size=size, endpoint=endpoint)
+        if high is None:
+            low, high = 0, low
+        if endpoint:
+            high += 1
+        if high <= low:
+            raise ValueError("high <= low")
+        return low + int(self.random() * (high - low))
+
+    def binomial(self, n, p, size=None):
+        if size is not None or n != 1:
+            return self.__generateur.binomial(n, p, size=size)
+        return 1 if self.random() < p else 0
+
+    def choice(self, a, size=None, p=None):
+        if size is not None:
+            return self.__generateur.choice(a, size=size, p=p)
+        if p is None:
+            return a[self.integers(len(a))]
+        u = self.random()
+        cumul = 0.0
+        for valeur, probabilite in zip(a, p):
+            cumul += probabilite
+            if u < cumul:
+                return valeur
+        return a[-1]
+
+    def __getattr__(self, nom):
+        # Autres lois (normal, permutation...) : tirées directement par le générateur
+        if nom.startswith("_"):
+            raise AttributeError(nom)
+        return getattr(self.__generateur, nom)
@@ -0,0 +1,95 @@
+"""
+Sauvegarde et reprise d'une simulation complète dans un fichier NPZ versionné.
+
+Le fichier contient la grille (identifiants et environnements), les colonnes de la population (espèce, sexe,
+âge, nourriture, case, gènes), l'état de l'allocateur d'identifiants, la génération, l'état des générateurs
+aléatoires et les paramètres (`GameRules.PARAMETERS`, `Animal.PARAMETERS`). La reprise copie ces tableaux
+dans ceux du moteur, sans créer d'animal un par un, et continue exactement la même simulation.
+
+Utilisation :
+
+    sauvegarder(gameRules, "sauvegarde.npz")
+    gameRules = charger("sauvegarde.npz")   # applique aussi les paramètres sauvegardés
+"""
+
+import json
+import os
+import numpy as np
+from source.gameRules import GameRules
+from source.animal import Animal
+
+FORMAT = "simulationPrepadateusProies.sauvegarde"
+VERSION = 1
+
+COLONNES_POPULATION = ("especes", "sexes", "ages", "foods", "cases", "genes")
+
+
+def sauvegarder(gameRules, chemin, compresser=True):
+    """Écrit l'état complet de [gameRules] dans [chemin] (NPZ, compressé par défaut).
+
+    Le fichier est d'abord écrit à côté puis renommé : une sauvegarde interrompue ne remplace pas la précédente.
+    Lève une ValueError pour une simulation sur grille creuse (voir `GameRules`), qui ne peut pas être sauvegardée.
+    """
+    if gameRules.estCreuse():
+        raise ValueError("Une simulation sur grille creuse ne peut pas être sauvegardée")
+    etat = gameRules.exporterEtat()
+    tableaux = {
+        "format": np.array(FORMAT),
+        "version": np.array(VERSION),
+        "generation": np.array(etat["generation"]),
+        "grille_ids": etat["grille"]["ids"],
+        "grille_environnements": etat["grille"]["environnements"],
+        "allocateur_recycles": etat["population"]["allocateur"]["recycles"],
+        "allocateur_prochainId": np.array(etat["population"]["allocateur"]["prochainId"]),
+        "rng_generateur": np.array(json.dumps(etat["rng"]["generateur"])),
+        "rng_reserve": etat["rng"]["reserve"],
+        "rng_validation": np.array(json.dumps(etat["rngValidation"])),
+        "parametres": np.array(json.dumps(GameRules.PARAMETERS)),
+        "parametres_animaux": np.array(json.dumps(Animal.PARAMETERS)),
+    }
+    for colonne in COLONNES_POPULATION:
+        tableaux[f"population_{colonne}"] = etat["population"][colonne]
+
+    temporaire = f"{chemin}.tmp"
+    with open(temporaire, "wb") as fichier:
+        (np.savez_compressed if compresser else np.savez)(fichier, **tableaux)
+    os.replace(temporaire, chemin)
+
+
+def lireEtat(chemin):
+    """Lit un fichier de sauvegarde et retourne (etat, parametres, parametresAnimaux).
+
+    [etat] a la forme produite par `GameRules.exporterEtat`. Lève une ValueError si le fichier n'est pas une
+    sauvegarde ou si sa version n'est pas prise en charge.
+    """
+    with np.load(chemin, allow_pickle=False) as fichier:
+        if "format" not in fichier.files or str(fichier["format"]) != FORMAT:
+            raise ValueError(f"{chemin} n'est pas une sauvegarde de simulation")
+        version = int(fichier["version"])
+        if version != VERSION:
+            raise ValueError(f"Version de sauvegarde non prise en charge : {version} (attendue : {VERSION})")
+        etat = {
+            "generation": int(fichier["generation"]),
+            "grille": {"ids": fichier["grille_ids"], "environnements": fichier["grille_environnements"]},
+            "population": {colonne: fichier[f"population_{colonne}"] for colonne in COLONNES_POPULATION},
+            "rng": {"generateur": json.loads(str(fichier["rng_generateur"])), "reserve": fichier["rng_reserve"]},
+            "rngValidation": json.loads(str(fichier["rng_validation"])),
+        }
+        etat["population"]["allocateur"] = {"recycles": fichier["allocateur_recycles"],
+                                            "prochainId": int(fichier["allocateur_prochainId"])}
+        parametres = json.loads(str(fichier["parametres"]))
+        parametresAnimaux = json.loads(str(fichier["parametres_animaux"]))
+    return etat, parametres, parametresAnimaux
+
+
+def charger(chemin, appliquerParametres=True):
+    """Retourne le GameRules sauvegardé dans [chemin].
+
+    Si [appliquerParametres] est vrai, `GameRules.PARAMETERS` et `Animal.PARAMETERS` reprennent les valeurs
+    sauvegardées (les règles de la simulation reprise sont alors les mêmes).
+    """
+    etat, parametres, parametresAnimaux = lireEtat(chemin)
+    if appliquerParametres:
+        GameRules.PARAMETERS = parametres
+        Animal.PARAMETERS = parametresAnimaux
+    return GameRules(etat=etat)
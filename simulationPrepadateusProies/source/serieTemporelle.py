@@ -0,0 +1,164 @@
+import numpy as np
+
+
+class SerieTemporelle():
+
+    """
+    Classe SerieTemporelle
+
+    Historique de plusieurs séries (par exemple les effectifs de chaque espèce) en mémoire bornée, quelle que
+    soit la durée de la simulation.
+
+    Les valeurs sont résumées par seaux : minimum, maximum et somme (pour la moyenne) des points couverts.
+    Deux sortes de niveaux sont tenus à jour à chaque point ajouté :
+        - [nbNiveaux] niveaux de résolution fixe : le niveau l garde, dans un tampon circulaire, les [capacite]
+          derniers seaux de facteur**l points (le niveau 0 garde donc les [capacite] derniers points tels quels).
+          Chaque seau complet d'un niveau alimente le seau en cours du niveau suivant : un ajout coûte O(1) amorti.
+        - un niveau global, qui couvre tout l'historique depuis le premier point avec au plus [capacite] seaux :
+          quand ils sont tous remplis, ils sont fusionnés deux à deux et leur taille double.
+    La mémoire occupée est de (nbNiveaux + 1) x capacite seaux par série.
+
+    Attributs :
+        - __nbSeries (int) : Nombre de séries (une valeur par série à chaque point).
+        - __capacite (int) : Nombre de seaux de chaque niveau (pair).
+        - __facteur (int) : Rapport entre les tailles des seaux de deux niveaux consécutifs.
+        - __mins, __maxs, __sommes (np.ndarray) : Seaux des niveaux fixes ([niveau, seau, serie]).
+        - __nbSeaux (list) : Nombre de seaux complets produits par chaque niveau fixe depuis le début.
+        - __partiels (list) : Seau en cours (min, max, somme, nombre de seaux du niveau inférieur) de chaque niveau.
+        - __globalMins, __globalMaxs, __globalSommes (np.ndarray) : Seaux du niveau global ([seau, serie]).
+        - __pas (int) : Nombre de points par seau du niveau global.
+        - __nbPoints (int) : Nombre de points ajoutés.
+
+    Méthodes :
+        - ajouter(valeurs) : Ajoute un point (une valeur par série).
+        - fenetre(nbPoints=None) -> tuple : Seaux couvrant les [nbPoints] derniers points (tout l'historique
+          par défaut), au niveau le plus fin qui les contient encore : (debuts, mins, maxs, moyennes), où
+          [debuts] est l'indice du premier point de chaque seau. Coût proportionnel au nombre de seaux retournés.
+        - reinitialiser() : Efface l'historique.
+    """
+
+    def __init__(self, nbSeries, capacite=1024, facteur=4, nbNiveaux=4):
+        if capacite < 2 or capacite % 2 or facteur < 2 or nbNiveaux < 1 or facteur ** (nbNiveaux - 1) > capacite:
+            raise ValueError("Paramètres invalides : capacité paire, facteur >= 2, facteur**(nbNiveaux - 1) <= capacité")
+        self.__nbSeries = nbSeries
+        self.__capacite = capacite
+        self.__facteur = facteur
+        self.__nbNiveaux = nbNiveaux
+        self.__mins = np.zeros((nbNiveaux, capacite, nbSeries), dtype=np.int64)
+        self.__maxs = np.zeros((nbNiveaux, capacite, nbSeries), dtype=np.int64)
+        self.__sommes = np.zeros((nbNiveaux, capacite, nbSeries), dtype=np.int64)
+        self.__globalMins = np.zeros((capacite, nbSeries), dtype=np.int64)
+        self.__globalMaxs = np.zeros((capacite, nbSeries), dtype=np.int64)
+        self.__globalSommes = np.zeros((capacite, nbSeries), dtype=np.int64)
+        self.reinitialiser()
+
+    # Getters
+
+    def get_nbPoints(self):
+        return self.__nbPoints
+
+    def get_pas(self):
+        """Nombre de points par seau du niveau global."""
+        return self.__pas
+
+    def get_capacite(self):
+        return self.__capacite
+
+    # Méthodes de classe
+
+    def reinitialiser(self):
+        self.__nbPoints = 0
+        self.__nbSeaux = [0] * self.__nbNiveaux
+        self.__partiels = [None] * self.__nbNiveaux
+        self.__globalRemplis = 0
+        self.__pas = 1
+        self.__dansSeau = 0
+
+    def ajouter(self, valeurs):
+        valeurs = np.asarray(valeurs, dtype=np.int64)
+        self.__pousser(0, valeurs, valeurs, valeurs)
+        self.__ajouterGlobal(valeurs)
+        self.__nbPoints += 1
+
+    def __pousser(self, niveau, mn, mx, somme):
+        """Range un seau complet dans le niveau [niveau] et l'ajoute au seau en cours du niveau suivant."""
+        indice = self.__nbSeaux[niveau] % self.__capacite
+        self.__mins[niveau, indice] = mn
+        self.__maxs[niveau, indice] = mx
+        self.__sommes[niveau, indice] = somme
+        self.__nbSeaux[niveau] += 1
+        suivant = niveau + 1
+        if suivant == self.__nbNiveaux:
+            return
+        partiel = self.__partiels[suivant]
+        if partiel is None:
+            self.__partiels[suivant] = partiel = [mn.copy(), mx.copy(), somme.copy(), 0]
+        else:
+            np.minimum(partiel[0], mn, out=partiel[0])
+            np.maximum(partiel[1], mx, out=partiel[1])
+            partiel[2] += somme
+        partiel[3] += 1
+        if partiel[3] == self.__facteur:
+            self.__partiels[suivant] = None
+            self.__pousser(suivant, partiel[0], partiel[1], partiel[2])
+
+    def __ajouterGlobal(self, valeurs):
+        if self.__globalRemplis == 0 or self.__dansSeau == self.__pas:
+            if self.__globalRemplis == self.__capacite:
+                # Tous les seaux sont remplis : fusion deux à deux
+                moitie = self.__capacite // 2
+                self.__globalMins[:moitie] = np.minimum(self.__globalMins[0::2], self.__globalMins[1::2])
+                self.__globalMaxs[:moitie] = np.maximum(self.__globalMaxs[0::2], self.__globalMaxs[1::2])
+                self.__globalSommes[:moitie] = self.__globalSommes[0::2] + self.__globalSommes[1::2]
+                self.__globalRemplis = moitie
+                self.__pas *= 2
+            seau = self.__globalRemplis
+            self.__globalMins[seau] = valeurs
+            self.__globalMaxs[seau] = valeurs
+            self.__globalSommes[seau] = valeurs
+            self.__globalRemplis += 1
+            self.__dansSeau = 1
+        else:
+            seau = self.__globalRemplis - 1
+            np.minimum(self.__globalMins[seau], valeurs, out=self.__globalMins[seau])
+            np.maximum(self.__globalMaxs[seau], valeurs, out=self.__globalMaxs[seau])
+            self.__globalSommes[seau] += valeurs
+            self.__dansSeau += 1
+
+    def fenetre(self, nbPoints=None):
+        if nbPoints is None or nbPoints >= self.__nbPoints:
+            nbPoints = self.__nbPoints
+        taille = 1
+        for niveau in range(self.__nbNiveaux):
+            # Niveau fixe le plus fin dont les seaux couvrent encore toute la fenêtre
+            if self.__capacite * taille >= nbPoints + taille:
+                return self.__fenetreNiveau(niveau, taille, self.__nbPoints - nbPoints)
+            taille *= self.__facteur
+        return self.__fenetreGlobale(self.__nbPoints - nbPoints)
+
+    def __fenetreNiveau(self, niveau, taille, debut):
+        nbSeaux = self.__nbSeaux[niveau]
+        premier = debut // taille
+        indices = np.arange(premier, nbSeaux) % self.__capacite
+        debuts = np.arange(premier, nbSeaux) * taille
+        mins = self.__mins[niveau, indices]
+        maxs = self.__maxs[niveau, indices]
+        moyennes = self.__sommes[niveau, indices] / taille
+        # Points qui ne forment pas encore un seau complet : lus au niveau 0, qui les contient tous
+        reste = self.__nbPoints - nbSeaux * taille
+        if reste > 0 and niveau > 0:
+            derniers = (np.arange(self.__nbPoints - reste, self.__nbPoints)) % self.__capacite
+            debuts = np.append(debuts, nbSeaux * taille)
+            mins = np.vstack((mins, self.__mins[0, derniers].min(axis=0)))
+            maxs = np.vstack((maxs, self.__maxs[0, derniers].max(axis=0)))
+            moyennes = np.vstack((moyennes, self.__sommes[0, derniers].mean(axis=0)))
+        return debuts, mins, maxs, moyennes
+
+    def __fenetreGlobale(self, debut):
+        n = self.__globalRemplis
+        premier = min(debut // self.__pas, n)
+        nombres = np.full(n - premier, self.__pas)
+        if n > premier:
+            nombres[-1] = self.__dansSeau
+        return (np.arange(premier, n) * self.__pas, self.__globalMins[premier:n], self.__globalMaxs[premier:n],
+                self.__globalSommes[premier:n] / nombres[:, None])
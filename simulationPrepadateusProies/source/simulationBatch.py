@@ -0,0 +1,239 @@
+"""
+Exécution de la simulation sans interface graphique (ni pygame, ni matplotlib).
+
+Utilisation en ligne de commande, depuis la racine du projet :
+
+    python3 -m source.simulationBatch --generations 500 --graine 1 --sortie resultats.csv
+    python3 -m source.simulationBatch --param Taille=200 --param ProbaBirthR=0.2 --sortie resultats.npz
+
+Utilisation en Python :
+
+    resultats = simuler({"Taille": 200}, {"ProbaBirthR": 0.2}, graine=1, nbGenerations=500)
+    ecrireResultats(resultats, "resultats.csv")
+
+Les résultats sont un dictionnaire {nom de colonne: np.ndarray}, avec une ligne par génération
+(la ligne 0 décrit l'état initial) : effectifs par espèce, nombre de cases d'herbe et fréquences
+des allèles de chaque gène pour les renards et les lapins.
+"""
+
+import argparse
+import csv
+import numpy as np
+from source.gameRules import GameRules
+from source.generationParallele import GenerationParallele
+from source.animal import Animal
+from source.genes import Genes
+from source.instrumentation import Instrumentation
+from source.sauvegarde import lireEtat, sauvegarder
+from source.trajectoire import EnregistreurTrajectoire
+
+# Mêmes valeurs par défaut que l'écran de paramètres de l'interface graphique
+PARAMETRES_DEFAUT = {"Lapins": 2000, "Renards": 700,
+                     "Ours": 100, "Taille": 100, "Apparition herbe (%)": 10}
+PARAMETRES_ANIMAUX_DEFAUT = dict(Animal.PARAMETERS)
+
+# Allèles possibles d'un gène (voir genes.create_random)
+ALLELES = (0, 1, 2, 3)
+ESPECES_GENES = ("Renard", "Lapin")
+
+
+def colonnes():
+    """Retourne les noms des colonnes produites par `simuler`, dans l'ordre."""
+    noms = ["generation", "renards", "lapins", "ours", "herbe"]
+    for espece in ESPECES_GENES:
+        for gene in Genes:
+            for allele in ALLELES:
+                noms.append(f"{espece}_{gene}_{allele}")
+    return noms
+
+
+def mesurer(gameRules):
+    """Retourne la ligne de résultats (liste alignée sur `colonnes()`) de l'état courant."""
+    effectifs = gameRules.get_population().effectifs()
+    herbe = gameRules.get_grille().nbHerbe()
+    ligne = [gameRules.get_generation(), int(effectifs[0]), int(effectifs[1]), int(effectifs[2]), int(herbe)]
+    frequences = gameRules.get_population().alleleFrequenciesByGeneByAnimal()
+    for espece in ESPECES_GENES:
+        for gene in Genes:
+            frequencesGene = frequences[espece].get(gene, {})
+            for allele in ALLELES:
+                ligne.append(frequencesGene.get(allele, 0.0))
+    return ligne
+
+
+def simuler(parametres=None, parametresAnimaux=None, graine=None, nbGenerations=100,
+            arretSiFini=True, ajoutsOurs=(), rappel=None, instrumentation=None, reprise=None, sauvegarde=None,
+            trajectoire=None, creuse=False, parallele=None):
+    """Simule [nbGenerations] générations et retourne les résultats par génération.
+
+    Arguments :
+        - parametres (dict) : valeurs de `GameRules.PARAMETERS` (complétées par PARAMETRES_DEFAUT).
+        - parametresAnimaux (dict) : valeurs de `Animal.PARAMETERS` (complétées par PARAMETRES_ANIMAUX_DEFAUT).
+        - graine (int ou np.random.SeedSequence) : graine du générateur de la simulation, pour la rejouer.
+        - arretSiFini (bool) : s'arrête dès que `estFiniJeu()` est vrai.
+        - ajoutsOurs (iterable) : générations auxquelles `addOursAleatoire()` est appelée
+          (comme un clic sur le bouton ours ; 0 = avant la première génération).
+        - rappel (callable) : appelé avec (gameRules, ligne) après chaque mesure.
+        - instrumentation (Instrumentation) : reçoit le temps passé dans chaque phase de `generation`.
+        - reprise (str) : fichier de sauvegarde (voir le module `sauvegarde`) dont la simulation repart ; ses
+          paramètres sont complétés (et remplacés) par [parametres] et [parametresAnimaux], [graine] est ignorée.
+        - sauvegarde (str) : fichier dans lequel l'état final de la simulation est sauvegardé.
+        - trajectoire (str) : fichier dans lequel la grille de chaque génération est enregistrée
+          (voir le module `trajectoire`).
+        - creuse (bool) : grille découpée en tuiles allouées à la demande (voir `GameRules`), pour les très
+          grandes grilles peu peuplées ; incompatible avec [reprise], [sauvegarde] et [trajectoire].
+        - parallele (int) : nombre de processus entre lesquels les bandes de la grille sont réparties à chaque
+          génération (voir le module `generationParallele`) ; None : génération séquentielle. Les résultats
+          diffèrent de ceux de la génération séquentielle, mais pas selon le nombre de processus. L'extraction
+          et le report des bandes coûtent environ 50 % d'une génération séquentielle : à réserver aux grandes
+          grilles sur une machine à plusieurs cœurs.
+
+    Les paramètres de classe modifiés sont restaurés à la fin de la simulation.
+    """
+    if creuse and (reprise is not None or sauvegarde is not None):
+        # Refus avant de simuler, plutôt qu'un échec à la sauvegarde finale
+        raise ValueError("Une simulation sur grille creuse ne peut être ni reprise, ni sauvegardée")
+    anciensParametres = (GameRules.PARAMETERS, Animal.PARAMETERS)
+    enregistreur = None
+    generationParallele = None
+    try:
+        if reprise is None:
+            etat, parametresBase, parametresAnimauxBase = None, PARAMETRES_DEFAUT, PARAMETRES_ANIMAUX_DEFAUT
+        else:
+            etat, parametresBase, parametresAnimauxBase = lireEtat(reprise)
+        GameRules.PARAMETERS = parametresBase | (parametres or {})
+        Animal.PARAMETERS = parametresAnimauxBase | (parametresAnimaux or {})
+        ajoutsOurs = set(ajoutsOurs)
+        gameRules = GameRules(graine, etat=etat, creuse=creuse)
+        gameRules.set_instrumentation(instrumentation)
+        if trajectoire is not None:
+            enregistreur = EnregistreurTrajectoire(trajectoire)
+            enregistreur.attacher(gameRules)
+        if parallele is not None:
+            generationParallele = GenerationParallele(gameRules, nbProcessus=parallele)
+        generation = gameRules.generation if generationParallele is None else generationParallele.generation
+        lignes = []
+
+        def mesurerEtNotifier():
+            ligne = mesurer(gameRules)
+            lignes.append(ligne)
+            if rappel is not None:
+                rappel(gameRules, ligne)
+
+        mesurerEtNotifier()
+        for numero in range(nbGenerations):
+            if arretSiFini and gameRules.estFiniJeu():
+                break
+            if numero in ajoutsOurs:
+                gameRules.addOursAleatoire()
+            generation()
+            mesurerEtNotifier()
+        if sauvegarde is not None:
+            sauvegarder(gameRules, sauvegarde)
+    finally:
+        GameRules.PARAMETERS, Animal.PARAMETERS = anciensParametres
+        if enregistreur is not None:
+            enregistreur.fermer()
+        if generationParallele is not None:
+            generationParallele.fermer()
+
+    tableau = np.array(lignes, dtype=np.float64)
+    resultats = {}
+    for i, nom in enumerate(colonnes()):
+        resultats[nom] = tableau[:, i].astype(np.int64) if i < 5 else tableau[:, i]
+    return resultats
+
+
+def ecrireResultats(resultats, chemin):
+    """Écrit les résultats en CSV ou en NPZ (compressé) selon l'extension du fichier."""
+    if str(chemin).endswith(".npz"):
+        np.savez_compressed(chemin, **resultats)
+        return
+    noms = list(resultats.keys())
+    with open(chemin, "w", newline="") as fichier:
+        ecrivain = csv.writer(fichier)
+        ecrivain.writerow(noms)
+        for i in range(len(resultats[noms[0]])):
+            ecrivain.writerow([resultats[nom][i] for nom in noms])
+
+
+def lireNombre(texte):
+    """Convertit un texte en nombre : entier s'il est écrit comme un entier ("5"), flottant sinon ("5.0", "1e-3").
+
+    L'écriture décide du type, pas la valeur : "0.0:1.0" reste un intervalle de flottants pour `balayage`.
+    """
+    try:
+        return int(texte)
+    except ValueError:
+        return float(texte)
+
+
+def separerParametres(valeurs):
+    """Sépare un dictionnaire {cle: valeur} entre GameRules.PARAMETERS et Animal.PARAMETERS."""
+    parametres, parametresAnimaux = {}, {}
+    for cle, valeur in valeurs.items():
+        if cle in PARAMETRES_ANIMAUX_DEFAUT:
+            parametresAnimaux[cle] = valeur
+        elif cle in PARAMETRES_DEFAUT:
+            parametres[cle] = valeur
+        else:
+            raise ValueError(f"Paramètre inconnu : {cle}")
+    return parametres, parametresAnimaux
+
+
+def lireParametres(valeurs):
+    """Sépare les arguments `cle=valeur` entre GameRules.PARAMETERS et Animal.PARAMETERS."""
+    lus = {}
+    for valeur in valeurs:
+        cle, _, texte = valeur.partition("=")
+        if not texte:
+            raise ValueError(f"Paramètre invalide (attendu cle=valeur) : {valeur}")
+        lus[cle] = lireNombre(texte)
+    return separerParametres(lus)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Simulation proies-prédateurs sans interface graphique.")
+    parser.add_argument("--generations", type=int, default=100,
+                        help="nombre maximal de générations")
+    parser.add_argument("--graine", type=int, default=None,
+                        help="graine aléatoire")
+    parser.add_argument("--param", action="append", default=[], metavar="CLE=VALEUR",
+                        help="paramètre de GameRules.PARAMETERS ou Animal.PARAMETERS (répétable)")
+    parser.add_argument("--ours", action="append", type=int, default=[], metavar="GENERATION",
+                        help="génération à laquelle ajouter des ours (répétable)")
+    parser.add_argument("--continuer", action="store_true",
+                        help="ne pas s'arrêter à l'extinction des renards ou des lapins")
+    parser.add_argument("--sortie", default="resultats.csv",
+                        help="fichier de sortie (.csv ou .npz)")
+    parser.add_argument("--reprise", default=None,
+                        help="fichier de sauvegarde dont la simulation repart")
+    parser.add_argument("--sauvegarde", default=None,
+                        help="fichier dans lequel sauvegarder l'état final")
+    parser.add_argument("--trajectoire", default=None,
+                        help="fichier dans lequel enregistrer la grille de chaque génération")
+    parser.add_argument("--creuse", action="store_true",
+                        help="grille creuse (tuiles allouées à la demande), pour les très grandes grilles peu peuplées")
+    parser.add_argument("--parallele", type=int, default=None, metavar="PROCESSUS",
+                        help="répartit chaque génération sur PROCESSUS processus, par bandes de la grille ; "
+                             "environ 1,5 fois plus lent que la génération séquentielle avec un seul processus, "
+                             "à réserver aux grandes grilles sur plusieurs cœurs")
+    parser.add_argument("--profil", action="store_true",
+                        help="affiche le temps passé dans chaque phase de la simulation")
+    args = parser.parse_args(arguments)
+
+    parametres, parametresAnimaux = lireParametres(args.param)
+    instrumentation = Instrumentation() if args.profil else None
+    resultats = simuler(parametres, parametresAnimaux, graine=args.graine, nbGenerations=args.generations,
+                        arretSiFini=not args.continuer, ajoutsOurs=args.ours, instrumentation=instrumentation,
+                        reprise=args.reprise, sauvegarde=args.sauvegarde, trajectoire=args.trajectoire, creuse=args.creuse,
+                        parallele=args.parallele)
+    ecrireResultats(resultats, args.sortie)
+    print(f"{len(resultats['generation']) - 1} générations simulées, résultats écrits dans {args.sortie}")
+    if instrumentation is not None:
+        print(instrumentation)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Simulation dans un fil d'exécution séparé de l'affichage.
+
+Le fil de simulation enchaîne les générations et publie après chacune un `Instantane` (copie en lecture seule
+de la grille, effectifs, fréquences des allèles) dans une file bornée. L'interface lit les instantanés à son
+propre rythme et n'envoie que des commandes (pause, ajout d'ours, sauvegarde, arrêt) : un affichage lent ne
+ralentit pas la simulation, et une génération longue ne bloque pas l'interface.
+
+Utilisation :
+
+    simulation = SimulationEnFond(gameRules, generationsParSeconde=10)
+    simulation.demarrer()
+    ...
+    for instantane in simulation.instantanes():   # instantanés publiés depuis le dernier appel
+        ...
+    simulation.ajouterOurs()
+    simulation.arreter()
+"""
+
+import queue
+import threading
+from time import perf_counter, sleep
+from source.instrumentation import mesurer
+from source.sauvegarde import sauvegarder
+
+
+class Instantane():
+
+    """
+    Classe Instantane
+
+    État publié par la simulation après une génération. Les tableaux sont des copies en lecture seule :
+    l'interface peut les garder et les afficher pendant que la simulation continue.
+
+    Attributs :
+        - __generation (int) : Génération décrite.
+        - __especes (np.ndarray) : Occupation de la grille (codes de `GameRules.grilleEspeces`).
+        - __environnements (np.ndarray) : Environnement de chaque case.
+        - __effectifs (tuple) : Nombre de renards, lapins et ours.
+        - __alleles (dict) : Fréquences des allèles (`Population.alleleFrequenciesByGeneByAnimal`).
+        - __comptesAlleles (np.ndarray) : Compteurs d'allèles (`Population.comptesAlleles`), pour savoir si
+          l'histogramme a changé.
+    """
+
+    def __init__(self, gameRules):
+        self.__generation = gameRules.get_generation()
+        self.__especes = gameRules.grilleEspeces()
+        self.__especes.setflags(write=False)
+        self.__environnements = gameRules.get_grille().get_grilleEnvironnements().copy()
+        self.__environnements.setflags(write=False)
+        population = gameRules.get_population()
+        self.__effectifs = tuple(int(n) for n in population.effectifs())
+        self.__alleles = population.alleleFrequenciesByGeneByAnimal()
+        self.__comptesAlleles = population.comptesAlleles().copy()
+        self.__comptesAlleles.setflags(write=False)
+
+    # Getters
+
+    def get_generation(self):
+        return self.__generation
+
+    def get_especes(self):
+        return self.__especes
+
+    def get_environnements(self):
+        return self.__environnements
+
+    def get_effectifs(self):
+        return self.__effectifs
+
+    def get_alleles(self):
+        return self.__alleles
+
+    def get_comptesAlleles(self):
+        return self.__comptesAlleles
+
+
+class SimulationEnFond():
+
+    """
+    Classe SimulationEnFond
+
+    Fait avancer un `GameRules` dans un fil d'exécution dédié. Seul ce fil modifie la simulation : les
+    commandes de l'interface passent par une file et sont appliquées entre deux générations.
+
+    Attributs :
+        - __gameRules (GameRules) : Simulation.
+        - __instantanes (queue.Queue) : Instantanés publiés, pas encore lus. Bornée : si l'interface ne suit
+          pas, la simulation attend au lieu d'accumuler des copies de la grille.
+        - __commandes (queue.Queue) : Commandes en attente (pause, reprise, ours, sauvegarde, arrêt).
+        - __generationsParSeconde (float ou None) : Vitesse maximale de la simulation (None : sans limite).
+        - __erreur (Exception) : Erreur survenue dans le fil de simulation, relancée par `instantanes`.
+
+    Méthodes :
+        - demarrer() : Publie l'état courant puis lance les générations.
+        - instantanes() -> list : Instantanés publiés depuis le dernier appel (sans attendre).
+        - pause() / reprendre() / ajouterOurs() / sauvegarder(chemin) : Commandes appliquées entre deux générations.
+        - arreter() : Arrête le fil de simulation et attend sa fin ; le GameRules peut ensuite être lu directement.
+    """
+
+    PAUSE = "pause"
+    REPRENDRE = "reprendre"
+    OURS = "ours"
+    SAUVEGARDER = "sauvegarder"
+    ARRETER = "arreter"
+
+    def __init__(self, gameRules, generationsParSeconde=None, tailleFile=8):
+        self.__gameRules = gameRules
+        self.__generationsParSeconde = generationsParSeconde
+        self.__instantanes = queue.Queue(maxsize=tailleFile)
+        self.__commandes = queue.Queue()
+        self.__pause = False
+        self.__arret = threading.Event()
+        self.__erreur = None
+        self.__fil = threading.Thread(target=self.__simuler, name="SimulationEnFond", daemon=True)
+
+    # Getters
+
+    def get_gameRules(self):
+        return self.__gameRules
+
+    def estEnPause(self):
+        return self.__pause
+
+    # Setters
+
+    def set_generationsParSeconde(self, generationsParSeconde):
+        self.__generationsParSeconde = generationsParSeconde
+
+    # Méthodes de classe
+
+    def demarrer(self):
+        self.__fil.start()
+
+    def instantanes(self):
+        if self.__erreur is not None:
+            raise self.__erreur
+        publies = []
+        while True:
+            try:
+                publies.append(self.__instantanes.get_nowait())
+            except queue.Empty:
+                return publies
+
+    def pause(self):
+        self.__pause = True
+        self.__commandes.put((SimulationEnFond.PAUSE,))
+
+    def reprendre(self):
+        self.__pause = False
+        self.__commandes.put((SimulationEnFond.REPRENDRE,))
+
+    def ajouterOurs(self):
+        self.__commandes.put((SimulationEnFond.OURS,))
+
+    def sauvegarder(self, chemin):
+        self.__commandes.put((SimulationEnFond.SAUVEGARDER, chemin))
+
+    def arreter(self):
+        self.__arret.set()
+        self.__commandes.put((SimulationEnFond.ARRETER,))
+        if self.__fil.is_alive():
+            self.__fil.join()
+        if self.__erreur is not None:
+            raise self.__erreur
+
+    def __appliquer(self, commande):
+        """Applique une commande dans le fil de simulation ; retourne l'état de pause qui en résulte."""
+        nom = commande[0]
+        if nom == SimulationEnFond.OURS:
+            self.__gameRules.addOursAleatoire()
+        elif nom == SimulationEnFond.SAUVEGARDER:
+            sauvegarder(self.__gameRules, commande[1])
+        return {SimulationEnFond.PAUSE: True, SimulationEnFond.REPRENDRE: False}.get(nom)
+
+    def __publier(self):
+        instantane = Instantane(self.__gameRules)
+        while not self.__arret.is_set():
+            try:
+                self.__instantanes.put(instantane, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def __simuler(self):
+        gameRules = self.__gameRules
+        instrumentation = gameRules.get_instrumentation()
+        enPause = False
+        try:
+            self.__publier()
+            prochaine = perf_counter()
+            while not self.__arret.is_set():
+                # Commandes en attente ; en pause, on attend la suivante sans consommer de temps de calcul
+                while enPause or not self.__commandes.empty():
+                    commande = self.__commandes.get()
+                    if commande[0] == SimulationEnFond.ARRETER:
+                        return
+                    pause = self.__appliquer(commande)
+                    if pause is not None:
+                        enPause = pause
+                        prochaine = perf_counter()
+                    if enPause and commande[0] == SimulationEnFond.OURS:
+                        # En pause, aucune génération ne publiera l'ours ajouté : on le montre tout de suite
+                        self.__publier()
+                gameRules.generation()
+                with mesurer(instrumentation, "validation"):
+                    gameRules.valider()
+                with mesurer(instrumentation, "instantane"):
+                    self.__publier()
+                if self.__generationsParSeconde:
+                    prochaine += 1 / self.__generationsParSeconde
+                    attente = prochaine - perf_counter()
+                    if attente > 0:
+                        sleep(attente)
+                    else:
+                        prochaine = perf_counter()
+        except Exception as erreur:
+            self.__erreur = erreur
@@ -0,0 +1,293 @@
+"""
+Enregistrement de la trajectoire d'une simulation : l'occupation (espèce) et l'environnement de chaque case,
+à chaque génération, dans un fichier binaire en ajout seul.
+
+Chaque génération est codée en une image d'un octet par case (`espece + 4 * environnement`, voir
+`encoderImage`). Une image sur [intervalleCles] est une image clé, compressée telle quelle ; les autres sont
+des différences (XOR) avec l'image précédente, presque nulles d'une génération à l'autre, compressées par zlib.
+La compression et l'écriture se font dans un fil d'exécution séparé : la simulation ne fait qu'une copie de la
+grille par génération.
+
+Format du fichier (petit-boutiste) :
+    - en-tête : "TRAJ", version (uint16), TAILLE (uint32), intervalle des images clés (uint32) ;
+    - un enregistrement par génération : type (uint8, 0 = clé, 1 = différence), génération (uint64),
+      renards, lapins, ours, cases d'herbe (4 x uint32), taille des données (uint32), données zlib ;
+    - à la fermeture : table des enregistrements (nombre (uint64), puis génération, position, type et effectifs
+      de chaque enregistrement, voir TABLE), suivie de "INDX" et de la position de la table (uint64).
+      La lecture d'une génération part de l'image clé qui la précède. Un fichier sans table (simulation
+      interrompue) reste lisible : la table est alors reconstruite en parcourant les en-têtes.
+
+Utilisation :
+
+    with EnregistreurTrajectoire("trajectoire.traj") as enregistreur:
+        enregistreur.attacher(gameRules)   # enregistre l'état courant puis chaque génération
+        for _ in range(1000):
+            gameRules.generation()
+    lecteur = LecteurTrajectoire("trajectoire.traj")
+    generation, especes, environnements, comptes = lecteur.lire(500)   # accès direct à une génération
+    for generation, especes, environnements, comptes in lecteur:       # lecture dans l'ordre
+        ...
+"""
+
+import queue
+import struct
+import threading
+import zlib
+import numpy as np
+from source.environnement import Environnement
+
+MAGIC = b"TRAJ"
+# Version 2 : table des enregistrements (TABLE) à la fermeture, au lieu de l'index (génération, position)
+VERSION = 2
+ENTETE = struct.Struct("<4sHII")
+ENREGISTREMENT = struct.Struct("<BQIIIII")
+PIED = struct.Struct("<4sQ")
+MAGIC_INDEX = b"INDX"
+TABLE = np.dtype([("generation", "<u8"), ("position", "<u8"), ("type", "u1"), ("comptes", "<u4", (4,))])
+CLE = 0
+DELTA = 1
+
+
+def encoderImage(especes, environnements):
+    """Retourne l'image (uint8) d'une génération : `especes + 4 * environnements`, case par case.
+
+    [especes] est la grille produite par `GameRules.grilleEspeces` (0 à 3), [environnements] celle des valeurs
+    d'`Environnement`.
+    """
+    return (especes.astype(np.uint8) | (environnements.astype(np.uint8) << 2))
+
+
+def decoderImage(image):
+    """Retourne (especes, environnements) d'une image produite par `encoderImage`."""
+    return image & 3, image >> 2
+
+
+class EnregistreurTrajectoire():
+
+    """
+    Classe EnregistreurTrajectoire
+
+    Écrit la trajectoire d'une simulation dans un fichier (voir le format dans la documentation du module).
+
+    Attributs :
+        - __chemin (str) : Fichier de sortie.
+        - __intervalleCles (int) : Une image clé toutes les [intervalleCles] générations enregistrées.
+        - __niveauCompression (int) : Niveau de compression zlib (0 à 9).
+        - __file (queue.Queue) : Images en attente d'écriture ; bornée, elle ralentit la simulation plutôt que
+          d'accumuler les images en mémoire si l'écriture prend du retard.
+        - __fil (threading.Thread) : Fil d'exécution qui compresse et écrit les images.
+        - __erreur (Exception) : Erreur survenue pendant l'écriture, relancée par `enregistrer` et `fermer`.
+
+    Méthodes :
+        - attacher(gameRules) : Enregistre l'état courant puis chaque génération de [gameRules].
+        - detacher(gameRules) : Arrête l'enregistrement des générations de [gameRules].
+        - enregistrer(gameRules) : Enregistre l'état courant de [gameRules].
+        - fermer() : Attend l'écriture des images en attente, écrit l'index et ferme le fichier.
+    """
+
+    def __init__(self, chemin, intervalleCles=100, niveauCompression=6, tailleFile=32):
+        if intervalleCles < 1:
+            raise ValueError("L'intervalle des images clés doit être strictement positif")
+        self.__chemin = chemin
+        self.__intervalleCles = intervalleCles
+        self.__niveauCompression = niveauCompression
+        self.__fichier = open(chemin, "wb")
+        self.__file = queue.Queue(maxsize=tailleFile)
+        self.__erreur = None
+        self.__ferme = False
+        self.__fil = threading.Thread(target=self.__ecrire, name="EnregistreurTrajectoire", daemon=True)
+        self.__fil.start()
+
+    # Getters
+
+    def get_chemin(self):
+        return self.__chemin
+
+    # Méthodes de classe
+
+    def attacher(self, gameRules):
+        self.enregistrer(gameRules)
+        gameRules.ajouterObservateur(self.enregistrer)
+
+    def detacher(self, gameRules):
+        gameRules.retirerObservateur(self.enregistrer)
+
+    def enregistrer(self, gameRules):
+        if self.__erreur is not None:
+            raise self.__erreur
+        if self.__ferme:
+            raise ValueError("Enregistreur fermé")
+        grille = gameRules.get_grille()
+        image = encoderImage(gameRules.grilleEspeces(), grille.get_grilleEnvironnements())
+        effectifs = gameRules.get_population().effectifs()
+        self.__file.put((gameRules.get_generation(), image, effectifs))
+
+    def fermer(self):
+        if not self.__ferme:
+            self.__ferme = True
+            self.__file.put(None)
+            self.__fil.join()
+        if self.__erreur is not None:
+            raise self.__erreur
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+    def __ecrire(self):
+        fichier = self.__fichier
+        table = []
+        precedente = None
+        nbImages = 0
+        try:
+            while True:
+                element = self.__file.get()
+                if element is None:
+                    break
+                if self.__erreur is not None:
+                    continue  # Vide la file sans écrire : la simulation ne reste pas bloquée
+                generation, image, effectifs = element
+                if precedente is None:
+                    fichier.write(ENTETE.pack(MAGIC, VERSION, image.shape[0], self.__intervalleCles))
+                cle = nbImages % self.__intervalleCles == 0
+                donnees = zlib.compress((image if cle else image ^ precedente).tobytes(), self.__niveauCompression)
+                herbe = np.count_nonzero((image >> 2) == Environnement.HERBE.value)
+                comptes = (int(effectifs[0]), int(effectifs[1]), int(effectifs[2]), herbe)
+                table.append((generation, fichier.tell(), CLE if cle else DELTA, comptes))
+                fichier.write(ENREGISTREMENT.pack(CLE if cle else DELTA, generation, *comptes, len(donnees)))
+                fichier.write(donnees)
+                precedente = image
+                nbImages += 1
+            if self.__erreur is None and precedente is not None:
+                positionTable = fichier.tell()
+                fichier.write(struct.pack("<Q", len(table)))
+                fichier.write(np.array(table, dtype=TABLE).tobytes())
+                fichier.write(PIED.pack(MAGIC_INDEX, positionTable))
+        except Exception as erreur:
+            self.__erreur = erreur
+            while self.__file.get() is not None:
+                pass
+        finally:
+            fichier.close()
+
+
+class LecteurTrajectoire():
+
+    """
+    Classe LecteurTrajectoire
+
+    Lit un fichier écrit par `EnregistreurTrajectoire`, dans l'ordre ou à n'importe quelle génération.
+    Chaque lecture produit (generation, especes, environnements, comptes), où [especes] (codes de
+    `GameRules.grilleEspeces`) et [environnements] sont des tableaux (TAILLE x TAILLE) et [comptes] le tuple
+    (renards, lapins, ours, herbe).
+
+    Attributs :
+        - __chemin (str) : Fichier lu.
+        - __TAILLE (int) : Taille de la grille enregistrée.
+        - __intervalleCles (int) : Intervalle des images clés.
+        - __table (np.ndarray TABLE) : Génération, position, type et effectifs de chaque enregistrement.
+        - __cles (np.ndarray) : Indices des images clés dans la table.
+        - __derniere (tuple) : Dernière image décodée (indice, image) : une lecture dans l'ordre ne décode
+          qu'une différence par génération.
+
+    Méthodes :
+        - lire(generation) : Génération enregistrée la plus proche de [generation] (sans la dépasser).
+        - lireIndice(indice) : [indice]-ième génération enregistrée.
+        - indice(generation) -> int : Indice de la génération lue par `lire(generation)`.
+        - get_generations() -> np.ndarray : Générations enregistrées, dans l'ordre.
+        - get_comptes() -> np.ndarray : Effectifs (renards, lapins, ours, herbe) de chaque génération enregistrée.
+    """
+
+    def __init__(self, chemin):
+        self.__chemin = chemin
+        with open(chemin, "rb") as fichier:
+            entete = fichier.read(ENTETE.size)
+            if len(entete) < ENTETE.size:
+                raise ValueError(f"{chemin} n'est pas une trajectoire (fichier vide ou tronqué)")
+            magic, version, self.__TAILLE, self.__intervalleCles = ENTETE.unpack(entete)
+            if magic != MAGIC:
+                raise ValueError(f"{chemin} n'est pas une trajectoire")
+            if version != VERSION:
+                raise ValueError(f"Version de trajectoire non prise en charge : {version} (attendue : {VERSION})")
+            self.__table = self.__lireTable(fichier)
+        self.__cles = np.flatnonzero(self.__table["type"] == CLE)
+        self.__derniere = (-1, None)
+
+    # Getters
+
+    def get_TAILLE(self):
+        return self.__TAILLE
+
+    def get_intervalleCles(self):
+        return self.__intervalleCles
+
+    def get_generations(self):
+        return self.__table["generation"]
+
+    def get_comptes(self):
+        return self.__table["comptes"]
+
+    # Méthodes de classe
+
+    def __len__(self):
+        return len(self.__table)
+
+    def __iter__(self):
+        for indice in range(len(self.__table)):
+            yield self.lireIndice(indice)
+
+    def indice(self, generation):
+        return max(0, int(np.searchsorted(self.__table["generation"], generation, side="right")) - 1)
+
+    def lire(self, generation):
+        return self.lireIndice(self.indice(generation))
+
+    def lireIndice(self, indice):
+        if not 0 <= indice < len(self.__table):
+            raise IndexError(f"Indice de génération hors de la trajectoire : {indice}")
+        debut, image = self.__derniere
+        if not (self.__cles[np.searchsorted(self.__cles, indice, side="right") - 1] <= debut <= indice):
+            # Pas d'image décodée entre l'image clé précédente et la génération demandée : on repart de la clé
+            debut, image = self.__cles[np.searchsorted(self.__cles, indice, side="right") - 1] - 1, None
+        with open(self.__chemin, "rb") as fichier:
+            for i in range(debut + 1, indice + 1):
+                image = self.__lireImage(fichier, self.__table[i], image)
+        self.__derniere = (indice, image)
+        enregistrement = self.__table[indice]
+        return (int(enregistrement["generation"]), *decoderImage(image),
+                tuple(int(c) for c in enregistrement["comptes"]))
+
+    def __lireImage(self, fichier, enregistrement, precedente):
+        fichier.seek(int(enregistrement["position"]) + ENREGISTREMENT.size - 4)
+        longueur, = struct.unpack("<I", fichier.read(4))
+        image = np.frombuffer(zlib.decompress(fichier.read(longueur)), dtype=np.uint8)
+        image = image.reshape(self.__TAILLE, self.__TAILLE)
+        return image if enregistrement["type"] == CLE else image ^ precedente
+
+    def __lireTable(self, fichier):
+        """Lit la table écrite à la fermeture ou, à défaut, la reconstruit à partir des en-têtes."""
+        fin = fichier.seek(0, 2)
+        if fin >= ENTETE.size + PIED.size:
+            fichier.seek(fin - PIED.size)
+            magic, position = PIED.unpack(fichier.read(PIED.size))
+            if magic == MAGIC_INDEX and ENTETE.size <= position < fin:
+                fichier.seek(position)
+                nombre, = struct.unpack("<Q", fichier.read(8))
+                if position + 8 + nombre * TABLE.itemsize + PIED.size == fin:
+                    return np.frombuffer(fichier.read(nombre * TABLE.itemsize), dtype=TABLE)
+        # Fichier interrompu : parcours des en-têtes jusqu'au premier enregistrement incomplet
+        table = []
+        position = ENTETE.size
+        while position + ENREGISTREMENT.size <= fin:
+            fichier.seek(position)
+            type_, generation, renards, lapins, ours, herbe, longueur = ENREGISTREMENT.unpack(
+                fichier.read(ENREGISTREMENT.size))
+            suivante = position + ENREGISTREMENT.size + longueur
+            if type_ not in (CLE, DELTA) or suivante > fin or (not table and type_ != CLE) \
+                    or (table and generation < table[-1][0]):
+                break
+            table.append((generation, position, type_, (renards, lapins, ours, herbe)))
+            position = suivante
+        return np.array(table, dtype=TABLE)
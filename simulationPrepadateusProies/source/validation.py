@@ -0,0 +1,98 @@
+from enum import Enum
+import numpy as np
+from source.grille import Grille
+
+
+class NiveauValidation(Enum):
+    """
+    Classes:
+        NiveauValidation: Énumération des niveaux de vérification de la cohérence entre la grille et la population.
+
+    Attributs de classe:
+        - AUCUNE (int): Aucune vérification (valeur 0).
+        - COMPTEURS (int): Vérification des compteurs de la population, en O(1) (valeur 1).
+        - ECHANTILLON (int): Vérification d'un échantillon aléatoire de cases et d'animaux (valeur 2).
+        - COMPLETE (int): Vérification de toutes les cases et de tous les identifiants, vectorisée (valeur 3).
+
+    Chaque niveau comprend les vérifications des niveaux inférieurs.
+"""
+
+    AUCUNE = 0
+    COMPTEURS = 1
+    ECHANTILLON = 2
+    COMPLETE = 3
+
+    def __str__(self):
+        return self.name
+
+
+def verifier(condition, message):
+    """Lève une AssertionError avec [message] si [condition] est fausse (indépendamment de l'option -O)."""
+    if not condition:
+        raise AssertionError(message)
+
+
+def verifierCompteurs(grille, population):
+    """Vérifie en O(1) que les animaux et les identifiants libres couvrent exactement la capacité de la population."""
+    nbAnimaux = population.nbAnimaux()
+    capacite = grille.get_TAILLE() ** 2
+    verifier(nbAnimaux + population.nbIdsUtilisables() == capacite,
+             f"{nbAnimaux} animaux et {population.nbIdsUtilisables()} identifiants libres pour {capacite} identifiants")
+    verifier(0 <= nbAnimaux <= capacite, f"Nombre d'animaux invalide : {nbAnimaux}")
+
+
+def verifierEchantillon(grille, population, nbCases, rng):
+    """Vérifie [nbCases] cases et [nbCases] animaux tirés avec le générateur [rng] (np.random.Generator).
+
+    Une case occupée doit désigner un animal vivant situé sur cette case ; un animal vivant doit
+    être inscrit sur la case qu'il occupe.
+    """
+    TAILLE = grille.get_TAILLE()
+    idsCases = grille.get_idsCases()
+    especes = population.get_especes()
+    cases = population.get_cases()
+
+    x = rng.integers(0, TAILLE, size=nbCases)
+    y = rng.integers(0, TAILLE, size=nbCases)
+    casesTirees = (x + 1) * (TAILLE + 2) + y + 1
+    ids = idsCases[casesTirees]
+    occupees = ids >= 0
+    verifier(np.all(ids >= -1), "Identifiant de bordure à l'intérieur de la grille")
+    verifier(np.all(especes[ids[occupees]] != -1), "Case occupée par un identifiant libre")
+    verifier(np.array_equal(cases[ids[occupees]], casesTirees[occupees]),
+             "Case occupée par un animal situé ailleurs")
+
+    idsTires = rng.integers(0, len(especes), size=nbCases)
+    idsTires = idsTires[especes[idsTires] != -1]
+    verifier(np.array_equal(idsCases[cases[idsTires]], idsTires),
+             "Animal absent de la case qu'il occupe")
+
+
+def verifierComplet(grille, population):
+    """Vérifie toutes les cases et tous les identifiants, en O(TAILLE²) opérations vectorisées."""
+    TAILLE = grille.get_TAILLE()
+    especes = population.get_especes()
+    # Une grille creuse (`GrilleCreuse`) ne stocke pas de bordure : les cases hors de la grille sont calculées
+    if isinstance(grille, Grille):
+        bordee = grille.get_idsCases().reshape(TAILLE + 2, TAILLE + 2)
+        verifier(np.all(bordee[0] == Grille.BORD) and np.all(bordee[-1] == Grille.BORD)
+                 and np.all(bordee[:, 0] == Grille.BORD) and np.all(bordee[:, -1] == Grille.BORD),
+                 "Bordure de la grille modifiée")
+        verifier(np.all(grille.get_grilleIds() >= -1), "Identifiant de bordure à l'intérieur de la grille")
+
+    # Grille -> population : chaque case occupée désigne un animal vivant situé sur cette case
+    casesOccupees, ids = grille.casesOccupees()
+    verifier(np.all(especes[ids] != -1), "Case occupée par un identifiant libre")
+    verifier(np.array_equal(population.get_cases()[ids], casesOccupees),
+             "Case occupée par un animal situé ailleurs")
+
+    # Population -> grille : autant d'animaux vivants que de cases occupées (un animal par case)
+    vivants = especes != -1
+    verifier(len(ids) == np.count_nonzero(vivants) == population.nbAnimaux(),
+             f"{len(ids)} cases occupées pour {population.nbAnimaux()} animaux")
+    verifier(np.array_equal(population.masqueIdsUtilisables(), ~vivants),
+             "Identifiants libres incohérents avec les animaux vivants")
+    verifier(np.array_equal(np.bincount(especes[vivants], minlength=3), population.effectifs()),
+             "Index des espèces incohérent")
+    verifier(np.array_equal(population.comptesAllelesColonnes(), population.comptesAlleles()),
+             "Compteurs d'allèles incohérents avec les gènes des animaux")
@@ -0,0 +1,93 @@
+import sys
+import os
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.allocateurIds import *
+
+
+def test_init():
+    allocateur = AllocateurIds(5)
+    assert allocateur.nbLibres() == 5
+    assert allocateur.idsLibres() == [0, 1, 2, 3, 4]
+    assert all(allocateur.estLibre(i) for i in range(5))
+
+
+def test_allouer_et_liberer():
+    allocateur = AllocateurIds(5)
+    assert [allocateur.allouer() for _ in range(3)] == [0, 1, 2]
+    assert not allocateur.estLibre(1)
+    assert allocateur.get_prochainId() == 3
+
+    # Le dernier identifiant libéré est réutilisé en premier
+    allocateur.liberer(0)
+    allocateur.liberer(2)
+    assert allocateur.estLibre(2)
+    assert allocateur.idsLibres() == [2, 0, 3, 4]
+    assert allocateur.allouer() == 2
+    assert allocateur.allouer() == 0
+    # Les identifiants neufs ne sont distribués qu'une fois la pile vide
+    assert allocateur.allouer() == 3
+    assert allocateur.nbLibres() == 1
+
+    try:
+        allocateur.liberer(4)
+        assert False
+    except ValueError as e: pass
+
+
+def test_plus_de_place():
+    allocateur = AllocateurIds(2)
+    allocateur.allouer()
+    allocateur.allouer()
+    assert allocateur.nbLibres() == 0
+    try:
+        allocateur.allouer()
+        assert False
+    except ValueError as e: pass
+
+
+def test_masque_libres():
+    allocateur = AllocateurIds(4)
+    allocateur.allouer()
+    allocateur.allouer()
+    allocateur.liberer(0)
+    masque = allocateur.masqueLibres()
+    assert masque.tolist() == [True, False, True, True]
+    assert not masque.flags.writeable
+
+
+def test_exporter_restaurer():
+    allocateur = AllocateurIds(6)
+    for _ in range(4):
+        allocateur.allouer()
+    allocateur.liberer(1)
+    allocateur.liberer(3)
+    copie = AllocateurIds(6)
+    copie.restaurerEtat(allocateur.exporterEtat())
+    assert copie.idsLibres() == allocateur.idsLibres()
+    assert copie.masqueLibres().tolist() == allocateur.masqueLibres().tolist()
+    assert [copie.allouer() for _ in range(4)] == [allocateur.allouer() for _ in range(4)]
+    try:
+        AllocateurIds(2).restaurerEtat({"recycles": [], "prochainId": 3})
+        assert False
+    except ValueError as e: pass
+
+
+def test_masque_agrandi_a_la_demande():
+    allocateur = AllocateurIds(10, capaciteInitiale=2)
+    assert allocateur.get_capaciteAllouee() == 2 and allocateur.nbLibres() == 10
+    assert [allocateur.allouer() for _ in range(5)] == [0, 1, 2, 3, 4]
+    assert allocateur.get_capaciteAllouee() == 8
+    assert allocateur.masqueLibres().tolist() == [False] * 5 + [True] * 3
+    assert allocateur.estLibre(9)
+    for _ in range(5):
+        allocateur.allouer()
+    assert allocateur.get_capaciteAllouee() == 10 and allocateur.nbLibres() == 0
+    copie = AllocateurIds(10, capaciteInitiale=2)
+    copie.restaurerEtat(allocateur.exporterEtat())
+    assert copie.masqueLibres().tolist() == allocateur.masqueLibres().tolist()
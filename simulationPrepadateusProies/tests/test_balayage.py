@@ -0,0 +1,72 @@
+import sys
+import os
+import csv
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.balayage import *
+
+FIXES = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+
+
+def test_points_grille():
+    points = pointsGrille({"ProbaBirthR": [0.1, 0.2], "Taille": [10, 20, 30]})
+    assert len(points) == 6
+    assert points[0] == {"ProbaBirthR": 0.1, "Taille": 10}
+    assert points[-1] == {"ProbaBirthR": 0.2, "Taille": 30}
+
+
+def test_points_aleatoires():
+    points = pointsAleatoires({"foodReprodLapin": (2, 4), "ProbaBirthOurs": (0.1, 0.5)}, 50, graine=3)
+    assert len(points) == 50
+    assert all(isinstance(p["foodReprodLapin"], int) and 2 <= p["foodReprodLapin"] <= 4 for p in points)
+    assert all(0.1 <= p["ProbaBirthOurs"] <= 0.5 for p in points)
+    assert points == pointsAleatoires({"foodReprodLapin": (2, 4), "ProbaBirthOurs": (0.1, 0.5)}, 50, graine=3)
+    with pytest.raises(ValueError):
+        pointsAleatoires({"Taille": (5, 1)}, 2)
+
+
+def test_intervalle_de_flottants_ecrits_comme_entiers():
+    # "0.0:1.0" est un intervalle de probabilités, pas les deux entiers 0 et 1
+    intervalles = {cle: tuple(bornes) for cle, bornes in lireValeurs(["ProbaBirthR=0.0:1.0"], ":").items()}
+    points = pointsAleatoires(intervalles, 50, graine=1)
+    valeurs = [p["ProbaBirthR"] for p in points]
+    assert all(isinstance(v, float) and 0 <= v <= 1 for v in valeurs)
+    assert len(set(valeurs)) == 50
+    assert lireValeurs(["Taille=10:20"], ":") == {"Taille": [10, 20]}
+
+
+def test_mesures():
+    comptes = {"renards": [4, 4, 2, 0], "lapins": [10, 12, 14, 16], "ours": [0, 0, 0, 0]}
+    resultat = mesures(comptes, 10)
+    assert resultat["generations"] == 3
+    assert resultat["duree_coexistence"] == 3
+    assert resultat["moyenne_lapins"] == 13
+    assert resultat["amplitude_ours"] == 0
+    assert mesures({"renards": [1, 1], "lapins": [1, 1], "ours": [0, 0]}, 1)["duree_coexistence"] == 1
+
+
+def test_balayer(tmp_path):
+    points = pointsGrille({"ProbaBirthR": [0.05, 0.3]})
+    lignes = balayer(points, FIXES, nbGenerations=5, graine=2, nbRepliques=2, nbProcessus=1)
+    assert [(l["point"], l["replique"]) for l in lignes] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert lignes[2]["ProbaBirthR"] == 0.3
+    assert len({l["indice_graine"] for l in lignes}) == 4 and len({l["graine"] for l in lignes}) == 1
+    assert lignes == balayer(points, FIXES, nbGenerations=5, graine=2, nbRepliques=2, nbProcessus=2)
+
+    chemin = tmp_path / "balayage.csv"
+    ecrireTableau(lignes, chemin)
+    with open(chemin) as fichier:
+        lues = list(csv.DictReader(fichier))
+    assert len(lues) == 4
+    assert "duree_coexistence" in lues[0] and "amplitude_lapins" in lues[0]
+
+
+def test_balayer_cle_inconnue():
+    with pytest.raises(ValueError):
+        balayer([{"Inconnu": 1}], FIXES, nbGenerations=1, nbProcessus=1)
@@ -26,4 +26,35 @@ def test_case_voisine():
         assert voisins[i].get_coord()==v1[i].get_coord()
     voisins=c2.case_voisine(TAILLE)
     for i in range(0,len(voisins)):
-        assert voisins[i].get_coord()==v2[i].get_coord()
\ No newline at end of file
+        assert voisins[i].get_coord()==v2[i].get_coord()
+
+def test_index_case_et_decalages():
+    assert coordCase(indexCase(4, 5, TAILLE), TAILLE) == (4, 5)
+    assert indexCase(0, 0, TAILLE) == TAILLE + 3
+    # Les décalages donnent les voisins dans l'ordre de case_voisine
+    case = indexCase(4, 5, TAILLE)
+    voisins = [coordCase(case + d, TAILLE) for d in decalagesVoisins(TAILLE)]
+    assert voisins == [v.get_coord() for v in v1]
+    # Au bord, les voisins hors grille tombent sur la bordure sentinelle
+    case = indexCase(6, 6, TAILLE)
+    hors_grille = [coordCase(case + d, TAILLE) for d in decalagesVoisins(TAILLE)
+                   if not all(0 <= k < TAILLE for k in coordCase(case + d, TAILLE))]
+    assert len(hors_grille) == 5
+    assert all(-1 <= k <= TAILLE for c in hors_grille for k in c)
+
+
+def test_coordonnee_immuable_et_hachable():
+    assert Coordonnee(1, 2) == Coordonnee(1, 2)
+    assert Coordonnee(1, 2) != Coordonnee(2, 1)
+    assert len({Coordonnee(1, 2), Coordonnee(1, 2), Coordonnee(0, 0)}) == 2
+    try:
+        c1.x = 0
+        assert False
+    except AttributeError as e: pass
+
+
+def test_pool_coordonnees():
+    pool = PoolCoordonnees(TAILLE)
+    assert pool.get(4, 5) is pool.get(4, 5)
+    assert pool.get(4, 5) is pool.depuisCase(indexCase(4, 5, TAILLE))
+    assert pool.get(4, 5) == c1
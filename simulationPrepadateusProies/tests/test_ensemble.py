@@ -0,0 +1,67 @@
+import sys
+import os
+import numpy as np
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.ensemble import *
+
+PARAMETRES = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+
+
+def test_graines_repliques():
+    etats = [graine.generate_state(4).tolist() for graine in grainesRepliques(3, 5)]
+    assert len(set(map(tuple, etats))) == 5
+    assert etats == [graine.generate_state(4).tolist() for graine in grainesRepliques(3, 5)]
+    # Les premières répliques ne dépendent pas du nombre total de répliques
+    assert [graine.generate_state(4).tolist() for graine in grainesRepliques(3, 8)[:5]] == etats
+    assert grainesRepliques(3, 5)[2].spawn_key == (2,)
+
+
+def test_repliques_independantes_du_nombre_de_processus():
+    sequentiel = dict(repliques(PARAMETRES, nbRepliques=3, graine=7, nbGenerations=8,
+                                arretSiFini=False, nbProcessus=1))
+    parallele = dict(repliques(PARAMETRES, nbRepliques=3, graine=7, nbGenerations=8,
+                               arretSiFini=False, nbProcessus=2))
+    assert sorted(parallele) == [0, 1, 2]
+    for indice in range(3):
+        assert list(sequentiel[indice]) == list(COLONNES_COMPTES)
+        for colonne in COLONNES_COMPTES:
+            assert np.array_equal(sequentiel[indice][colonne], parallele[indice][colonne])
+    assert not np.array_equal(sequentiel[0]["lapins"], sequentiel[1]["lapins"])
+
+
+def test_agreger():
+    comptes = [
+        {"renards": [4, 2, 0], "lapins": [10, 12, 14], "ours": [0, 0, 0]},
+        {"renards": [4, 6, 8, 6], "lapins": [10, 8, 6, 4], "ours": [1, 1, 1, 1]},
+    ]
+    statistiques = agreger(comptes, 4)
+    assert statistiques["generation"].tolist() == [0, 1, 2, 3, 4]
+    assert statistiques["enCours"].tolist() == [2, 2, 2, 1, 0]
+    moyenne = statistiques["renards"]["moyenne"]
+    assert moyenne[:3].tolist() == [4, 4, 4]
+    # Plus de statistiques dès qu'une réplique s'est arrêtée (pas de biais des survivants)
+    assert np.isnan(moyenne[3:]).all() and np.isnan(statistiques["lapins"]["quantiles"][0.5][3])
+    assert statistiques["lapins"]["quantiles"][0.5][1] == 10
+    extinction = statistiques["renards"]["extinction"]
+    assert extinction[0] == 2 and np.isnan(extinction[1])
+    assert statistiques["ours"]["extinction"][0] == 0
+
+
+def test_ensemble_et_aplatir():
+    recus = []
+    statistiques = ensemble(PARAMETRES, nbRepliques=2, graine=1, nbGenerations=5, nbProcessus=1,
+                            rappel=lambda indice, comptes: recus.append(indice))
+    assert sorted(recus) == [0, 1]
+    assert statistiques["renards"]["moyenne"][0] == 20
+    # Par défaut, les répliques vont jusqu'au bout : statistiques définies à chaque génération
+    assert statistiques["enCours"].tolist() == [2] * 6
+    assert not np.isnan(statistiques["lapins"]["moyenne"]).any()
+    tableaux = aplatir(statistiques)
+    assert "lapins_q05" in tableaux and "ours_extinction" in tableaux
+    assert len(tableaux["lapins_moyenne"]) == 6
@@ -37,4 +37,39 @@ def tests_init():
 
     assert gameRules.get_population().renard_ids() == [i for i in range(gameRules.PARAMETERS["Renards"])]
     assert gameRules.get_population().lapin_ids() == [i for i in range(gameRules.PARAMETERS["Renards"],gameRules.PARAMETERS["Lapins"]+gameRules.PARAMETERS["Renards"])]
-    assert gameRules.get_population().getIdsUtilisables() == [i for i in range(gameRules.PARAMETERS["Lapins"]+gameRules.PARAMETERS["Renards"],TAILLE**2)]
\ No newline at end of file
+    assert gameRules.get_population().getIdsUtilisables() == [i for i in range(gameRules.PARAMETERS["Lapins"]+gameRules.PARAMETERS["Renards"],TAILLE**2)]
+
+def etatApres(graine, nbGenerations=5):
+    GameRules.PARAMETERS = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+    gameRules = GameRules(graine)
+    gameRules.addOursAleatoire()
+    for _ in range(nbGenerations):
+        gameRules.generation()
+    population = gameRules.get_population()
+    return (gameRules.get_grille().get_idsCases().copy(), gameRules.get_grille().get_envCases().copy(),
+            population.get_ages().copy(), population.get_foods().copy(), population.get_genes().copy())
+
+
+def tests_graine_reproductible():
+    premier = etatApres(11)
+    # Les générateurs globaux n'interviennent pas
+    import random
+    random.seed(0)
+    np.random.seed(0)
+    np.random.random(3)
+    second = etatApres(11)
+    assert all(np.array_equal(a, b) for a, b in zip(premier, second))
+    assert not np.array_equal(premier[0], etatApres(12)[0])
+    sequence = np.random.SeedSequence(11)
+    assert all(np.array_equal(a, b) for a, b in zip(premier, etatApres(sequence)))
+
+
+def test_pool_propre_a_chaque_grille():
+    premier = GameRules(1)
+    second = GameRules(1)
+    # La population prête les Coordonnee de sa grille ; deux grilles de même taille ne partagent rien
+    assert premier.get_population().get_pool() is premier.get_grille().get_pool()
+    assert premier.get_grille().get_pool() is not second.get_grille().get_pool()
+    id_ = premier.get_population().animaux_ids()[0]
+    coord = premier.get_population().getAnimal(id_).get_coord()
+    assert coord is premier.get_grille().get_pool().get(*coord.get_coord())
@@ -0,0 +1,85 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.generationParallele import *
+from source.gameRules import GameRules
+from source.instrumentation import Instrumentation
+from source.validation import NiveauValidation
+
+PARAMETRES = {"Renards": 150, "Lapins": 500, "Ours": 4, "Taille": 40, "Apparition herbe (%)": 10}
+
+
+def simuler(nbProcessus, nbBandes=6, nbGenerations=8):
+    gameRules = GameRules(3)
+    gameRules.addOursAleatoire()
+    gameRules.set_validation(NiveauValidation.COMPLETE)
+    with GenerationParallele(gameRules, nbBandes=nbBandes, nbProcessus=nbProcessus) as parallele:
+        for _ in range(nbGenerations):
+            parallele.generation()
+            gameRules.valider()
+    return gameRules
+
+
+def test_etat_coherent_et_animaux_actifs(monkeypatch):
+    monkeypatch.setattr(GameRules, "PARAMETERS", PARAMETRES)
+    gameRules = GameRules(3)
+    population = gameRules.get_population()
+    assert np.all(population.get_ages()[population.animaux_ids()] == 0)
+    gameRules.set_instrumentation(Instrumentation())
+    with GenerationParallele(gameRules, nbBandes=5, nbProcessus=1) as parallele:
+        parallele.generation()
+    gameRules.checkInvariant()
+    assert gameRules.get_generation() == 1
+    assert "bouge lapins" in gameRules.get_instrumentation().get_durees()
+    # Chaque animal a joué une fois (âge 1), même s'il a changé de bande, ou vient de naître (âge 0)
+    ids = population.animaux_ids()
+    ages = population.get_ages()[ids]
+    unTour = 1 + population.get_genes()[ids, Genes.MANGE.value - 1] * Animal.PARAMETERS['CoeffGeneM'] / 10
+    nes = ages == 0
+    assert nes.any() and not nes.all() and np.allclose(ages[~nes], unTour[~nes])
+
+def test_independant_du_nombre_de_processus(monkeypatch):
+    monkeypatch.setattr(GameRules, "PARAMETERS", PARAMETRES)
+    seul = simuler(1).exporterEtat()
+    plusieurs = simuler(3).exporterEtat()
+    assert np.array_equal(seul["grille"]["ids"], plusieurs["grille"]["ids"])
+    assert np.array_equal(seul["grille"]["environnements"], plusieurs["grille"]["environnements"])
+    for colonne in ("especes", "sexes", "ages", "foods", "cases", "genes"):
+        assert np.array_equal(seul["population"][colonne], plusieurs["population"][colonne])
+
+
+def test_populations_de_bande_reutilisees(monkeypatch):
+    monkeypatch.setattr(GameRules, "PARAMETERS", PARAMETRES)
+    reference = simuler(1).exporterEtat()
+    # Populations de bande laissées par une autre simulation (autre graine) : réécrites, sans effet sur les résultats
+    autre = GameRules(5)
+    parallele = GenerationParallele(autre, nbBandes=6, nbProcessus=1)
+    parallele.generation()
+    assert len(BANDES) == 6
+    reprise = simuler(1).exporterEtat()
+    assert not BANDES
+    for colonne in ("especes", "sexes", "ages", "foods", "cases", "genes"):
+        assert np.array_equal(reference["population"][colonne], reprise["population"][colonne])
+    assert np.array_equal(reference["grille"]["ids"], reprise["grille"]["ids"])
+
+
+def test_bandes(monkeypatch):
+    monkeypatch.setattr(GameRules, "PARAMETERS", PARAMETRES)
+    gameRules = GameRules(3)
+    assert GenerationParallele(gameRules, nbBandes=4, nbProcessus=1).get_bornes().tolist() == [0, 10, 20, 30, 40]
+    # Par défaut, le découpage ne dépend que de la taille de la grille
+    assert len(GenerationParallele(gameRules, nbProcessus=1).get_bornes()) == len(
+        GenerationParallele(gameRules, nbProcessus=8).get_bornes()) == 40 // HAUTEUR_BANDE + 1
+    # Des bandes d'une ligne partageraient leurs halos
+    with pytest.raises(ValueError):
+        GenerationParallele(gameRules, nbBandes=21, nbProcessus=1)
+    with pytest.raises(ValueError):
+        GenerationParallele(GameRules(3, creuse=True), nbProcessus=1)
@@ -38,4 +38,10 @@ def test_genes_parent():
 def test_str_representation():
     # Teste la représentation en chaîne de caractères de l'énumération
     assert str(Genes.MANGE) == "MANGE"
-    assert str(Genes.ESQUIVE) == "ESQUIVE"
\ No newline at end of file
+    assert str(Genes.ESQUIVE) == "ESQUIVE"
+
+def test_generateur():
+    assert create_random(np.random.default_rng(4)) == create_random(np.random.default_rng(4))
+    assert generateur(None) is GENERATEUR_DEFAUT
+    rng = np.random.default_rng(1)
+    assert generateur(rng) is rng
@@ -0,0 +1,78 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+pygame = pytest.importorskip("pygame")
+
+from source.graphiquePopulation import *
+
+LAPINS, RENARDS = (139, 69, 19), (255, 165, 0)
+
+
+def graphique():
+    pygame.font.init()
+    # Zone de tracé de 10 pixels de large : 10 colonnes
+    return GraphiquePopulation(10 + GraphiquePopulation.MARGE_GAUCHE + GraphiquePopulation.MARGE_DROITE, 200,
+                               (("Lapins", LAPINS), ("Renards", RENARDS)))
+
+
+def test_decimation_min_max():
+    courbes = graphique()
+    lapins = np.random.default_rng(0).integers(0, 1000, 95)
+    renards = np.arange(95)
+    for l, r in zip(lapins, renards):
+        courbes.ajouter((l, r))
+    assert courbes.get_nbPoints() == 95
+    pas = courbes.get_pas()
+    mins, maxs = courbes.colonnes()
+    # Au plus 10 colonnes, chacune résume [pas] points consécutifs
+    assert pas == 16 and mins.shape == (2, 6)
+    for c in range(mins.shape[1]):
+        assert mins[0, c] == lapins[c * pas:(c + 1) * pas].min()
+        assert maxs[0, c] == lapins[c * pas:(c + 1) * pas].max()
+        assert (mins[1, c], maxs[1, c]) == (c * pas, min((c + 1) * pas, 95) - 1)
+
+
+def test_cout_constant():
+    courbes = graphique()
+    for t in range(100000):
+        courbes.ajouter((t % 7, t % 3))
+    assert courbes.colonnes()[0].shape[1] <= 10
+    assert courbes.colonnes()[0].min() == 0 and courbes.colonnes()[1].max() == 6
+
+
+def test_dessiner_et_reinitialiser():
+    courbes = graphique()
+    surface = courbes.dessiner()
+    assert surface.get_size() == (130, 200)
+    courbes.ajouter((5, 0))
+    courbes.dessiner()
+    for t in range(30):
+        courbes.ajouter((t, 30 - t))
+    surface = courbes.dessiner()
+    couleurs = {tuple(surface.get_at((x, y)))[:3] for x in range(60, 70) for y in range(40, 160)}
+    assert LAPINS in couleurs and RENARDS in couleurs
+    courbes.reinitialiser()
+    assert courbes.get_nbPoints() == 0 and courbes.colonnes()[0].shape == (2, 0)
+
+
+def test_troisieme_serie_et_fenetre():
+    pygame.font.init()
+    OURS = (30, 144, 255)
+    courbes = GraphiquePopulation(100 + GraphiquePopulation.MARGE_GAUCHE + GraphiquePopulation.MARGE_DROITE, 200,
+                                  (("Lapins", LAPINS), ("Renards", RENARDS), ("Ours", OURS)))
+    for t in range(5000):
+        courbes.ajouter((t % 50, 10, 1 if t >= 4990 else 0))
+    debuts, mins, maxs, _ = courbes.get_historique().fenetre(20)
+    # Les 20 derniers points sont conservés tels quels
+    assert debuts.tolist() == list(range(4980, 5000)) and maxs[:, 2].tolist() == [0] * 10 + [1] * 10
+    surface = courbes.dessiner(20)
+    couleurs = {tuple(surface.get_at((x, y)))[:3] for x in range(60, 160) for y in range(40, 160)}
+    assert OURS in couleurs
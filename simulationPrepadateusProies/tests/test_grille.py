@@ -101,4 +101,68 @@ def tests_set_environnement():
     try : 
         grille.set_environnement(Coordonnee(TAILLE,0),Environnement.HERBE)
         assert False
-    except ValueError as e : pass  
\ No newline at end of file
+    except ValueError as e : pass  
+
+def tests_tableaux_et_masques():
+    grille = Grille(5)
+    grille.set_animalId(Coordonnee(1, 2), 3)
+    grille.set_environnement(Coordonnee(1, 2), Environnement.HERBE)
+    grille.set_environnement(Coordonnee(4, 0), Environnement.HERBE)
+
+    grilleIds = grille.get_grilleIds()
+    grilleEnvironnements = grille.get_grilleEnvironnements()
+    assert grilleIds.shape == (5, 5)
+    assert grilleIds[1, 2] == 3
+    assert grilleEnvironnements[4, 0] == Environnement.HERBE.value
+    assert grille.get_environnement(Coordonnee(4, 0)) == Environnement.HERBE
+
+    assert grille.masque_vide().sum() == 24
+    assert not grille.masque_vide()[1, 2]
+    # (1,2) contient de l'herbe mais est occupée
+    assert grille.masque_vide_herbe().sum() == 1
+    assert grille.masque_vide_herbe()[4, 0]
+
+    # Les tableaux sont des vues : une écriture groupée est visible case par case
+    grilleIds[0, 0] = 7
+    assert grille.get_id(Coordonnee(0, 0)) == 7
+
+
+def tests_repousserHerbe():
+    grille = Grille(200)
+    grille.set_animalId(Coordonnee(0, 0), 1)
+    grille.set_environnement(Coordonnee(1, 1), Environnement.MONTAGNE)
+
+    grille.repousserHerbe(0)
+    assert not (grille.get_grilleEnvironnements() == Environnement.HERBE.value).any()
+
+    grille.repousserHerbe(50)
+    # Les cases occupées ou non VIDE ne changent pas
+    assert grille.get_environnement(Coordonnee(0, 0)) == Environnement.VIDE
+    assert grille.get_environnement(Coordonnee(1, 1)) == Environnement.MONTAGNE
+    # Même probabilité qu'avec randint(0, 100) < 50 : 50/101
+    proportion = (grille.get_grilleEnvironnements() == Environnement.HERBE.value).mean()
+    assert abs(proportion - 50/101) < 0.02
+    assert not grille.masque_vide_sol_nu()[grille.masque_vide_herbe()].any()
+
+
+def tests_cases_bordees():
+    grille = Grille(4)
+    ids = grille.get_idsCases()
+    assert len(ids) == 6 * 6
+    # La bordure n'est ni libre ni occupée
+    assert (ids == Grille.BORD).sum() == 6 * 6 - 4 * 4
+    case = grille.indexCase(2, 3)
+    assert grille.coordCase(case) == (2, 3)
+    ids[case] = 5
+    grille.get_envCases()[case] = Environnement.HERBE.value
+    assert grille.get_id(Coordonnee(2, 3)) == 5
+    assert grille.get_environnement(Coordonnee(2, 3)) == Environnement.HERBE
+
+
+def tests_cases_occupees():
+    grille = Grille(4)
+    grille.set_animalId(Coordonnee(3, 0), 7)
+    grille.set_animalId(Coordonnee(1, 2), 2)
+    cases, ids = grille.casesOccupees()
+    assert cases.tolist() == [grille.indexCase(1, 2), grille.indexCase(3, 0)]
+    assert ids.tolist() == [2, 7]
@@ -0,0 +1,105 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.grilleCreuse import *
+from source.gameRules import GameRules
+from source.validation import NiveauValidation
+from source.sauvegarde import sauvegarder
+
+
+def test_tuiles_allouees_a_la_demande():
+    grille = GrilleCreuse(20000)
+    assert grille.get_nbTuiles() == 0
+    assert grille.get_id(Coordonnee(12345, 678)) == -1
+    grille.set_animalId(Coordonnee(12345, 678), 7)
+    assert grille.get_nbTuiles() == 1 and grille.get_id(Coordonnee(12345, 678)) == 7
+    grille.removeId(Coordonnee(12345, 678))
+    assert grille.get_id(Coordonnee(12345, 678)) == -1
+    # Effacer une case d'une tuile non allouée n'alloue rien
+    grille.removeId(Coordonnee(0, 0))
+    assert grille.get_nbTuiles() == 1
+
+
+def test_memes_cases_que_la_grille_dense():
+    TAILLE = 37
+    dense = Grille(TAILLE)
+    creuse = GrilleCreuse(TAILLE, tailleTuile=8)
+    rng = np.random.default_rng(0)
+    for id_, (x, y) in enumerate(rng.integers(0, TAILLE, (200, 2)).tolist()):
+        dense.set_animalId(Coordonnee(x, y), id_)
+        creuse.set_animalId(Coordonnee(x, y), id_)
+        dense.set_environnement(Coordonnee(y, x), Environnement.HERBE)
+        creuse.set_environnement(Coordonnee(y, x), Environnement.HERBE)
+    toutes = np.arange((TAILLE + 2) ** 2)
+    # Bordure comprise : les voisins d'une case tombent au même index, quelle que soit la tuile
+    assert np.array_equal(creuse.get_idsCases()[toutes], dense.get_idsCases())
+    assert all(creuse.get_idsCases()[int(case)] == dense.get_idsCases()[case] for case in toutes)
+    assert np.array_equal(creuse.get_grilleIds(), dense.get_grilleIds())
+    cases, ids = creuse.casesOccupees()
+    casesDenses, idsDenses = dense.casesOccupees()
+    assert np.array_equal(cases, casesDenses) and np.array_equal(ids, idsDenses)
+    case = creuse.indexCase(7, 7)
+    for decalage in decalagesVoisins(TAILLE):
+        assert creuse.get_envCases()[case + decalage] == dense.get_envCases()[case + decalage]
+
+
+def test_herbe_des_tuiles_non_allouees():
+    # Densité initiale 0.2, puis 5 repousses de probabilité 10 / 101 : P(herbe) = 1 - 0.8 * (1 - 10/101)^5
+    grille = GrilleCreuse(512, rng=np.random.default_rng(1), densiteHerbe=0.2)
+    for _ in range(5):
+        grille.repousserHerbe(10)
+    attendue = 1 - 0.8 * (1 - 10 / 101) ** 5
+    assert grille.nbHerbe() == round(attendue * 512 ** 2)
+    envs = grille.get_envCases()[np.array([grille.indexCase(x, y) for x in range(0, 512, 2) for y in range(0, 512, 2)])]
+    assert abs(np.mean(envs == Environnement.HERBE.value) - attendue) < 0.01
+
+
+def test_tuiles_uniformes_liberees():
+    grille = GrilleCreuse(40, rng=np.random.default_rng(2), tailleTuile=16)
+    grille.set_animalId(Coordonnee(3, 3), 0)
+    grille.set_environnement(Coordonnee(30, 30), Environnement.VIDE)
+    assert grille.get_nbTuiles() == 2
+    # Repousse certaine : la tuile sans animal devient toute en herbe et est libérée, pas celle de l'animal
+    grille.repousserHerbe(101)
+    assert grille.get_nbTuiles() == 1
+    assert grille.get_environnement(Coordonnee(30, 30)) == Environnement.HERBE
+    with pytest.raises(ValueError):
+        GrilleCreuse(40, tailleTuile=12)
+
+
+def test_simulation_creuse(monkeypatch):
+    monkeypatch.setattr(GameRules, "PARAMETERS",
+                        {"Renards": 40, "Lapins": 120, "Ours": 2, "Taille": 60, "Apparition herbe (%)": 10})
+    gameRules = GameRules(4, creuse=True)
+    gameRules.set_validation(NiveauValidation.COMPLETE)
+    gameRules.addOursAleatoire()
+    for _ in range(10):
+        gameRules.generation()
+        gameRules.valider()
+    assert gameRules.get_population().nbAnimaux() > 0
+    assert isinstance(gameRules.get_grille(), GrilleCreuse)
+
+
+def test_grand_monde_peu_peuple(monkeypatch):
+    monkeypatch.setattr(GameRules, "PARAMETERS",
+                        {"Renards": 200, "Lapins": 800, "Ours": 1, "Taille": 20000, "Apparition herbe (%)": 10})
+    gameRules = GameRules(5, creuse=True)
+    population = gameRules.get_population()
+    # Mémoire proportionnelle aux animaux : colonnes et tuiles, pas 20000²
+    assert len(population.get_especes()) <= 2048 and gameRules.get_grille().get_nbTuiles() <= 1000
+    gameRules.generation()
+    gameRules.valider()
+    assert population.nbAnimaux() > 0
+    assert gameRules.estCreuse()
+    with pytest.raises(ValueError):
+        gameRules.exporterEtat()
+    with pytest.raises(ValueError):
+        sauvegarder(gameRules, "jamais_ecrite.npz")
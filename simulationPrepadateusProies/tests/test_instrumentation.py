@@ -0,0 +1,78 @@
+import sys
+import os
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.instrumentation import *
+from source.gameRules import GameRules
+
+
+def test_ajouter_mesurer():
+    instrumentation = Instrumentation()
+    instrumentation.ajouter("a", 0.5, 10)
+    instrumentation.ajouter("a", 0.25, 5)
+    with instrumentation.mesurer("b"):
+        pass
+    assert instrumentation.get_durees()["a"] == 0.75
+    assert instrumentation.get_appels() == {"a": 2, "b": 1}
+    assert instrumentation.get_elements() == {"a": 15, "b": 1}
+    assert instrumentation.get_durees()["b"] >= 0
+    assert "a" in str(instrumentation)
+    instrumentation.reinitialiser()
+    assert instrumentation.resultats() == {}
+
+
+def test_mesures_de_plusieurs_fils():
+    import threading
+    instrumentation = Instrumentation()
+
+    def mesurerBeaucoup(phase):
+        for _ in range(20000):
+            instrumentation.ajouter(phase, 1.0)
+            instrumentation.ajouter("commune", 1.0)
+
+    fils = [threading.Thread(target=mesurerBeaucoup, args=(f"fil {i}",)) for i in range(4)]
+    for fil in fils:
+        fil.start()
+    for fil in fils:
+        fil.join()
+    # Aucune mesure perdue, y compris sur la phase partagée
+    assert instrumentation.get_appels()["commune"] == 80000
+    assert instrumentation.get_durees()["commune"] == 80000.0
+
+
+def test_rappel():
+    appels = []
+    instrumentation = Instrumentation(rappel=lambda phase, duree, nombre: appels.append((phase, nombre)))
+    instrumentation.ajouter("a", 0.1, 3)
+    assert appels == [("a", 3)]
+
+
+def test_mesurer_sans_instrumentation():
+    assert mesurer(None, "a") is SANS_MESURE
+    with mesurer(None, "a"):
+        pass
+
+
+def test_generation_instrumentee():
+    GameRules.PARAMETERS = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+    jeu = GameRules(1)
+    jeu.addOursAleatoire()
+    instrumentation = Instrumentation()
+    jeu.set_instrumentation(instrumentation)
+    renards = len(jeu.get_population().renard_ids())
+    jeu.generation()
+    jeu.generation()
+    appels = instrumentation.get_appels()
+    for phase in ("bouge ours", "bouge renards", "bouge lapins", "vieillissement ours",
+                  "vieillissement renards", "vieillissement lapins", "herbe"):
+        assert appels[phase] == 2
+    assert instrumentation.get_elements()["bouge ours"] == 4
+    assert instrumentation.get_elements()["bouge renards"] >= renards
+    jeu.set_instrumentation(None)
+    jeu.generation()
+    assert instrumentation.get_appels()["herbe"] == 2
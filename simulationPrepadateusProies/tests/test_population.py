@@ -1,5 +1,7 @@
 import sys
 import os
+import pytest
+import numpy as np
 
 # Gérer les caractères spéciaux
 parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
@@ -162,3 +164,144 @@ def test_allele_frequencies():
     assert isinstance(allele_frequencies["Renard"], dict)
     assert isinstance(allele_frequencies["Lapin"], dict)
 
+
+
+def test_stockage_en_colonnes():
+    population = Population(10)
+    genes_lapin = {Genes.MANGE: 2, Genes.ESQUIVE: 3}
+    id_lapin = population.addAnimal(1, Coordonnee(2, 7), genes_lapin)
+    id_ours = population.addAnimal(2, Coordonnee(4, 4))
+
+    # La vue se comporte comme un Lapin et écrit dans les colonnes
+    lapin = population.getAnimal(id_lapin)
+    assert isinstance(lapin, Lapin)
+    assert lapin.get_coord().get_coord() == (2, 7)
+    assert lapin.get_genes() == genes_lapin
+    assert lapin.get_food() == Animal.PARAMETERS["foodInitLapin"]
+    lapin.set_coord(Coordonnee(3, 7))
+    lapin.set_food(4)
+    assert population.coordonnees([id_lapin])[0][0] == 3
+    assert population.get_foods()[id_lapin] == 4
+    assert isinstance(population.getAnimal(id_ours), Ours)
+
+    assert population.effectifs().tolist() == [0, 1, 1]
+
+    # Vieillissement et réduction de vie sur les tableaux, identiques aux méthodes de Animal
+    attendu = Lapin((0, 0), 99, dict(genes_lapin))
+    attendu.set_food(4)
+    attendu.vieillit()
+    attendu.reduireVie()
+    foodOurs = population.get_foods()[id_ours]
+    population.vieillit([id_lapin, id_ours])
+    population.reduireVie([id_lapin, id_ours])
+    assert population.getAnimal(id_lapin).get_age() == attendu.get_age()
+    assert population.getAnimal(id_lapin).get_food() == attendu.get_food()
+    assert population.get_foods()[id_ours] == foodOurs - 1
+
+    population.deleteAnimal(population.getAnimal(id_lapin))
+    assert population.effectifs().tolist() == [0, 0, 1]
+
+
+def test_getAnimal_hors_population():
+    population = Population(4, capaciteInitiale=3)
+    id_ = population.addAnimal(1, Coordonnee(1, 1))
+    assert population.getAnimal(id_).get_id() == id_
+    assert population.getAnimal(2) == -1
+    # Ni modulo ni indexation négative : un identifiant hors de [0, capacité[ est une erreur
+    for id_ in (-1, 3, len(population.get_especes())):
+        with pytest.raises(IndexError):
+            population.getAnimal(id_)
+
+
+def test_index_par_espece():
+    population = Population(10)
+    for i in range(6):
+        population.addAnimal(i % 3, Coordonnee(i, 0))
+    assert population.nbAnimaux() == 6
+    assert population.nbAnimaux(Population.LAPIN) == 2
+
+    # Suppressions dans le désordre : les index restent cohérents et triés
+    population.deleteAnimal(population.getAnimal(0))
+    population.deleteAnimal(population.getAnimal(4))
+    assert population.renard_ids() == [3]
+    assert population.lapin_ids() == [1]
+    assert population.ours_ids() == [2, 5]
+    assert population.animaux_ids() == [1, 2, 3, 5]
+    assert [c.get_coord() for c in population.ours_coord()] == [(2, 0), (5, 0)]
+    assert population.effectifs().tolist() == [1, 1, 2]
+
+    # Un identifiant libéré puis réutilisé rejoint l'index de sa nouvelle espèce
+    id_ = population.addAnimal(2, Coordonnee(9, 9))
+    assert id_ in population.ours_ids()
+    assert population.nbAnimaux(Population.OURS) == 3
+
+
+def test_ids_utilisables():
+    population = Population(3)
+    ids = [population.addAnimal(1, Coordonnee(0, i)) for i in range(3)]
+    assert population.nbIdsUtilisables() == 6
+    population.deleteAnimal(population.getAnimal(ids[1]))
+    assert population.estIdUtilisable(ids[1])
+    assert not population.estIdUtilisable(ids[0])
+    # L'identifiant libéré est réattribué avant les identifiants neufs
+    assert population.addAnimal(0, Coordonnee(1, 1)) == ids[1]
+
+
+def test_compteurs_alleles():
+    population = Population(10)
+    id1 = population.addAnimal(0, Coordonnee(0, 0), {Genes.MANGE: 1, Genes.ESQUIVE: 3})
+    population.addAnimal(0, Coordonnee(1, 0), {Genes.MANGE: 1, Genes.ESQUIVE: 0})
+    id3 = population.addAnimal(1, Coordonnee(2, 0), {Genes.MANGE: 6, Genes.ESQUIVE: 2})
+    comptes = population.comptesAlleles()
+    # Une colonne par valeur d'allèle rencontrée, en plus des NB_ALLELES tirées par create_random
+    assert population.valeursAlleles().tolist() == [0, 1, 2, 3, 6]
+    assert comptes.shape == (3, 2, 5)
+    assert comptes[0, 0].tolist() == [0, 2, 0, 0, 0]
+    assert comptes[0, 1].tolist() == [1, 0, 0, 1, 0]
+    assert comptes[1, 0, 4] == 1 and comptes[1, 1, 2] == 1
+    with pytest.raises(ValueError):
+        comptes[0, 0, 0] = 1
+
+    population.deleteAnimal(population.getAnimal(id1))
+    population.deleteAnimal(population.getAnimal(id3))
+    comptes = population.comptesAlleles()
+    assert comptes[0, 1].tolist() == [1, 0, 0, 0, 0]
+    assert comptes[1].sum() == 0
+    assert np.array_equal(population.comptesAllelesColonnes(), comptes)
+    assert population.alleleFrequenciesByGeneByAnimal() == {
+        "Renard": {Genes.MANGE: {1: 1}, Genes.ESQUIVE: {0: 1}}, "Lapin": {}}
+
+    copie = Population(10)
+    copie.restaurerEtat(population.exporterEtat())
+    assert np.array_equal(copie.comptesAlleles()[:, :, :4], comptes[:, :, :4])
+
+    # Les allèles non entiers sont comptés comme les autres
+    id4 = population.addAnimal(1, Coordonnee(3, 0), {Genes.MANGE: 1.5, Genes.ESQUIVE: 0})
+    assert population.alleleFrequenciesByGeneByAnimal()["Lapin"][Genes.MANGE] == {1.5: 1}
+    assert np.array_equal(population.comptesAllelesColonnes(), population.comptesAlleles())
+    population.deleteAnimal(population.getAnimal(id4))
+
+    # Un allèle refusé ne laisse ni animal, ni identifiant réservé
+    libres = population.nbIdsUtilisables()
+    with pytest.raises(ValueError):
+        population.addAnimal(1, Coordonnee(3, 0), {Genes.MANGE: float("nan"), Genes.ESQUIVE: 0})
+    assert population.lapin_ids() == [] and population.nbIdsUtilisables() == libres
+
+
+def test_capacite_initiale():
+    population = Population(10, capaciteInitiale=2)
+    assert len(population.get_especes()) == 2 and population.nbIdsUtilisables() == 100
+    ids = [population.addAnimal(i % 2, Coordonnee(i, i)) for i in range(5)]
+    # Colonnes doublées à la demande, identifiants inchangés
+    assert ids == [0, 1, 2, 3, 4] and len(population.get_especes()) == 8
+    assert len(population.masqueIdsUtilisables()) == 8
+    assert population.getAnimal(4).get_coord() == Coordonnee(4, 4)
+    assert population.effectifs().tolist() == [3, 2, 0]
+
+    # Reprise dans une population dense (TAILLE² lignes) et inversement
+    dense = Population(10)
+    dense.restaurerEtat(population.exporterEtat())
+    assert len(dense.get_especes()) == 100 and dense.animaux_ids() == ids
+    copie = Population(10, capaciteInitiale=2)
+    copie.restaurerEtat(dense.exporterEtat())
+    assert copie.animaux_ids() == ids and copie.nbIdsUtilisables() == 95
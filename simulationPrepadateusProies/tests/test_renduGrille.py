@@ -0,0 +1,66 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+pygame = pytest.importorskip("pygame")
+
+from source.renduGrille import *
+
+RENARD, LAPIN, OURS = (255, 165, 0), (139, 69, 19), (255, 255, 255)
+HERBE, FOND = (34, 139, 34), (0, 0, 0)
+
+
+def rendu(largeur=40, hauteur=40):
+    return RenduGrille(largeur, hauteur, (RENARD, LAPIN, OURS), HERBE, FOND)
+
+
+def couleur(surface, x, y):
+    return tuple(surface.get_at((x, y)))[:3]
+
+
+def test_palette():
+    palette = RenduGrille.palette((RENARD, LAPIN, OURS), HERBE, FOND)
+    assert len(palette) == 16
+    assert palette[0 + 4 * 1] == FOND and palette[0 + 4 * 2] == HERBE and palette[0 + 4 * 3] == FOND
+    # Un animal est dessiné par-dessus l'herbe
+    assert palette[1 + 4 * 2] == RENARD and palette[2 + 4 * 1] == LAPIN and palette[3 + 4 * 2] == OURS
+
+
+def test_dessiner_et_cases_modifiees():
+    especes = np.zeros((4, 4), dtype=np.uint8)
+    environnements = np.ones((4, 4), dtype=np.uint8)
+    especes[1, 2] = 2
+    environnements[3, 0] = 2
+    dessin = rendu()
+    surface = dessin.dessiner(especes, environnements)
+    assert surface.get_size() == (40, 40)
+    assert dessin.get_nbModifiees() == 16
+    # Case [x, y] agrandie en un carré de 10 pixels, indexé (x, y) comme la grille
+    assert couleur(surface, 15, 25) == LAPIN
+    assert couleur(surface, 35, 5) == HERBE
+    assert couleur(surface, 0, 0) == FOND
+
+    especes[1, 2] = 0
+    especes[0, 0] = 3
+    surface = dessin.dessiner(especes, environnements)
+    assert dessin.get_nbModifiees() == 2
+    assert couleur(surface, 15, 25) == FOND and couleur(surface, 5, 5) == OURS and couleur(surface, 35, 5) == HERBE
+
+    dessin.dessiner(especes, environnements)
+    assert dessin.get_nbModifiees() == 0
+
+
+def test_changement_de_taille():
+    dessin = rendu(30, 20)
+    dessin.dessiner(np.zeros((3, 3), dtype=np.uint8), np.ones((3, 3), dtype=np.uint8))
+    especes = np.full((6, 6), 1, dtype=np.uint8)
+    surface = dessin.dessiner(especes, np.ones((6, 6), dtype=np.uint8))
+    assert dessin.get_nbModifiees() == 36
+    assert surface.get_size() == (30, 20) and couleur(surface, 29, 19) == RENARD
@@ -0,0 +1,68 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.reserveAleatoire import *
+
+
+def test_reproductible_et_remplissage():
+    # Une petite réserve est remplie plusieurs fois : la suite reste celle du générateur
+    reserve = ReserveAleatoire(np.random.default_rng(3), taille=7)
+    valeurs = [reserve.random() for _ in range(30)]
+    generateur = np.random.default_rng(3)
+    attendues = np.concatenate([generateur.random(7) for _ in range(5)])[:30]
+    assert valeurs == attendues.tolist()
+    with pytest.raises(ValueError):
+        ReserveAleatoire(np.random.default_rng(), taille=0)
+
+
+def test_integers():
+    reserve = ReserveAleatoire(np.random.default_rng(1))
+    tirages = [reserve.integers(5) for _ in range(20000)]
+    assert set(tirages) == {0, 1, 2, 3, 4}
+    assert abs(tirages.count(0) / len(tirages) - 0.2) < 0.02
+    assert all(10 <= reserve.integers(10, 12) < 12 for _ in range(100))
+    assert {reserve.integers(0, 1, endpoint=True) for _ in range(200)} == {0, 1}
+    assert reserve.integers(0, 1) == 0
+    assert reserve.integers(0, 101, size=4).shape == (4,)
+    with pytest.raises(ValueError):
+        reserve.integers(0)
+
+
+def test_binomial_choice():
+    reserve = ReserveAleatoire(np.random.default_rng(2))
+    tirages = [reserve.binomial(1, 0.3) for _ in range(20000)]
+    assert abs(sum(tirages) / len(tirages) - 0.3) < 0.02
+    assert reserve.binomial(1, 0) == 0
+    assert reserve.binomial(1, 1) == 1
+    choix = [reserve.choice([0, 1, 2, 3], p=[0.1, 0.2, 0.3, 0.4]) for _ in range(20000)]
+    assert abs(choix.count(3) / len(choix) - 0.4) < 0.02
+    assert reserve.choice(["a"]) == "a"
+    assert reserve.binomial(10, 0.5, size=3).shape == (3,)
+
+
+def test_delegation():
+    reserve = ReserveAleatoire(np.random.default_rng(4))
+    assert reserve.get_generateur() is not None
+    assert reserve.normal(size=2).shape == (2,)
+    with pytest.raises(AttributeError):
+        reserve._inexistant
+
+
+def test_exporter_restaurer():
+    reserve = ReserveAleatoire(np.random.default_rng(5), taille=10)
+    for _ in range(13):
+        reserve.random()
+    etat = reserve.exporterEtat()
+    assert len(etat["reserve"]) == 7
+    suite = [reserve.random() for _ in range(25)]
+    copie = ReserveAleatoire(np.random.default_rng(), taille=10)
+    copie.restaurerEtat(etat)
+    assert [copie.random() for _ in range(25)] == suite
@@ -0,0 +1,79 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.sauvegarde import *
+
+PARAMETRES = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+
+
+def etat(gameRules):
+    population = gameRules.get_population()
+    return (gameRules.get_grille().get_idsCases().copy(), gameRules.get_grille().get_envCases().copy(),
+            population.get_especes().copy(), population.get_ages().copy(), population.get_foods().copy(),
+            population.get_genes().copy(), population.getIdsUtilisables(), gameRules.get_generation())
+
+
+def egaux(a, b):
+    return all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def jeu():
+    GameRules.PARAMETERS = dict(PARAMETRES)
+    gameRules = GameRules(8)
+    gameRules.addOursAleatoire()
+    for _ in range(4):
+        gameRules.generation()
+    return gameRules
+
+
+@pytest.mark.parametrize("compresser", [True, False])
+def test_reprise_identique(tmp_path, compresser):
+    chemin = tmp_path / "sauvegarde.npz"
+    gameRules = jeu()
+    sauvegarder(gameRules, chemin, compresser=compresser)
+    for _ in range(6):
+        gameRules.generation()
+
+    GameRules.PARAMETERS = {}
+    reprise = charger(chemin)
+    assert GameRules.PARAMETERS == PARAMETRES
+    assert reprise.get_generation() == 4
+    reprise.checkInvariant()
+    for _ in range(6):
+        reprise.generation()
+    assert egaux(etat(gameRules), etat(reprise))
+    assert reprise.get_population().renard_ids() == gameRules.get_population().renard_ids()
+
+
+def test_export_restauration_en_memoire():
+    gameRules = jeu()
+    copie = gameRules.exporterEtat()
+    avant = etat(gameRules)
+    gameRules.generation()
+    gameRules.restaurerEtat(copie)
+    assert egaux(avant, etat(gameRules))
+    GameRules.PARAMETERS = dict(PARAMETRES, Taille=5)
+    with pytest.raises(ValueError):
+        GameRules().restaurerEtat(copie)
+
+
+def test_fichier_invalide(tmp_path):
+    chemin = tmp_path / "autre.npz"
+    np.savez(chemin, x=np.zeros(2))
+    with pytest.raises(ValueError):
+        lireEtat(chemin)
+    sauvegarder(jeu(), chemin)
+    with np.load(chemin) as fichier:
+        tableaux = dict(fichier)
+    tableaux["version"] = np.array(VERSION + 1)
+    np.savez(chemin, **tableaux)
+    with pytest.raises(ValueError):
+        lireEtat(chemin)
@@ -0,0 +1,71 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.serieTemporelle import *
+
+
+def remplir(serie, valeurs):
+    for point in valeurs:
+        serie.ajouter(point)
+
+
+def test_derniers_points_a_pleine_resolution():
+    serie = SerieTemporelle(3, capacite=16, facteur=2, nbNiveaux=3)
+    valeurs = np.random.default_rng(0).integers(0, 500, (40, 3))
+    remplir(serie, valeurs)
+    debuts, mins, maxs, moyennes = serie.fenetre(10)
+    assert debuts.tolist() == list(range(30, 40))
+    assert np.array_equal(mins, valeurs[30:]) and np.array_equal(maxs, valeurs[30:])
+    assert np.array_equal(moyennes, valeurs[30:])
+
+
+def test_agregats_des_niveaux():
+    serie = SerieTemporelle(2, capacite=8, facteur=4, nbNiveaux=2)
+    valeurs = np.random.default_rng(1).integers(0, 1000, (103, 2))
+    remplir(serie, valeurs)
+    # 20 points ne tiennent plus dans les 8 derniers points : seaux de 4 points, plus le seau en cours
+    debuts, mins, maxs, moyennes = serie.fenetre(20)
+    assert debuts[0] <= 83 and debuts[-1] == 100
+    for i, debut in enumerate(debuts):
+        points = valeurs[debut:min(debut + 4, 103)]
+        assert np.array_equal(mins[i], points.min(axis=0))
+        assert np.array_equal(maxs[i], points.max(axis=0))
+        assert np.allclose(moyennes[i], points.mean(axis=0))
+
+
+def test_tout_l_historique_en_memoire_bornee():
+    serie = SerieTemporelle(2, capacite=10, facteur=2, nbNiveaux=3)
+    for t in range(100000):
+        serie.ajouter((t, t % 7))
+    debuts, mins, maxs, moyennes = serie.fenetre()
+    assert serie.get_nbPoints() == 100000 and len(debuts) <= 10
+    # Le niveau global couvre tout l'historique
+    assert debuts[0] == 0 and mins[0, 0] == 0 and maxs[-1, 0] == 99999
+    assert mins[:, 1].min() == 0 and maxs[:, 1].max() == 6
+    pas = serie.get_pas()
+    assert np.allclose(moyennes[:-1, 0], debuts[:-1] + (pas - 1) / 2)
+
+
+def test_reinitialiser():
+    serie = SerieTemporelle(1, capacite=4, facteur=2, nbNiveaux=2)
+    remplir(serie, [(v,) for v in range(50)])
+    serie.reinitialiser()
+    assert serie.get_nbPoints() == 0 and serie.get_pas() == 1
+    assert len(serie.fenetre()[0]) == 0
+    remplir(serie, [(7,), (3,)])
+    assert serie.fenetre()[1][:, 0].tolist() == [7, 3]
+
+
+@pytest.mark.parametrize("parametres", [{"capacite": 7}, {"facteur": 1}, {"nbNiveaux": 0},
+                                        {"capacite": 8, "facteur": 4, "nbNiveaux": 3}])
+def test_parametres_invalides(parametres):
+    with pytest.raises(ValueError):
+        SerieTemporelle(2, **parametres)
@@ -0,0 +1,96 @@
+import sys
+import os
+import subprocess
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.simulationBatch import *
+
+PARAMETRES = {"Renards": 30, "Lapins": 60, "Ours": 2, "Taille": 15, "Apparition herbe (%)": 10}
+
+
+def test_simuler():
+    resultats = simuler(PARAMETRES, graine=4, nbGenerations=10, arretSiFini=False, ajoutsOurs=[0])
+    assert list(resultats.keys()) == colonnes()
+    assert resultats["generation"].tolist() == list(range(11))
+    assert resultats["renards"][0] == 30
+    assert resultats["lapins"][0] == 60
+    assert resultats["ours"][1] > 0
+    # Les fréquences des allèles d'une espèce présente somment à 1
+    for gene in Genes:
+        total = sum(resultats[f"Lapin_{gene}_{allele}"][0] for allele in ALLELES)
+        assert abs(total - 1) < 1e-9
+    # Les paramètres de classe sont restaurés
+    assert GameRules.PARAMETERS is not None and Animal.PARAMETERS is not None
+
+
+def test_simuler_reproductible():
+    resultats1 = simuler(PARAMETRES, graine=7, nbGenerations=5)
+    resultats2 = simuler(PARAMETRES, graine=7, nbGenerations=5)
+    assert all((resultats1[nom] == resultats2[nom]).all() for nom in colonnes())
+
+
+def test_lireParametres():
+    parametres, parametresAnimaux = lireParametres(["Taille=20", "ProbaBirthR=0.2"])
+    assert parametres == {"Taille": 20}
+    assert parametresAnimaux == {"ProbaBirthR": 0.2}
+    try:
+        lireParametres(["Inconnu=1"])
+        assert False
+    except ValueError as e: pass
+
+
+def test_ligne_de_commande(tmp_path):
+    sortie = tmp_path / "resultats.csv"
+    # La simulation tourne sans importer pygame
+    code = ("import sys; from source.simulationBatch import main; "
+            f"main(['--generations', '3', '--graine', '1', '--param', 'Taille=10', '--param', 'Renards=10', "
+            f"'--param', 'Lapins=10', '--continuer', '--sortie', r'{sortie}']); "
+            "assert 'pygame' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=parent_folder)
+    with open(sortie) as fichier:
+        lignes = fichier.read().splitlines()
+    assert lignes[0].split(",") == colonnes()
+    assert len(lignes) == 5
+
+
+def test_reprise(tmp_path):
+    chemin = str(tmp_path / "sauvegarde.npz")
+    complet = simuler(PARAMETRES, graine=6, nbGenerations=8, arretSiFini=False)
+    simuler(PARAMETRES, graine=6, nbGenerations=3, arretSiFini=False, sauvegarde=chemin)
+    suite = simuler(reprise=chemin, nbGenerations=5, arretSiFini=False)
+    assert suite["generation"].tolist() == list(range(3, 9))
+    for colonne in ("renards", "lapins", "ours", "herbe"):
+        assert suite[colonne].tolist() == complet[colonne][3:].tolist()
+
+
+def test_trajectoire(tmp_path):
+    from source.trajectoire import LecteurTrajectoire
+    chemin = str(tmp_path / "jeu.traj")
+    resultats = simuler(PARAMETRES, graine=2, nbGenerations=4, arretSiFini=False, trajectoire=chemin)
+    comptes = [lue[3] for lue in LecteurTrajectoire(chemin)]
+    assert [c[:3] for c in comptes] == list(zip(resultats["renards"].tolist(), resultats["lapins"].tolist(),
+                                                 resultats["ours"].tolist()))
+    assert [c[3] for c in comptes] == resultats["herbe"].tolist()
+
+
+def test_grille_creuse():
+    resultats = simuler(PARAMETRES | {"Taille": 3000}, graine=2, nbGenerations=3, arretSiFini=False, creuse=True)
+    assert resultats["renards"][0] == 30 and resultats["lapins"][0] == 60
+    # Herbe initiale tirée case par case avec la densité 10 % (espérance sur les tuiles non allouées)
+    assert abs(resultats["herbe"][0] / 3000 ** 2 - 0.1) < 0.01
+    with pytest.raises(ValueError):
+        simuler(PARAMETRES, nbGenerations=3, creuse=True, sauvegarde="jamais_ecrite.npz")
+    assert not os.path.exists("jamais_ecrite.npz")
+
+
+def test_generation_parallele():
+    parametres = {"Taille": 30, "Lapins": 200, "Renards": 60, "Ours": 0}
+    resultats = simuler(parametres, graine=2, nbGenerations=5, parallele=2)
+    assert len(resultats["generation"]) == 6
+    assert np.array_equal(resultats["lapins"], simuler(parametres, graine=2, nbGenerations=5, parallele=1)["lapins"])
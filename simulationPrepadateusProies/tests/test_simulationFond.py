@@ -0,0 +1,97 @@
+import sys
+import os
+import time
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.simulationFond import *
+from source.gameRules import GameRules
+from source.sauvegarde import charger
+
+PARAMETRES = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+
+
+def jeu():
+    GameRules.PARAMETERS = dict(PARAMETRES)
+    return GameRules(3)
+
+
+def attendre(simulation, condition, delai=10):
+    """Lit les instantanés jusqu'à ce que [condition(instantanes lus)] soit vraie."""
+    lus = []
+    fin = time.monotonic() + delai
+    while not condition(lus):
+        assert time.monotonic() < fin
+        lus += simulation.instantanes()
+        time.sleep(0.001)
+    return lus
+
+
+def test_instantanes_dans_l_ordre_et_identiques_a_la_simulation():
+    simulation = SimulationEnFond(jeu(), tailleFile=2)
+    simulation.demarrer()
+    lus = attendre(simulation, lambda lus: len(lus) >= 6)
+    simulation.arreter()
+    assert [i.get_generation() for i in lus] == list(range(len(lus)))
+
+    reference = jeu()
+    for instantane in lus[:6]:
+        assert np.array_equal(instantane.get_especes(), reference.grilleEspeces())
+        assert np.array_equal(instantane.get_environnements(), reference.get_grille().get_grilleEnvironnements())
+        assert instantane.get_effectifs() == tuple(reference.get_population().effectifs().tolist())
+        reference.generation()
+
+
+def test_instantane_en_lecture_seule():
+    instantane = Instantane(jeu())
+    with pytest.raises(ValueError):
+        instantane.get_especes()[0, 0] = 1
+    with pytest.raises(ValueError):
+        instantane.get_environnements()[0, 0] = 1
+    assert set(instantane.get_alleles()) == {"Renard", "Lapin"}
+
+
+def test_commandes(tmp_path):
+    gameRules = jeu()
+    simulation = SimulationEnFond(gameRules)
+    simulation.pause()
+    simulation.demarrer()
+    lus = attendre(simulation, lambda lus: len(lus) >= 1)
+    time.sleep(0.05)
+    # En pause : aucune génération
+    assert simulation.estEnPause() and lus[-1].get_generation() == 0 and simulation.instantanes() == []
+    simulation.ajouterOurs()
+    # L'ours ajouté en pause est publié sans attendre la reprise
+    lus = attendre(simulation, lambda lus: len(lus) >= 1)
+    assert lus[0].get_generation() == 0 and lus[0].get_effectifs()[2] > 0
+    simulation.sauvegarder(str(tmp_path / "sauvegarde.npz"))
+    simulation.reprendre()
+    lus = attendre(simulation, lambda lus: len(lus) >= 1)
+    assert lus[0].get_generation() == 1 and lus[0].get_effectifs()[2] > 0
+    simulation.arreter()
+    assert charger(str(tmp_path / "sauvegarde.npz"), appliquerParametres=False).get_generation() == 0
+
+
+def test_vitesse_limitee():
+    simulation = SimulationEnFond(jeu(), generationsParSeconde=20)
+    simulation.demarrer()
+    time.sleep(0.3)
+    simulation.arreter()
+    assert len(simulation.instantanes()) <= 9
+
+
+def test_erreur_relancee(tmp_path):
+    gameRules = jeu()
+    simulation = SimulationEnFond(gameRules)
+    simulation.sauvegarder(str(tmp_path / "dossier_inexistant" / "sauvegarde.npz"))
+    simulation.demarrer()
+    with pytest.raises(OSError):
+        attendre(simulation, lambda lus: False)
+    with pytest.raises(OSError):
+        simulation.arreter()
@@ -0,0 +1,126 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.trajectoire import *
+from source.gameRules import GameRules
+
+PARAMETRES = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+
+
+def jeu():
+    GameRules.PARAMETERS = dict(PARAMETRES)
+    gameRules = GameRules(4)
+    gameRules.addOursAleatoire()
+    return gameRules
+
+
+def test_encoder_decoder():
+    especes = np.array([[0, 1], [2, 3]])
+    environnements = np.array([[1, 2], [3, 1]])
+    especesLues, environnementsLus = decoderImage(encoderImage(especes, environnements))
+    assert np.array_equal(especesLues, especes)
+    assert np.array_equal(environnementsLus, environnements)
+
+
+def test_grille_especes():
+    gameRules = jeu()
+    especes = gameRules.grilleEspeces()
+    assert especes.shape == (12, 12)
+    assert np.array_equal(np.bincount(especes.ravel(), minlength=4)[1:], gameRules.get_population().effectifs())
+
+
+def test_enregistrer_relire(tmp_path):
+    chemin = tmp_path / "jeu.traj"
+    gameRules = jeu()
+    attendues = []
+
+    def copier(gameRules):
+        attendues.append((gameRules.get_generation(), gameRules.grilleEspeces(),
+                          gameRules.get_grille().get_grilleEnvironnements().copy()))
+
+    copier(gameRules)
+    with EnregistreurTrajectoire(chemin, intervalleCles=3) as enregistreur:
+        enregistreur.attacher(gameRules)
+        gameRules.ajouterObservateur(copier)
+        for _ in range(10):
+            gameRules.generation()
+        enregistreur.detacher(gameRules)
+        gameRules.generation()
+    lecteur = LecteurTrajectoire(chemin)
+    assert lecteur.get_TAILLE() == 12 and lecteur.get_intervalleCles() == 3
+    lues = list(lecteur)
+    assert len(lues) == 11
+    for (generation, especes, environnements, comptes), attendue in zip(lues, attendues):
+        assert generation == attendue[0]
+        assert np.array_equal(especes, attendue[1])
+        assert np.array_equal(environnements, attendue[2])
+        assert comptes[:3] == tuple(np.bincount(especes.ravel(), minlength=4)[1:])
+        assert comptes[3] == np.count_nonzero(environnements == 2)
+
+
+def enregistrerJeu(chemin, nbGenerations, intervalleCles=4):
+    gameRules = jeu()
+    with EnregistreurTrajectoire(chemin, intervalleCles=intervalleCles) as enregistreur:
+        enregistreur.attacher(gameRules)
+        for _ in range(nbGenerations):
+            gameRules.generation()
+
+
+def test_acces_direct(tmp_path):
+    chemin = tmp_path / "jeu.traj"
+    enregistrerJeu(chemin, 20)
+    lecteur = LecteurTrajectoire(chemin)
+    dansLOrdre = list(lecteur)
+    assert len(lecteur) == 21
+    assert lecteur.get_generations().tolist() == list(range(21))
+    assert lecteur.get_comptes().shape == (21, 4)
+    for generation in (17, 3, 4, 20, 0, 9, 10):
+        lue = LecteurTrajectoire(chemin).lire(generation) if generation == 9 else lecteur.lire(generation)
+        attendue = dansLOrdre[generation]
+        assert lue[0] == generation and lue[3] == attendue[3]
+        assert np.array_equal(lue[1], attendue[1]) and np.array_equal(lue[2], attendue[2])
+    assert lecteur.indice(1000) == 20
+    with pytest.raises(IndexError):
+        lecteur.lireIndice(21)
+
+
+def test_fichier_interrompu(tmp_path):
+    chemin = tmp_path / "jeu.traj"
+    enregistrerJeu(chemin, 5)
+    complet = list(LecteurTrajectoire(chemin))
+    donnees = chemin.read_bytes()
+    chemin.write_bytes(donnees[:len(donnees) // 2])
+    lecteur = LecteurTrajectoire(chemin)
+    assert 0 < len(lecteur) < 6
+    lues = list(lecteur)
+    assert [lue[0] for lue in lues] == list(range(len(lues)))
+    assert all(np.array_equal(lue[1], attendue[1]) for lue, attendue in zip(lues, complet))
+
+
+def test_erreurs(tmp_path):
+    with pytest.raises(ValueError):
+        EnregistreurTrajectoire(tmp_path / "a.traj", intervalleCles=0)
+    chemin = tmp_path / "autre.traj"
+    chemin.write_bytes(b"pas une trajectoire")
+    with pytest.raises(ValueError):
+        LecteurTrajectoire(chemin)
+    # Un fichier de la version 1 (index de fin au format précédent) est refusé
+    ancien = tmp_path / "ancien.traj"
+    enregistrerJeu(ancien, 3)
+    donnees = bytearray(ancien.read_bytes())
+    donnees[:ENTETE.size] = ENTETE.pack(MAGIC, 1, *ENTETE.unpack_from(donnees)[2:])
+    ancien.write_bytes(bytes(donnees))
+    with pytest.raises(ValueError):
+        LecteurTrajectoire(ancien)
+    enregistreur = EnregistreurTrajectoire(tmp_path / "b.traj")
+    enregistreur.fermer()
+    with pytest.raises(ValueError):
+        enregistreur.enregistrer(jeu())
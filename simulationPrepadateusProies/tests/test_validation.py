@@ -0,0 +1,105 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Gérer les caractères spéciaux
+parent_folder = os.getcwd().encode('utf-8').decode('utf-8')
+
+# Ajouter ce chemin au sys.path
+sys.path.insert(0, parent_folder)
+
+from source.validation import *
+from source.gameRules import GameRules
+from source.grille import Grille
+
+PARAMETRES = {"Renards": 20, "Lapins": 40, "Ours": 2, "Taille": 12, "Apparition herbe (%)": 10}
+
+
+def jeu(graine=1):
+    GameRules.PARAMETERS = dict(PARAMETRES)
+    gameRules = GameRules(graine)
+    gameRules.addOursAleatoire()
+    return gameRules
+
+
+def test_niveaux_sur_jeu_coherent():
+    gameRules = jeu()
+    for niveau in NiveauValidation:
+        gameRules.set_validation(niveau)
+        for _ in range(3):
+            gameRules.generation()
+            gameRules.valider()
+    gameRules.checkInvariant()
+
+
+def test_set_validation():
+    gameRules = jeu()
+    gameRules.set_validation(3, periode=5)
+    assert gameRules.get_niveauValidation() == NiveauValidation.COMPLETE
+    with pytest.raises(ValueError):
+        gameRules.set_validation(NiveauValidation.COMPLETE, periode=0)
+
+
+def test_complet_detecte_animal_deplace():
+    gameRules = jeu()
+    ids = gameRules.get_grille().get_grilleIds()
+    x, y = np.argwhere(ids >= 0)[0]
+    vides = np.argwhere(ids == -1)[0]
+    ids[vides[0], vides[1]] = ids[x, y]
+    ids[x, y] = -1
+    with pytest.raises(AssertionError):
+        gameRules.checkInvariant()
+    # Tout l'échantillon porte sur la grille : la case déplacée est forcément vue
+    with pytest.raises(AssertionError):
+        verifierEchantillon(gameRules.get_grille(), gameRules.get_population(), 10000, np.random.default_rng(0))
+
+
+def test_complet_detecte_identifiant_libre_sur_la_grille():
+    gameRules = jeu()
+    population = gameRules.get_population()
+    population.deleteAnimal(population.getAnimal(population.renard_ids()[0]))
+    verifierCompteurs(gameRules.get_grille(), population)
+    with pytest.raises(AssertionError):
+        verifierComplet(gameRules.get_grille(), population)
+
+
+def test_complet_detecte_bordure_modifiee():
+    gameRules = jeu()
+    gameRules.get_grille().get_idsCases()[0] = -1
+    with pytest.raises(AssertionError):
+        gameRules.checkInvariant()
+    gameRules.get_grille().get_idsCases()[0] = Grille.BORD
+    gameRules.checkInvariant()
+
+
+def test_periode():
+    gameRules = jeu()
+    gameRules.set_validation(NiveauValidation.COMPLETE, periode=2)
+    gameRules.generation()
+    gameRules.get_grille().get_idsCases()[0] = -1
+    # Génération 1 : seuls les compteurs sont vérifiés
+    gameRules.valider()
+    gameRules.generation()
+    with pytest.raises(AssertionError):
+        gameRules.valider()
+
+
+def test_echantillon_ne_modifie_pas_la_simulation():
+    resultats = []
+    for niveau in (NiveauValidation.AUCUNE, NiveauValidation.ECHANTILLON):
+        gameRules = jeu(graine=5)
+        gameRules.set_validation(niveau)
+        for _ in range(5):
+            gameRules.generation()
+            gameRules.valider()
+        resultats.append(gameRules.get_grille().get_grilleIds().copy())
+    assert np.array_equal(resultats[0], resultats[1])
+
+
+def test_complet_detecte_compteurs_alleles_incoherents():
+    gameRules = jeu()
+    population = gameRules.get_population()
+    population.get_genes()[population.lapin_ids()[0], 0] += 1
+    with pytest.raises(AssertionError):
+        gameRules.checkInvariant()